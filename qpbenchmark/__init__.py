@@ -6,29 +6,73 @@
 
 """Benchmark for quadratic programming solvers available in Python."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
 from .exceptions import BenchmarkError, ProblemNotFound, ResultsError
-from .parquet_test_set import ParquetTestSet
-from .problem import Problem
-from .problem_list import ProblemList
-from .report import Report
-from .results import Results
 from .run import run
+from .sequence_test_set import SequenceTestSet
 from .spdlog import logging
 from .test_set import TestSet
 from .tolerance import Tolerance
 from .version import get_version
 
+if TYPE_CHECKING:
+    from .parquet_test_set import ParquetTestSet
+    from .problem import Problem
+    from .problem_info import ProblemInfo
+    from .problem_list import ProblemList, ProblemListWriter
+    from .report import Report
+    from .results import Results
+
 __version__ = get_version()
 
+# Heavier submodules are imported upon first access, so that importing the
+# package does not import pandas, qpsolvers and all installed solver backends
+__lazy_imports: Dict[str, str] = {
+    "ParquetTestSet": ".parquet_test_set",
+    "Problem": ".problem",
+    "ProblemInfo": ".problem_info",
+    "ProblemList": ".problem_list",
+    "ProblemListWriter": ".problem_list",
+    "Report": ".report",
+    "Results": ".results",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public classes and functions upon first access.
+
+    Args:
+        name: Name of the attribute.
+
+    Returns:
+        Value of the attribute.
+    """
+    if name not in __lazy_imports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(__lazy_imports[name], __name__), name)
+    globals()[name] = value  # next accesses skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes, including those not imported yet."""
+    return sorted(set(globals()) | set(__lazy_imports))
+
+
 __all__ = [
     "BenchmarkError",
     "ParquetTestSet",
     "Problem",
+    "ProblemInfo",
     "ProblemList",
+    "ProblemListWriter",
     "ProblemNotFound",
     "Report",
     "Results",
     "ResultsError",
+    "SequenceTestSet",
     "TestSet",
     "Tolerance",
     "logging",
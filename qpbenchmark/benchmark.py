@@ -14,18 +14,40 @@ import os
 import sys
 from importlib import import_module  # type: ignore
 from pathlib import Path
-from typing import Optional, Union
-
-import qpsolvers
+from typing import TYPE_CHECKING, Optional, Tuple, Union
 
 from .exceptions import BenchmarkError
-from .plot_metric import plot_metric
-from .report import Report
-from .results import Results
 from .run import run
+from .sequence_test_set import SequenceTestSet
 from .spdlog import logging
 from .test_set import TestSet
 
+if TYPE_CHECKING:
+    from .results import Results
+
+# Commands that load results from the results file
+RESULTS_COMMANDS = ("check_results", "merge", "plot", "report", "run")
+
+
+def parse_shard_argument(value: str) -> Tuple[int, int]:
+    """Parse the shard command-line argument.
+
+    Args:
+        value: Shard specification "i/N".
+
+    Returns:
+        Pair ``(index, count)`` of shard index and number of shards.
+
+    Raises:
+        argparse.ArgumentTypeError: if the specification is invalid.
+    """
+    from .sharding import parse_shard
+
+    try:
+        return parse_shard(value)
+    except ValueError as exn:
+        raise argparse.ArgumentTypeError(str(exn)) from exn
+
 
 def parse_command_line_arguments(
     test_set_path: Optional[Union[Path, str]] = None,
@@ -89,6 +111,17 @@ def parse_command_line_arguments(
         help="list all problems contained in the test set",
     )
 
+    # merge
+    parser_merge = subparsers.add_parser(
+        "merge",
+        help="merge results files, e.g. from shards, into the results file",
+    )
+    parser_merge.add_argument(
+        "paths",
+        help="paths to the results files to merge",
+        nargs="+",
+    )
+
     # plot
     parser_plot = subparsers.add_parser(
         "plot",
@@ -122,6 +155,44 @@ def parse_command_line_arguments(
         help='plot title (set to "" to disable)',
     )
 
+    # profile
+    parser_profile = subparsers.add_parser(
+        "profile",
+        help="profile a solver on a given problem",
+    )
+    parser_profile.add_argument(
+        "--calls",
+        default=1,
+        type=int,
+        help="number of solver calls to profile (default: 1)",
+    )
+    parser_profile.add_argument(
+        "--interval",
+        default=1e-3,
+        type=float,
+        help="time between two stack samples in seconds (default: 1e-3)",
+    )
+    parser_profile.add_argument(
+        "--output",
+        help="path prefix of the pstats and collapsed-stack output files "
+        '(default: "{problem}.{solver}.{settings}")',
+    )
+    parser_profile.add_argument(
+        "--problem",
+        required=True,
+        help="name of the problem in the test set",
+    )
+    parser_profile.add_argument(
+        "--settings",
+        default="default",
+        help="solver settings to profile with (default: default)",
+    )
+    parser_profile.add_argument(
+        "--solver",
+        required=True,
+        help="solver to profile",
+    )
+
     # report
     parser_report = subparsers.add_parser(
         "report",
@@ -137,6 +208,26 @@ def parse_command_line_arguments(
         "run",
         help="run all tests from the test set",
     )
+    parser_run.add_argument(
+        "--isolate",
+        default=False,
+        action="store_true",
+        help="solve each instance in a child process killed at the time limit",
+    )
+    parser_run.add_argument(
+        "-j",
+        "--jobs",
+        default=1,
+        type=int,
+        help="number of worker processes, each pinned to its own CPU core "
+        "(default: 1, i.e. solve instances sequentially for timing accuracy)",
+    )
+    parser_run.add_argument(
+        "--prefetch",
+        default=0,
+        type=int,
+        help="number of problems to load ahead of time while solvers run",
+    )
     parser_run.add_argument(
         "--problem",
         help="limit run to a specific problem",
@@ -160,13 +251,74 @@ def parse_command_line_arguments(
     parser_run.add_argument(
         "--solver",
         help="limit run to a specific solver",
-        choices=qpsolvers.available_solvers,
+    )
+    parser_run.add_argument(
+        "--shard",
+        type=parse_shard_argument,
+        help='only run the i-th of N shards of the test set, e.g. "0/4"',
+    )
+    parser_run.add_argument(
+        "--strict-timing",
+        default=False,
+        action="store_true",
+        help="pause prefetching while solver calls are timed",
+    )
+    parser_run.add_argument(
+        "--target-rel-ci",
+        type=float,
+        help="stop timing an instance once the relative width of the "
+        "confidence interval on its median runtime is below this value",
+    )
+    parser_run.add_argument(
+        "--timings",
+        default=1,
+        type=int,
+        help="maximum number of timed solver calls per instance "
+        "(runtime is then their median)",
+    )
+    parser_run.add_argument(
+        "--warmups",
+        default=0,
+        type=int,
+        help="number of untimed solver calls before timed ones",
+    )
+    parser_run.add_argument(
+        "--work-queue",
+        help="directory shared by runs, possibly on different machines, "
+        "where each problem is claimed by the first run to reach it",
     )
     parser_run.add_argument(
         "--author",
         help="author field in the post-run report",
     )
 
+    # throughput
+    parser_throughput = subparsers.add_parser(
+        "throughput",
+        help="measure solver throughput on the sequences of a test set",
+    )
+    parser_throughput.add_argument(
+        "--cold",
+        default=False,
+        action="store_true",
+        help="solve each problem from scratch rather than warm-starting it "
+        "from the solution to the previous problem in its sequence",
+    )
+    parser_throughput.add_argument(
+        "--output",
+        help="path to the CSV file to save measurements to (default: "
+        '"{test_set}.{settings}.{warm,cold}.throughput.csv")',
+    )
+    parser_throughput.add_argument(
+        "--settings",
+        default="default",
+        help="solver settings to measure throughput with (default: default)",
+    )
+    parser_throughput.add_argument(
+        "--solver",
+        help="limit measurements to a specific solver",
+    )
+
     args = parser.parse_args()
     if "settings" in args and args.settings is not None:
         args.settings = args.settings.lower()
@@ -175,6 +327,19 @@ def parse_command_line_arguments(
     if "solvers" in args and args.solvers is not None:
         lowercase_solvers = [name.lower() for name in args.solvers]
         args.solvers = lowercase_solvers
+    solver_subparsers = {
+        "profile": parser_profile,
+        "run": parser_run,
+        "throughput": parser_throughput,
+    }
+    if args.command in solver_subparsers and args.solver is not None:
+        import qpsolvers  # imports all installed solver backends
+
+        if args.solver not in qpsolvers.available_solvers:
+            solver_subparsers[args.command].error(
+                f"argument --solver: invalid choice: '{args.solver}' "
+                f"(choose from {', '.join(qpsolvers.available_solvers)})"
+            )
     return args
 
 
@@ -199,7 +364,7 @@ def load_test_set(path: str) -> TestSet:
     return TestClass()
 
 
-def report(args, results: Results, test_set_path: Union[Path, str]):
+def report(args, results: "Results", test_set_path: Union[Path, str]):
     """Write report to file.
 
     Args:
@@ -207,6 +372,8 @@ def report(args, results: Results, test_set_path: Union[Path, str]):
         results: Benchmark results.
         test_set_path: Path to the test set Python source.
     """
+    from .report import Report
+
     logging.info("Writing the overall report...")
     author = (
         args.author
@@ -246,7 +413,16 @@ def main(
     if args.very_verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     test_set = load_test_set(os.path.abspath(test_set_path))
-    results = Results(results_path or args.results_path, test_set)
+    if args.command in RESULTS_COMMANDS:
+        from .results import Results
+
+        is_run = args.command == "run"  # other commands use all results
+        results = Results(
+            results_path or args.results_path,
+            test_set,
+            solvers=[args.solver] if is_run and args.solver else None,
+            settings=[args.settings] if is_run and args.settings else None,
+        )
 
     if args.command == "run":
         run(
@@ -258,6 +434,15 @@ def main(
             rerun=args.rerun,
             rerun_timeouts=args.rerun_timeouts,
             verbose=args.verbose,
+            jobs=args.jobs,
+            isolate=args.isolate,
+            nb_warmups=args.warmups,
+            nb_timings=args.timings,
+            target_rel_ci=args.target_rel_ci,
+            prefetch=args.prefetch,
+            strict_timing=args.strict_timing,
+            shard=args.shard,
+            work_queue=args.work_queue,
         )
 
     if args.command == "check_problem":
@@ -271,7 +456,7 @@ def main(
             "Listing problems from the %s test set to the standard output",
             test_set_name,
         )
-        print("\n".join(problem.name for problem in test_set))
+        print("\n".join(info.name for info in test_set.manifest()))
 
     if args.command == "check_results":
         logging.info("Check out `results` for the full results data")
@@ -290,7 +475,91 @@ def main(
                 "IPython not found, run this script in interactive mode"
             )
 
+    if args.command == "merge":
+        from .run_metadata import merge_run_metadata
+
+        if results.file_path is None or results.metadata_path is None:
+            raise BenchmarkError("no results file to merge results into")
+        results.merge(args.paths)
+        results.write()
+        merge_run_metadata(
+            results.metadata_path,
+            [f"{path}.metadata.json" for path in args.paths],
+        )
+        logging.info(
+            "Merged %d results files into '%s'",
+            len(args.paths),
+            results.file_path,
+        )
+
+    if args.command == "profile":
+        from .profiling import profile_instance
+
+        if args.settings not in test_set.solver_settings:
+            raise BenchmarkError(
+                f"settings '{args.settings}' not in the list of settings "
+                f"for this test set: {list(test_set.solver_settings.keys())}"
+            )
+        problem = test_set.get_problem(args.problem)
+        assert problem is not None  # or get_problem raises ProblemNotFound
+        output_prefix = (
+            args.output or f"{args.problem}.{args.solver}.{args.settings}"
+        )
+        split = profile_instance(
+            problem,
+            args.solver,
+            test_set.solver_settings[args.settings][args.solver],
+            output_prefix,
+            nb_calls=args.calls,
+            interval=args.interval,
+        )
+        logging.info(
+            "Profiled %s by %s with %s settings: %.3g s in total, "
+            "%.3g s (%.0f%%) in the qpsolvers wrapper, "
+            "%.3g s (%.0f%%) in the solver",
+            args.problem,
+            args.solver,
+            args.settings,
+            split["total"],
+            split["wrapper"],
+            100.0 * split["wrapper"] / split["total"],
+            split["native"],
+            100.0 * split["native"] / split["total"],
+        )
+        logging.info(
+            "Wrote profile statistics to '%s.pstats' and sampled stacks "
+            "to '%s.collapsed'",
+            output_prefix,
+            output_prefix,
+        )
+
+    if args.command == "throughput":
+        from .throughput import measure_throughput
+
+        if not isinstance(test_set, SequenceTestSet):
+            raise BenchmarkError(
+                f"test set {test_set.__class__.__name__} has no sequences, "
+                "it should derive from SequenceTestSet"
+            )
+        throughput_df = measure_throughput(
+            test_set,
+            args.settings,
+            solvers=[args.solver] if args.solver else None,
+            warm_start=not args.cold,
+        )
+        print(throughput_df.to_markdown(index=False, floatfmt=".3g"))
+        test_set_name = Path(test_set_path).name.replace(".py", "")
+        start_mode = "cold" if args.cold else "warm"
+        output_path = (
+            args.output
+            or f"{test_set_name}.{args.settings}.{start_mode}.throughput.csv"
+        )
+        throughput_df.to_csv(output_path, index=False)
+        logging.info("Wrote throughput measurements to '%s'", output_path)
+
     if args.command == "plot":
+        from .plot_metric import plot_metric
+
         plot_metric(
             args.metric,
             results.df,
@@ -303,6 +572,9 @@ def main(
         )
 
     if args.command in ["report", "run"]:
+        if is_run and (args.solver or args.settings):
+            # Results of the run were filtered, report on all of them
+            results = Results(results.file_path, test_set)
         report(args, results, test_set_path)
 
 
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Expected cost of benchmark instances, to schedule them and estimate ETAs."""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas
+
+from .problem_info import ProblemInfo
+
+
+def get_problem_size(info: ProblemInfo) -> float:
+    """Get the size feature of a problem used to predict runtimes.
+
+    Args:
+        info: Metadata of the problem.
+
+    Returns:
+        Sum of the number of variables, constraints and nonzero coefficients
+        of the problem, at least one.
+    """
+    return float(max(info.n + info.m_eq + info.m_ineq + info.nnz, 1))
+
+
+class CostModel:
+    r"""Expected runtimes of instances, from results and problem sizes.
+
+    Instances that already have a result are expected to take the same time
+    again. Runtimes of other instances are predicted by a power law
+    :math:`t = c s^k` of the problem size :math:`s`, fitted on the results of
+    the same solver and settings, or of the same solver, or of all solvers,
+    whichever has data.
+
+    Attributes:
+        DEFAULT_FIT: Coefficients :math:`(\log c, k)` used when there are no
+            results to fit, which gives a cost proportional to problem size.
+        sizes: Size feature of each problem.
+    """
+
+    DEFAULT_FIT: Tuple[float, float] = (np.log(1e-6), 1.0)
+
+    sizes: Dict[str, float]
+
+    @staticmethod
+    def fit_power_law(
+        log_sizes: np.ndarray, log_runtimes: np.ndarray
+    ) -> Tuple[float, float]:
+        r"""Fit a power law to runtimes in log-log space.
+
+        Args:
+            log_sizes: Logarithms of problem sizes.
+            log_runtimes: Logarithms of the corresponding runtimes.
+
+        Returns:
+            Coefficients :math:`(\log c, k)` of the power law. The exponent
+            is kept within :math:`[0, 3]` and defaults to one when sizes do not
+            vary enough to estimate it.
+        """
+        if np.ptp(log_sizes) > 1e-6:
+            k, log_c = np.polyfit(log_sizes, log_runtimes, 1)
+            k = float(np.clip(k, 0.0, 3.0))
+        else:  # a single size, assume linear complexity
+            k = 1.0
+        log_c = float(np.mean(log_runtimes - k * log_sizes))
+        return log_c, k
+
+    def __init__(self, manifest: List[ProblemInfo], df: pandas.DataFrame):
+        """Fit cost model.
+
+        Args:
+            manifest: Metadata of the problems in the test set.
+            df: Results data frame.
+        """
+        self.sizes = {info.name: get_problem_size(info) for info in manifest}
+        self.__fits: Dict[Tuple[str, ...], Tuple[float, float]] = {}
+        self.__runtimes: Dict[Tuple[str, str, str], float] = {}
+
+        # Runtimes of zero are failures recorded without calling the solver
+        df = df[df["runtime"] > 0.0]
+        df = df.assign(size=df["problem"].astype(str).map(self.sizes)).dropna(
+            subset=["size"]
+        )
+        self.__runtimes = dict(
+            zip(
+                zip(df["problem"], df["solver"], df["settings"]),
+                df["runtime"].astype(float),
+            )
+        )
+        if df.empty:
+            return
+        log_sizes = np.log(df["size"].to_numpy(dtype=float))
+        log_runtimes = np.log(df["runtime"].to_numpy(dtype=float))
+        self.__fits[()] = self.fit_power_law(log_sizes, log_runtimes)
+        for by in (["solver"], ["solver", "settings"]):
+            for key, indices in df.groupby(by, observed=True).indices.items():
+                key = key if isinstance(key, tuple) else (key,)
+                self.__fits[key] = self.fit_power_law(
+                    log_sizes[indices], log_runtimes[indices]
+                )
+
+    def predict(
+        self,
+        problem: str,
+        solver: str,
+        settings: str,
+        time_limit: Optional[float] = None,
+    ) -> float:
+        """Predict the runtime of an instance.
+
+        Args:
+            problem: Name of the problem.
+            solver: Name of the QP solver.
+            settings: Name of the solver settings.
+            time_limit: If set, upper bound on predicted runtimes.
+
+        Returns:
+            Expected runtime of the instance, in seconds.
+        """
+        runtime = self.__runtimes.get((problem, solver, settings))
+        if runtime is None:
+            log_c, k = next(
+                (
+                    self.__fits[key]
+                    for key in ((solver, settings), (solver,), ())
+                    if key in self.__fits
+                ),
+                self.DEFAULT_FIT,
+            )
+            size = self.sizes.get(problem, 1.0)
+            runtime = float(np.exp(log_c + k * np.log(size)))
+        if time_limit is not None:
+            runtime = min(runtime, time_limit)
+        return runtime
@@ -6,19 +6,121 @@
 
 """Test set read from a Parquet file."""
 
+import hashlib
+import json
+from dataclasses import asdict
 from pathlib import Path
-from typing import Iterator, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
 
 import numpy as np
-import pandas
+import pyarrow
+import pyarrow.compute
+import pyarrow.parquet
+import scipy.sparse as spa
 
-from .problem import Problem
+from .problem_info import ProblemInfo
 from .problem_list import ProblemList
+from .spdlog import logging
 from .test_set import TestSet
 
+if TYPE_CHECKING:  # qpsolvers is only imported once problems are built
+    from .problem import Problem
+
+
+def get_file_hash(path: Path) -> str:
+    """Compute the SHA-256 hash of a file.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Hexadecimal digest of the file contents.
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def get_list_lengths(column: pyarrow.ChunkedArray) -> np.ndarray:
+    """Get the length of each list in a column, zero for null entries.
+
+    Args:
+        column: Column of lists.
+
+    Returns:
+        Length of each list in the column.
+    """
+    if pyarrow.types.is_null(column.type):  # all entries are null
+        return np.zeros(len(column), dtype=int)
+    lengths = pyarrow.compute.list_value_length(column)
+    return lengths.fill_null(0).to_numpy()
+
+
+def get_list_views(column: pyarrow.Array) -> List[Optional[np.ndarray]]:
+    """Get NumPy views on each list of a column, None for null entries.
+
+    Args:
+        column: Column of lists of numbers.
+
+    Returns:
+        NumPy array for each list of the column. Arrays are read-only views on
+        Arrow buffers whenever the data layout allows it, which is the case
+        for lists of floating-point numbers without nulls.
+    """
+    if pyarrow.types.is_null(column.type):  # all entries are null
+        return [None] * len(column)
+    try:
+        values = column.values.to_numpy(zero_copy_only=True)
+    except pyarrow.ArrowInvalid:  # data layout requires a copy
+        values = column.values.to_numpy(zero_copy_only=False)
+    offsets = column.offsets.to_numpy()
+    is_null = column.is_null().to_numpy(zero_copy_only=False)
+    return [
+        None if is_null[i] else values[offsets[i] : offsets[i + 1]]
+        for i in range(len(column))
+    ]
+
+
+def count_list_nonzeros(column: pyarrow.ChunkedArray) -> np.ndarray:
+    """Count nonzero values in each list of a column, zero for null entries.
+
+    Args:
+        column: Column of lists of numbers.
+
+    Returns:
+        Number of nonzero values in each list of the column.
+    """
+    if pyarrow.types.is_null(column.type):  # all entries are null
+        return np.zeros(len(column), dtype=int)
+    counts = []
+    for chunk in column.chunks:
+        values = chunk.values.to_numpy(zero_copy_only=False)
+        offsets = chunk.offsets.to_numpy()
+        cumsum = np.concatenate([[0], np.cumsum(values != 0.0)])
+        counts.append(cumsum[offsets[1:]] - cumsum[offsets[:-1]])
+    if not counts:
+        return np.zeros(0, dtype=int)
+    return np.concatenate(counts)
+
 
 class ParquetTestSet(TestSet):
-    """Test set read from a Parquet file."""
+    """Test set read from a Parquet file.
+
+    Problems are streamed from the file one record batch at a time, so that
+    memory usage stays bounded by the size of a row group. Problem arrays are
+    read-only views on Arrow buffers: they are only copied for solvers that
+    require writable inputs, right before calling them. Matrices stored in
+    CSC format are read back as sparse matrices without densifying them.
+
+    Attributes:
+        manifest_path: Path to the cached manifest of the test set.
+        path: Path to the Parquet file.
+    """
+
+    manifest_path: Path
+    path: Path
 
     def __init__(self, path: Union[Path, str]):
         """Initialize test set.
@@ -27,21 +129,155 @@ class ParquetTestSet(TestSet):
             path: Path to Parquet file to read problems from.
         """
         super().__init__()
-        self.__df = pandas.read_parquet(path, engine="pyarrow")
+        self.__manifest: Optional[List[ProblemInfo]] = None
+        self.manifest_path = Path(path).with_suffix(".manifest.json")
+        self.path = Path(path)
 
-    def __iter__(self) -> Iterator[Problem]:
+    def __iter__(self) -> Iterator["Problem"]:
         """Yield test-set problems one by one."""
-        for _, row in self.__df.iterrows():
-            n = row["q"].size
-            pb_data = {}
-            for key in ProblemList.KEYS:
-                if isinstance(row[key], np.ndarray):
-                    # Make a copy as DAQP doesn't support read-only inputs
-                    # TODO(scaron): check separately and report an issue
-                    pb_data[key] = row[key].copy()
-                    if key in ("P", "G", "A"):
-                        m = pb_data[key].size // n
-                        pb_data[key] = pb_data[key].reshape((m, n))
-                else:  # string or None
-                    pb_data[key] = row[key]
-            yield Problem(**pb_data)
+        parquet_file = pyarrow.parquet.ParquetFile(self.path)
+        file_columns = set(parquet_file.schema_arrow.names)
+        for batch in parquet_file.iter_batches(
+            columns=[key for key in ProblemList.COLUMNS if key in file_columns]
+        ):
+            columns = {
+                key: (
+                    batch.column(key).to_pylist()
+                    if key == "name"
+                    else get_list_views(batch.column(key))
+                )
+                for key in batch.schema.names
+            }
+            for i in range(batch.num_rows):
+                yield self.__build_problem(columns, i)
+
+    @staticmethod
+    def __build_problem(columns: Dict[str, List[Any]], i: int) -> "Problem":
+        """Build a problem from a row of a record batch.
+
+        Args:
+            columns: Values of each column of the record batch.
+            i: Index of the row in the record batch.
+
+        Returns:
+            Problem built from the row.
+        """
+        from .problem import Problem
+
+        pb_data: Dict[str, Any] = {
+            key: columns[key][i] if key in columns else None
+            for key in ProblemList.KEYS
+        }
+        n = pb_data["q"].size
+        for key in ProblemList.MATRIX_KEYS:
+            data = columns.get(f"{key}_data")
+            if pb_data[key] is not None:  # dense matrix
+                m = pb_data[key].size // n
+                pb_data[key] = pb_data[key].reshape((m, n))
+            elif data is not None and data[i] is not None:  # CSC matrix
+                shape = columns[f"{key}_shape"][i]
+                pb_data[key] = spa.csc_matrix(
+                    (
+                        data[i],
+                        columns[f"{key}_indices"][i],
+                        columns[f"{key}_indptr"][i],
+                    ),
+                    shape=(int(shape[0]), int(shape[1])),
+                )
+        return Problem(**pb_data)
+
+    def manifest(self) -> List[ProblemInfo]:
+        """Get lightweight metadata of all problems in the set.
+
+        Returns:
+            Metadata of each problem in the test set, in iteration order.
+
+        Note:
+            The manifest is cached next to the Parquet file, keyed by the hash
+            of the file, so that it is only computed once per test set file.
+        """
+        if self.__manifest is None:
+            self.__manifest = self.__load_manifest()
+        return self.__manifest
+
+    def __load_manifest(self) -> List[ProblemInfo]:
+        """Load manifest from its cache file, or recompute it.
+
+        Returns:
+            Metadata of each problem in the test set.
+        """
+        stat = self.path.stat()
+        cache: Dict[str, Any] = {}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as fh:
+                cache = json.load(fh)
+        except (OSError, json.JSONDecodeError):
+            pass  # no valid cache, we will compute the manifest
+        if (
+            cache.get("size") == stat.st_size
+            and cache.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            return [ProblemInfo(**info) for info in cache["problems"]]
+
+        file_hash = get_file_hash(self.path)
+        if cache.get("sha256") == file_hash:
+            manifest = [ProblemInfo(**info) for info in cache["problems"]]
+        else:  # cache is missing or outdated
+            logging.info("Computing manifest of '%s'...", self.path)
+            manifest = self.__compute_manifest()
+        cache = {
+            "sha256": file_hash,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "problems": [asdict(info) for info in manifest],
+        }
+        try:
+            with open(self.manifest_path, "w", encoding="utf-8") as fh:
+                json.dump(cache, fh)
+        except OSError as exn:
+            logging.warning(
+                "Could not cache manifest to '%s': %s", self.manifest_path, exn
+            )
+        return manifest
+
+    def __compute_manifest(self) -> List[ProblemInfo]:
+        """Compute manifest from the Parquet file, one row group at a time.
+
+        Returns:
+            Metadata of each problem in the test set.
+        """
+        parquet_file = pyarrow.parquet.ParquetFile(self.path)
+        file_columns = set(parquet_file.schema_arrow.names)
+        matrix_columns = [
+            column
+            for key in ProblemList.MATRIX_KEYS
+            for column in (key, f"{key}_data")
+            if column in file_columns
+        ]
+        manifest: List[ProblemInfo] = []
+        for i in range(parquet_file.num_row_groups):
+            table = parquet_file.read_row_group(
+                i, columns=["name", "q", "b", "h"] + matrix_columns
+            )
+            names = table.column("name").to_pylist()
+            n = get_list_lengths(table.column("q"))
+            m_eq = get_list_lengths(table.column("b"))
+            m_ineq = get_list_lengths(table.column("h"))
+            nnz = sum(
+                (
+                    count_list_nonzeros(table.column(column))
+                    for column in matrix_columns
+                ),
+                np.zeros(table.num_rows, dtype=int),
+            )
+            manifest.extend(
+                ProblemInfo(
+                    name=names[j],
+                    n=int(n[j]),
+                    m_eq=int(m_eq[j]),
+                    m_ineq=int(m_ineq[j]),
+                    nnz=int(nnz[j]),
+                )
+                for j in range(len(names))
+            )
+        return manifest
@@ -12,6 +12,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas
 
+from .exceptions import BenchmarkError
 from .test_set import TestSet
 
 
@@ -36,13 +37,26 @@ def plot_metric(
         linewidth: Width of output lines, in px.
         savefig: If set, save plot to this path rather than displaying it.
         title: Plot title, set to "" to disable.
+
+    Note:
+        Metrics without a tolerance, such as peak memory, count all problems
+        where the solver found a solution.
     """
     assert issubclass(df[metric].dtype.type, np.floating)
     nb_problems = test_set.count_problems()
     settings_df = df[df["settings"] == settings]
-    metric_tol = test_set.tolerances[settings].from_metric(metric)
-    found_df = settings_df[settings_df["found"]]
-    solved_df = found_df[found_df[metric] <= metric_tol]
+    try:
+        metric_tol: Optional[float] = test_set.tolerances[
+            settings
+        ].from_metric(metric)
+    except BenchmarkError:  # metric has no tolerance
+        metric_tol = None
+    found_df = settings_df[settings_df["found"] & settings_df[metric].notna()]
+    solved_df = (
+        found_df[found_df[metric] <= metric_tol]
+        if metric_tol is not None
+        else found_df
+    )
     plot_solvers: List[str] = (
         solvers if solvers is not None else list(set(solved_df.solver))
     )
@@ -50,11 +64,11 @@ def plot_metric(
         values = solved_df[solved_df["solver"] == solver][metric].values
         nb_solved = len(values)
         if nb_solved < 1:
-            plt.step([0.0, metric_tol], [0.0, 0.0], linewidth=linewidth)
+            plt.step([0.0, metric_tol or 0.0], [0.0, 0.0], linewidth=linewidth)
             continue
         sorted_values = np.sort(values)
         y = np.arange(1, 1 + nb_solved)
-        last_value = max(metric_tol, sorted_values[-1])
+        last_value = max(metric_tol or 0.0, sorted_values[-1])
         padded_values = np.hstack([sorted_values, [last_value]])
         padded_y = np.hstack([y, [nb_solved]])
         plt.step(padded_values, padded_y, linewidth=linewidth)
@@ -68,7 +82,8 @@ def plot_metric(
     plt.xlabel(metric)
     plt.xscale("log")
     plt.axhline(y=nb_problems, color="gray", linestyle=":")
-    plt.axvline(x=metric_tol, color="gray", linestyle=":")
+    if metric_tol is not None:
+        plt.axvline(x=metric_tol, color="gray", linestyle=":")
     plt.ylabel("# problems solved")
     plt.grid(True)
     if savefig:
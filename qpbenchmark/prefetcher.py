@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Load problems in a background thread while solvers run."""
+
+import queue
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from .problem import Problem
+
+
+class Prefetcher:
+    """Iterate over problems loaded ahead of time by a background thread.
+
+    Loading the next problems, for instance decompressing and copying arrays
+    from a Parquet file, then overlaps with solver calls on the current one.
+
+    Attributes:
+        nb_prefetch: Maximum number of problems loaded ahead of time.
+
+    Note:
+        The background thread competes with solvers for the CPU, and for the
+        GIL in Python code. Wrap timed regions in :func:`paused` so that it
+        does not load problems while they execute.
+    """
+
+    nb_prefetch: int
+
+    def __init__(self, problems: Iterable["Problem"], nb_prefetch: int):
+        """Start loading problems in a background thread.
+
+        Args:
+            problems: Iterable of problems to load, for instance a test set.
+            nb_prefetch: Maximum number of problems loaded ahead of time.
+        """
+        if nb_prefetch < 1:
+            raise ValueError(
+                f"number of problems to prefetch should be at least 1, "
+                f"got {nb_prefetch}"
+            )
+        self.__done = object()  # sentinel put at the end of the queue
+        self.__lock = threading.Lock()
+        self.__queue: queue.Queue = queue.Queue(maxsize=nb_prefetch)
+        self.__stopped = threading.Event()
+        self.__thread = threading.Thread(
+            target=self.__load, args=(problems,), daemon=True
+        )
+        self.nb_prefetch = nb_prefetch
+        self.__thread.start()
+
+    def __enter__(self) -> "Prefetcher":
+        """Enter context."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop background thread when exiting context."""
+        self.close()
+
+    def __put(self, item: Any) -> bool:
+        """Put an item in the queue, unless the prefetcher is closed.
+
+        Args:
+            item: Item to put in the queue.
+
+        Returns:
+            True if the item was put in the queue, false if the prefetcher
+            was closed in the meantime.
+        """
+        while not self.__stopped.is_set():
+            try:
+                self.__queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def __load(self, problems: Iterable["Problem"]) -> None:
+        """Load problems into the queue, in the background thread.
+
+        Args:
+            problems: Iterable of problems to load.
+        """
+        try:
+            iterator = iter(problems)
+            while not self.__stopped.is_set():
+                with self.__lock:  # wait while paused
+                    problem = next(iterator, self.__done)
+                if not self.__put(problem) or problem is self.__done:
+                    return
+        except Exception as exn:  # pylint: disable=W0703
+            self.__put(exn)  # re-raised in the consumer thread
+
+    def __iter__(self) -> Iterator["Problem"]:
+        """Yield problems in the order of the underlying iterable.
+
+        Raises:
+            Exception: any exception raised while loading problems.
+        """
+        while True:
+            item = self.__queue.get()
+            if item is self.__done:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    @contextmanager
+    def paused(self):
+        """Context in which the background thread does not load problems.
+
+        Entering the context waits for the problem being loaded, if any, to
+        be complete.
+        """
+        with self.__lock:
+            yield
+
+    def close(self) -> None:
+        """Stop the background thread."""
+        self.__stopped.set()
+        self.__thread.join()
@@ -6,8 +6,9 @@
 
 """Matrix-vector representation of a quadratic program."""
 
+import hashlib
 import os
-from typing import Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
 import numpy as np
 import qpsolvers
@@ -16,11 +17,14 @@ import scipy.sparse as spa
 
 def ensure_dense(
     M: Optional[Union[np.ndarray, spa.csc_matrix]],
+    native_layout: bool = False,
 ) -> Optional[np.ndarray]:
     """Get dense representation of a matrix.
 
     Args:
         M: Matrix to get a dense representation of.
+        native_layout: If set, make sure the matrix is stored in column-major
+            (Fortran) order, as expected by Fortran and BLAS-based solvers.
 
     Returns:
         Dense representation of the matrix.
@@ -28,37 +32,113 @@ def ensure_dense(
     if M is None:
         return None
     elif isinstance(M, np.ndarray):
-        return M
+        return np.asfortranarray(M) if native_layout else M
     else:  # isinstance(M, spa.csc_matrix):
-        return M.toarray().astype(float)
+        order = "F" if native_layout else "C"
+        return M.toarray(order=order).astype(float, copy=False)
 
 
 def ensure_sparse(
     M: Optional[Union[np.ndarray, spa.csc_matrix]],
+    native_layout: bool = False,
 ) -> Optional[spa.csc_matrix]:
     """Get sparse representation of a matrix.
 
     Args:
         M: Matrix to get a sparse representation of.
+        native_layout: If set, make sure the matrix is in canonical CSC
+            format with 32-bit indices, as expected by C sparse solvers.
+            Matrices too large for 32-bit indices keep 64-bit ones.
 
     Returns:
         Sparse representation of the matrix.
     """
+    if M is None:
+        return None
+    csc = M if isinstance(M, spa.csc_matrix) else spa.csc_matrix(M)
+    fits_int32 = max(csc.nnz, *csc.shape) < np.iinfo(np.int32).max
+    if (
+        native_layout
+        and fits_int32
+        and not (
+            csc.indices.dtype == np.int32
+            and csc.indptr.dtype == np.int32
+            and csc.has_canonical_format
+        )
+    ):
+        csc = spa.csc_matrix(
+            (
+                (
+                    csc.data  # shared: only indices are converted
+                    if csc.has_canonical_format
+                    else csc.data.copy()  # sorted in place below
+                ),
+                csc.indices.astype(np.int32),
+                csc.indptr.astype(np.int32),
+            ),
+            shape=csc.shape,
+        )
+        csc.sum_duplicates()  # also sorts indices
+    return csc
+
+
+def ensure_writable(
+    M: Optional[Union[np.ndarray, spa.csc_matrix]],
+) -> Optional[Union[np.ndarray, spa.csc_matrix]]:
+    """Get a writable version of a vector or matrix.
+
+    Args:
+        M: Vector or matrix, possibly a read-only view.
+
+    Returns:
+        Same vector or matrix if it was already writable, a copy otherwise.
+    """
     if M is None:
         return None
     elif isinstance(M, np.ndarray):
-        return spa.csc_matrix(M)
-    else:  # isinstance(M, spa.csc_matrix):
+        return M if M.flags.writeable else M.copy()
+    elif all(a.flags.writeable for a in (M.data, M.indices, M.indptr)):
         return M
+    return M.copy()
+
+
+def update_array_hash(
+    sha256: "hashlib._Hash", M: Optional[Union[np.ndarray, spa.spmatrix]]
+) -> None:
+    """Update a hash with the contents of a problem array.
+
+    Args:
+        sha256: Hash object to update.
+        M: Dense or sparse array, or None.
+    """
+    if M is None:
+        sha256.update(b"none")
+    elif spa.issparse(M):
+        csc = ensure_sparse(M, native_layout=True)
+        assert csc is not None
+        sha256.update(f"csc{csc.shape}".encode())
+        sha256.update(np.ascontiguousarray(csc.data, dtype=float).data)
+        for index in (csc.indices, csc.indptr):
+            sha256.update(np.ascontiguousarray(index, dtype=np.int64).data)
+    else:  # dense array
+        sha256.update(f"dense{M.shape}".encode())
+        sha256.update(np.ascontiguousarray(M, dtype=float).data)
 
 
 class Problem(qpsolvers.Problem):
     """Quadratic program.
 
+    Dense, sparse and writable versions of the problem are computed once and
+    cached, so that they are shared by all solvers and settings the problem is
+    run with.
+    Call :func:`clear_cache` to release them.
+
     Attributes:
         name: Name of the problem, for reporting.
     """
 
+    __content_hash: Optional[str]
+    __conversions: Dict[Tuple[str, bool], "Problem"]
     name: str
 
     def __init__(
@@ -75,6 +155,8 @@ class Problem(qpsolvers.Problem):
     ):
         """Quadratic program in qpsolvers format."""
         super().__init__(P, q, G, h, A, b, lb, ub)
+        self.__content_hash = None
+        self.__conversions = {}
         self.name = name
 
     @staticmethod
@@ -100,42 +182,117 @@ class Problem(qpsolvers.Problem):
             name=name,
         )
 
-    def to_dense(self):
+    def get_content_hash(self) -> str:
+        """Get a hash of the problem arrays.
+
+        Returns:
+            Hexadecimal SHA-256 digest of the problem arrays, computed once
+            and cached. Sparse matrices are hashed in canonical CSC format, so
+            that the hash does not depend on their storage order, but a dense
+            and a sparse version of the same problem have different hashes.
+        """
+        if self.__content_hash is None:
+            sha256 = hashlib.sha256()
+            for M in (
+                self.P,
+                self.q,
+                self.G,
+                self.h,
+                self.A,
+                self.b,
+                self.lb,
+                self.ub,
+            ):
+                update_array_hash(sha256, M)
+            self.__content_hash = sha256.hexdigest()
+        return self.__content_hash
+
+    def __convert(self, kind: str, native_layout: bool) -> "Problem":
+        """Get cached dense, sparse or writable version of the problem.
+
+        Args:
+            kind: Either "dense", "sparse" or "writable".
+            native_layout: Convert matrices to the native layout of solvers.
+
+        Returns:
+            Converted problem, which is the present problem itself if its
+            arrays were already in the requested format.
+        """
+        key = (kind, native_layout)
+        if key in self.__conversions:
+            return self.__conversions[key]
+        if kind == "writable":
+            P, q, G, h, A, b, lb, ub = (
+                ensure_writable(M)
+                for M in (
+                    self.P,
+                    self.q,
+                    self.G,
+                    self.h,
+                    self.A,
+                    self.b,
+                    self.lb,
+                    self.ub,
+                )
+            )
+            assert q is not None  # the cost vector is always set
+        else:  # kind in ("dense", "sparse")
+            ensure = ensure_dense if kind == "dense" else ensure_sparse
+            P, G, A = (
+                ensure(M, native_layout) for M in (self.P, self.G, self.A)
+            )
+            q, h, b, lb, ub = self.q, self.h, self.b, self.lb, self.ub
+        if (
+            P is self.P
+            and q is self.q
+            and G is self.G
+            and h is self.h
+            and A is self.A
+            and b is self.b
+            and lb is self.lb
+            and ub is self.ub
+        ):
+            return self
+        converted = Problem(P, q, G, h, A, b, lb, ub, name=self.name)
+        self.__conversions[key] = converted
+        return converted
+
+    def to_dense(self, native_layout: bool = False):
         """Return dense version.
 
+        Args:
+            native_layout: If set, store matrices in column-major order.
+
         Returns:
             Dense version of the present problem.
         """
-        return Problem(
-            ensure_dense(self.P),
-            self.q,
-            ensure_dense(self.G),
-            self.h,
-            ensure_dense(self.A),
-            self.b,
-            self.lb,
-            self.ub,
-            name=self.name,
-        )
+        return self.__convert("dense", native_layout)
 
-    def to_sparse(self):
+    def to_sparse(self, native_layout: bool = False):
         """Return sparse version.
 
+        Args:
+            native_layout: If set, store matrices in canonical CSC format with
+                32-bit indices.
+
         Returns:
             Sparse version of the present problem.
         """
-        P, G, A = self.P, self.G, self.A
-        return Problem(
-            ensure_sparse(P),
-            self.q,
-            ensure_sparse(G),
-            self.h,
-            ensure_sparse(A),
-            self.b,
-            self.lb,
-            self.ub,
-            name=self.name,
-        )
+        return self.__convert("sparse", native_layout)
+
+    def clear_cache(self) -> None:
+        """Release cached dense, sparse and writable versions."""
+        self.__conversions.clear()
+
+    def to_writable(self):
+        """Return a version of the problem with only writable arrays.
+
+        Returns:
+            Present problem if its arrays are all writable, otherwise a new
+            problem where read-only arrays have been copied. The copy is
+            cached until :func:`clear_cache` is called.
+        """
+        return self.__convert("writable", False)
 
     @staticmethod
     def load(file: str):
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Lightweight metadata of a quadratic program."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+
+if TYPE_CHECKING:  # avoid importing qpsolvers and SciPy at runtime
+    import scipy.sparse as spa
+
+    from .problem import Problem
+
+
+def count_nonzeros(M: Optional[Union[np.ndarray, "spa.csc_matrix"]]) -> int:
+    """Count the number of nonzero coefficients in a matrix.
+
+    Args:
+        M: Matrix to count the nonzeros of.
+
+    Returns:
+        Number of nonzero coefficients, zero if the matrix is None.
+    """
+    if M is None:
+        return 0
+    elif isinstance(M, np.ndarray):
+        return int(np.count_nonzero(M))
+    else:  # isinstance(M, spa.csc_matrix):
+        return int(M.nnz)
+
+
+@dataclass(frozen=True)
+class ProblemInfo:
+    """Lightweight metadata of a problem, available without its matrices.
+
+    Attributes:
+        name: Name of the problem.
+        n: Number of optimization variables.
+        m_eq: Number of equality constraints.
+        m_ineq: Number of inequality constraints.
+        nnz: Number of nonzero coefficients in the P, G and A matrices.
+    """
+
+    name: str
+    n: int
+    m_eq: int
+    m_ineq: int
+    nnz: int
+
+    @staticmethod
+    def from_problem(problem: "Problem") -> "ProblemInfo":
+        """Get metadata of a fully constructed problem.
+
+        Args:
+            problem: Problem to get the metadata of.
+
+        Returns:
+            Metadata of the problem.
+        """
+        return ProblemInfo(
+            name=problem.name,
+            n=problem.q.shape[0],
+            m_eq=problem.b.shape[0] if problem.b is not None else 0,
+            m_ineq=problem.h.shape[0] if problem.h is not None else 0,
+            nnz=sum(
+                count_nonzeros(M) for M in (problem.P, problem.G, problem.A)
+            ),
+        )
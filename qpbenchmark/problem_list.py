@@ -6,37 +6,113 @@
 
 """List of problems saved to and read from Parquet files."""
 
-from typing import List, Union
+from itertools import product
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 
-import pandas
+import numpy as np
+import pyarrow
+import pyarrow.parquet
+import scipy.sparse as spa
 
-from .problem import Problem
+if TYPE_CHECKING:  # qpsolvers is not needed to write or read problem lists
+    from .problem import Problem
+
+
+def get_row(problem: "Problem") -> Dict[str, Any]:
+    """Get the Parquet row of a problem.
+
+    Args:
+        problem: Problem to convert.
+
+    Returns:
+        Dictionary with a value for each column of the Parquet schema.
+        Dense matrices are flattened in their own column, while sparse
+        matrices are stored in compressed sparse column (CSC) format in the
+        four data, indices, indptr and shape columns.
+    """
+    row: Dict[str, Any] = {key: None for key in ProblemList.COLUMNS}
+    for key in ProblemList.KEYS:
+        value = problem.__dict__[key]
+        if key in ProblemList.MATRIX_KEYS and spa.issparse(value):
+            csc = spa.csc_matrix(value)
+            row[f"{key}_data"] = csc.data
+            row[f"{key}_indices"] = csc.indices.astype(np.int32)
+            row[f"{key}_indptr"] = csc.indptr.astype(np.int64)
+            row[f"{key}_shape"] = list(csc.shape)
+            continue
+        if hasattr(value, "flatten"):  # only for NumPy arrays
+            value = value.flatten()
+        row[key] = value
+    return row
+
+
+def get_row_size(row: Dict[str, Any]) -> int:
+    """Estimate the size of a Parquet row in memory.
+
+    Args:
+        row: Dictionary with a value for each column of the Parquet schema.
+
+    Returns:
+        Number of bytes of the arrays in the row.
+    """
+    return sum(
+        value.nbytes for value in row.values() if isinstance(value, np.ndarray)
+    )
 
 
 class ProblemList:
-    """List of problems saved to and read from Parquet files."""
+    """List of problems saved to and read from Parquet files.
+
+    Attributes:
+        COLUMNS: Columns of the Parquet schema.
+        KEYS: Keys of problem attributes.
+        MATRIX_KEYS: Keys of problem matrices, that can be dense or sparse.
+        SCHEMA: Arrow schema of Parquet files.
+        SPARSE_FIELDS: Fields of the CSC representation of sparse matrices.
+    """
 
     KEYS = ("P", "q", "G", "h", "A", "b", "lb", "ub", "name")
+    MATRIX_KEYS = ("P", "G", "A")
+    SPARSE_FIELDS = {
+        "data": pyarrow.list_(pyarrow.float64()),
+        "indices": pyarrow.list_(pyarrow.int32()),
+        "indptr": pyarrow.list_(pyarrow.int64()),
+        "shape": pyarrow.list_(pyarrow.int64()),
+    }
+    SCHEMA = pyarrow.schema(
+        [
+            (
+                (key, pyarrow.string())
+                if key == "name"
+                else (key, pyarrow.list_(pyarrow.float64()))
+            )
+            for key in KEYS
+        ]
+        + [
+            (f"{key}_{field}", field_type)
+            for key, (field, field_type) in product(
+                MATRIX_KEYS, SPARSE_FIELDS.items()
+            )
+        ]
+    )
+    COLUMNS = tuple(SCHEMA.names)
 
     def __init__(self):
         """Initialize to an empty list."""
-        self.data = {key: [] for key in self.KEYS}
+        self.data = {key: [] for key in self.COLUMNS}
 
-    def append(self, problem: Problem) -> None:
+    def append(self, problem: "Problem") -> None:
         """Append a problem to the list.
 
         Args:
             problem: Problem to append.
-            time: Optional time (in seconds) corresponding to the problem.
         """
-        for key in self.KEYS:
-            value = problem.__dict__[key]
-            if hasattr(value, "flatten"):  # only for NumPy arrays
-                value = value.flatten()
+        for key, value in get_row(problem).items():
             self.data[key].append(value)
 
     def extend(
-        self, problem_list: Union["ProblemList", List[Problem]]
+        self, problem_list: Union["ProblemList", List["Problem"]]
     ) -> None:
         """Extend problem list with another.
 
@@ -44,7 +120,7 @@ class ProblemList:
             problem_list: Other problem list.
         """
         if isinstance(problem_list, ProblemList):
-            for key in self.KEYS:
+            for key in self.COLUMNS:
                 self.data[key].extend(problem_list.data[key])
         elif isinstance(problem_list, list):
             for problem in problem_list:
@@ -54,15 +130,163 @@ class ProblemList:
                 f"problem list has unknown type {type(problem_list)}"
             )
 
-    def to_parquet(self, path: str) -> None:
+    def __len__(self) -> int:
+        """Number of problems in the list."""
+        return len(self.data["name"])
+
+    def to_parquet(self, path: Union[Path, str], **kwargs) -> None:
         """Save sequence of problems to a Parquet file.
 
         Args:
             path: Path to the Parquet file to save problems to.
+            kwargs: Keyword arguments forwarded to
+                :class:`ProblemListWriter`.
+        """
+        with ProblemListWriter(path, **kwargs) as writer:
+            writer.extend(self)
+
+
+class ProblemListWriter:
+    """Write problems to a Parquet file in constant memory.
+
+    Problems are buffered and flushed to the file as a new row group every
+    time the buffer reaches a given number of problems or bytes, so that
+    large test sets can be generated without holding them in memory.
+
+    Attributes:
+        path: Path to the Parquet file.
+        row_group_bytes: Flush a row group once buffered problems reach this
+            estimated number of bytes.
+        row_group_size: Flush a row group once this number of problems is
+            buffered.
+
+    Example:
+        .. code:: python
+
+            with ProblemListWriter("test_set.parquet") as writer:
+                for problem in generate_problems():
+                    writer.append(problem)
+    """
+
+    path: Path
+    row_group_bytes: int
+    row_group_size: int
+
+    def __init__(
+        self,
+        path: Union[Path, str],
+        row_group_size: int = 1024,
+        row_group_bytes: int = 64 << 20,
+        compression: str = "snappy",
+        compression_level: Optional[int] = None,
+        use_dictionary: Union[bool, List[str]] = False,
+    ):
+        """Initialize writer.
+
+        Args:
+            path: Path to the Parquet file to write problems to.
+            row_group_size: Maximum number of problems per row group.
+            row_group_bytes: Maximum estimated number of bytes per row group.
+            compression: Compression codec, for instance "none", "snappy",
+                "lz4" or "zstd".
+            compression_level: Compression level, or None for the default
+                level of the codec.
+            use_dictionary: Enable dictionary encoding for all columns if
+                True, or for the list of column names it contains. Problem
+                arrays rarely repeat values, so it is disabled by default.
+        """
+        if row_group_size < 1:
+            raise ValueError(
+                f"row group size should be at least 1, got {row_group_size}"
+            )
+        self.__buffer: Dict[str, List[Any]] = {
+            key: [] for key in ProblemList.COLUMNS
+        }
+        self.__buffer_bytes = 0
+        self.__writer: Optional[pyarrow.parquet.ParquetWriter] = None
+        self.__writer_kwargs = {
+            "compression": compression,
+            "compression_level": compression_level,
+            "use_dictionary": use_dictionary,
+        }
+        self.path = Path(path)
+        self.row_group_bytes = row_group_bytes
+        self.row_group_size = row_group_size
+
+    def __enter__(self) -> "ProblemListWriter":
+        """Open Parquet file when entering context."""
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Flush remaining problems and close file when exiting context."""
+        self.close()
+
+    def open(self) -> None:
+        """Open Parquet file for writing."""
+        if self.__writer is None:
+            self.__writer = pyarrow.parquet.ParquetWriter(
+                self.path, ProblemList.SCHEMA, **self.__writer_kwargs
+            )
+
+    def append(self, problem: "Problem") -> None:
+        """Append a problem to the file.
+
+        Args:
+            problem: Problem to append.
+        """
+        self.__append_row(get_row(problem))
+
+    def extend(
+        self, problem_list: Union[ProblemList, Iterable["Problem"]]
+    ) -> None:
+        """Append several problems to the file.
+
+        Args:
+            problem_list: Problem list or iterable of problems to append.
+        """
+        if isinstance(problem_list, ProblemList):
+            data = problem_list.data
+            for i in range(len(problem_list)):
+                self.__append_row({key: data[key][i] for key in data})
+        else:  # iterable of problems
+            for problem in problem_list:
+                self.append(problem)
+
+    def __append_row(self, row: Dict[str, Any]) -> None:
+        """Append a row to the buffer, flushing it if it is full.
+
+        Args:
+            row: Dictionary with a value for each column of the schema.
         """
-        df = pandas.DataFrame(self.data)
-        df.to_parquet(
-            path,
-            engine="pyarrow",
-            index=False,
+        for key, value in row.items():
+            self.__buffer[key].append(value)
+        self.__buffer_bytes += get_row_size(row)
+        if (
+            len(self.__buffer["name"]) >= self.row_group_size
+            or self.__buffer_bytes >= self.row_group_bytes
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered problems to the file as a new row group."""
+        nb_rows = len(self.__buffer["name"])
+        if nb_rows < 1:
+            return
+        self.open()
+        assert self.__writer is not None
+        table = pyarrow.Table.from_pydict(
+            self.__buffer, schema=ProblemList.SCHEMA
         )
+        self.__writer.write_table(table, row_group_size=nb_rows)
+        for values in self.__buffer.values():
+            values.clear()
+        self.__buffer_bytes = 0
+
+    def close(self) -> None:
+        """Flush remaining problems and close the file."""
+        self.open()  # write a valid file even if it has no problem
+        self.flush()
+        assert self.__writer is not None
+        self.__writer.close()
+        self.__writer = None
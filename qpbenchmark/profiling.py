@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Profile solver calls on a single benchmark instance."""
+
+import cProfile
+import os
+import pstats
+import re
+import sys
+import sysconfig
+import threading
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .problem import Problem
+from .utils import time_solve_problem
+
+# Packages whose functions are counted as wrapper time rather than solver time
+WRAPPER_PACKAGES = ("numpy", "qpbenchmark", "qpsolvers", "scipy")
+
+
+class SamplingProfiler:
+    """Sample the call stack of a thread at regular intervals.
+
+    Samples are counted by stack, which gives the collapsed-stack format
+    taken by flame graph tools such as ``flamegraph.pl`` or speedscope.
+
+    Attributes:
+        interval: Time between two samples, in seconds.
+        stacks: Number of samples of each collapsed stack, where frames are
+            separated by semicolons from the outermost to the innermost.
+
+    Note:
+        Native code does not appear in Python stacks: time spent in a solver
+        extension is attributed to the Python function that called it. The
+        sampling thread needs the GIL, so that native code holding the GIL
+        delays samples until it returns.
+    """
+
+    interval: float
+    stacks: Counter
+
+    def __init__(self, interval: float = 1e-3):
+        """Initialize profiler.
+
+        Args:
+            interval: Time between two samples, in seconds.
+        """
+        self.__stopped = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+        self.interval = interval
+        self.stacks = Counter()
+
+    def __enter__(self) -> "SamplingProfiler":
+        """Start sampling the calling thread."""
+        self.__stopped.clear()
+        self.__thread = threading.Thread(
+            target=self.__sample, args=(threading.get_ident(),), daemon=True
+        )
+        self.__thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop sampling."""
+        self.__stopped.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    @staticmethod
+    def get_frame_label(frame: FrameType) -> str:
+        """Get the label of a frame in collapsed stacks.
+
+        Args:
+            frame: Python frame.
+
+        Returns:
+            Qualified name of the function of the frame.
+        """
+        module = frame.f_globals.get("__name__", "?")
+        return f"{module}:{frame.f_code.co_name}"
+
+    def __sample(self, thread_id: int) -> None:
+        """Sample a thread until stopped.
+
+        Args:
+            thread_id: Identifier of the profiled thread.
+        """
+        while not self.__stopped.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            labels = []
+            while frame is not None:
+                labels.append(self.get_frame_label(frame))
+                frame = frame.f_back
+            if labels:
+                self.stacks[";".join(reversed(labels))] += 1
+
+    def write_collapsed(self, path: Union[str, Path]) -> None:
+        """Write samples in collapsed-stack format.
+
+        Args:
+            path: Path to the output file.
+        """
+        with open(path, "w", encoding="utf-8") as fh:
+            for stack, count in sorted(self.stacks.items()):
+                fh.write(f"{stack} {count}\n")
+
+
+def get_function_path(function: Tuple[str, int, str]) -> str:
+    """Get the path to the source file of a profiled function.
+
+    Args:
+        function: Function key ``(filename, line, name)`` from profile stats.
+
+    Returns:
+        Path to the source file of the function. For functions implemented
+        in C, this is the file of their module, e.g. "numpy/__init__.py" for
+        "<built-in method numpy.zeros>". It is empty for Python built-ins.
+    """
+    filename, _, name = function
+    if filename != "~":
+        return filename
+    match = re.match(r"<(?:built-in method |method '\w+' of ')(\w+)\.", name)
+    if match is None:  # e.g. "<built-in method builtins.len>"
+        return ""
+    module = sys.modules.get(match.group(1))
+    return getattr(module, "__file__", None) or ""
+
+
+def is_wrapper_function(function: Tuple[str, int, str]) -> bool:
+    """Check whether a profiled function is part of the solver wrapper.
+
+    Args:
+        function: Function key ``(filename, line, name)`` from profile stats.
+
+    Returns:
+        True if the function is a Python built-in or belongs to the standard
+        library, to generated code, or to one of the
+        :data:`WRAPPER_PACKAGES`.
+    """
+    path = get_function_path(function)
+    if not path or path.startswith("<"):
+        return True
+    stdlib = sysconfig.get_paths()["stdlib"]
+    if path.startswith(stdlib) and "-packages" not in path:
+        return True
+    return any(
+        f"{os.sep}{package}{os.sep}" in path for package in WRAPPER_PACKAGES
+    )
+
+
+def get_time_split(stats: pstats.Stats) -> Dict[str, float]:
+    """Split profiled time between the solver wrapper and the solver itself.
+
+    Args:
+        stats: Profile statistics of solver calls.
+
+    Returns:
+        Dictionary with the "total" profiled time, the "native" time spent in
+        the solver, and the "wrapper" time spent elsewhere, for instance in
+        conversions and checks, all in seconds.
+
+    Note:
+        Native time consists of calls from the qpsolvers backend functions to
+        functions outside of the wrapper, along with the own time of backend
+        functions, as cProfile does not record calls to some extensions such
+        as Cython functions. Profiling also adds a per-call overhead that
+        inflates wrapper time, which consists of many Python calls.
+    """
+    solvers_dir = f"{os.sep}qpsolvers{os.sep}solvers{os.sep}"
+    native = 0.0
+    for function, entry in stats.stats.items():  # type: ignore
+        _, _, tottime, _, callers = entry
+        if solvers_dir in function[0]:
+            native += tottime
+        elif not is_wrapper_function(function):
+            native += sum(
+                cumtime
+                for caller, (_, _, _, cumtime) in callers.items()
+                if solvers_dir in caller[0]
+            )
+    total = stats.total_tt  # type: ignore
+    return {"total": total, "wrapper": total - native, "native": native}
+
+
+def profile_instance(
+    problem: Problem,
+    solver: str,
+    kwargs: Dict[str, Any],
+    output_prefix: Union[str, Path],
+    nb_calls: int = 1,
+    interval: float = 1e-3,
+) -> Dict[str, float]:
+    """Profile the calls of a solver on a problem.
+
+    The instance is solved ``nb_calls`` times under cProfile, then as many
+    times under a :class:`SamplingProfiler`, so that each profiler does not
+    measure the overhead of the other.
+
+    Args:
+        problem: Problem to solve.
+        solver: Name of the QP solver.
+        kwargs: Keyword arguments forwarded to the solver, e.g. settings.
+        output_prefix: Path prefix of the output files: cProfile statistics
+            are written to "{prefix}.pstats", and sampled stacks to
+            "{prefix}.collapsed".
+        nb_calls: Number of solver calls for each profiler, which gives
+            more samples on short solves.
+        interval: Time between two stack samples, in seconds.
+
+    Returns:
+        Time split between the solver wrapper and the solver itself, as
+        returned by :func:`get_time_split`.
+
+    Raises:
+        ValueError: if the number of calls is not positive.
+    """
+    if nb_calls < 1:
+        raise ValueError(f"invalid number of calls {nb_calls=}")
+    profile = cProfile.Profile()
+    for _ in range(nb_calls):
+        profile.runcall(time_solve_problem, problem, solver, **kwargs)
+    profile.dump_stats(f"{output_prefix}.pstats")
+    split = get_time_split(pstats.Stats(profile))
+
+    with SamplingProfiler(interval) as sampler:
+        for _ in range(nb_calls):
+            time_solve_problem(problem, solver, **kwargs)
+    sampler.write_collapsed(f"{output_prefix}.collapsed")
+    return split
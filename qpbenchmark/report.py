@@ -8,12 +8,12 @@
 
 import datetime
 import io
-from importlib import metadata
-from typing import Dict
+from typing import Any, Dict, Optional
 
 import pandas
 
 from .results import Results
+from .run_metadata import capture_run_metadata, read_run_metadata
 from .solver_settings import SolverSettings
 from .spdlog import logging
 from .test_set import TestSet
@@ -21,7 +21,6 @@ from .utils import (
     capitalize_settings,
     get_cpu_info_summary,
     get_cpu_info_table,
-    get_gpu_info_summary,
     get_solver_versions,
 )
 from .version import get_version
@@ -41,10 +40,14 @@ class Report:
     # Reports are big and linear, thus with many instance attributes.
 
     __correct_rate_df: pandas.DataFrame
+    __cpu_time_df: pandas.DataFrame
     __dual_df: pandas.DataFrame
     __gap_df: pandas.DataFrame
+    __memory_df: pandas.DataFrame
+    __overhead_df: pandas.DataFrame
     __primal_df: pandas.DataFrame
     __runtime_df: pandas.DataFrame
+    __solve_time_df: pandas.DataFrame
     __success_rate_df: pandas.DataFrame
     author: str
     results: Results
@@ -59,15 +62,41 @@ class Report:
             results: Results from which the report should be generated.
         """
         self.__correct_rate_df = pandas.DataFrame()
+        self.__cpu_time_df = pandas.DataFrame()
         self.__dual_df = pandas.DataFrame()
         self.__gap_df = pandas.DataFrame()
+        self.__memory_df = pandas.DataFrame()
+        self.__overhead_df = pandas.DataFrame()
         self.__primal_df = pandas.DataFrame()
         self.__runtime_df = pandas.DataFrame()
+        self.__solve_time_df = pandas.DataFrame()
         self.__success_rate_df = pandas.DataFrame()
         self.author = author
         self.results = results
         self.solver_settings = results.test_set.solver_settings
         self.test_set = results.test_set
+        self.__run_metadata: Optional[Dict[str, Any]] = None
+
+    @property
+    def run_metadata(self) -> Dict[str, Any]:
+        """Metadata on the host and solvers that produced the results.
+
+        Metadata is read from the file saved next to the results when they
+        were run. Results without metadata file, for instance from previous
+        versions of the benchmark, are reported with the calling host.
+        """
+        if self.__run_metadata is None:
+            run_metadata = None
+            if self.results.metadata_path is not None:
+                run_metadata = read_run_metadata(self.results.metadata_path)
+            if run_metadata is None:
+                logging.warning(
+                    "No run metadata found for these results, "
+                    "reporting host and solver versions of the present host"
+                )
+                run_metadata = capture_run_metadata(self.test_set.solvers)
+            self.__run_metadata = run_metadata
+        return self.__run_metadata
 
     def get_tolerances_table(self) -> str:
         """Get tolerances Markdown table.
@@ -160,7 +189,10 @@ class Report:
         Returns:
             Solver versions Markdown table.
         """
-        versions = get_solver_versions(self.test_set.solvers)
+        versions = dict(self.run_metadata["solver_versions"])
+        missing_solvers = set(self.test_set.solvers) - set(versions)
+        if missing_solvers:  # solvers that were not run since metadata
+            versions.update(get_solver_versions(missing_solvers))
         versions_df = pandas.DataFrame(
             {
                 "solver": list(versions.keys()),
@@ -220,6 +252,41 @@ class Report:
             shift=10.0,
             not_found_values=gap_tolerances,
         )
+        if self.results.df["cpu_time"].notna().any():
+            self.__cpu_time_df = self.results.build_shgeom_df(
+                metric="cpu_time",
+                shift=10.0,
+                not_found_values=runtime_tolerances,
+            )
+            found_df = self.results.df[self.results.df["found"]]
+            self.__memory_df = (
+                found_df.pivot_table(
+                    index="solver",
+                    columns="settings",
+                    values="peak_rss_delta",
+                    aggfunc="median",
+                    observed=True,
+                )
+                / 2**20
+            )
+        df = self.results.df
+        if df["solve_time"].notna().any():
+            solve_time_df = self.results.build_shgeom_df(
+                metric="solve_time",
+                shift=10.0,
+                not_found_values=runtime_tolerances,
+            )
+            timed_solvers = df.loc[df["solve_time"].notna(), "solver"]
+            self.__solve_time_df = solve_time_df[
+                solve_time_df.index.isin(timed_solvers)
+            ]
+            self.__overhead_df = 1e3 * df[df["found"]].pivot_table(
+                index="solver",
+                columns="settings",
+                values="overhead_time",
+                aggfunc="median",
+                observed=True,
+            )
 
     def write(self, path: str) -> None:
         """Write report to a given path.
@@ -255,8 +322,9 @@ class Report:
         """
         nb_problems = len(set(self.results.df["problem"]))
         benchmark_version = get_version()
-        cpu_info_summary = get_cpu_info_summary()
-        gpu_info_summary = get_gpu_info_summary()
+        host = self.run_metadata["host"]
+        cpu_info_summary = get_cpu_info_summary(host["cpu_info"])
+        gpu_info_summary = host["gpu"]
         optional_gpu_line = (
             f"\n| GPU                | {gpu_info_summary} |"
             if gpu_info_summary
@@ -303,6 +371,7 @@ class Report:
             """* [Results by metric](#results-by-metric)
     * [Success rate](#success-rate)
     * [Computation time](#computation-time)
+    * [Resource usage](#resource-usage)
     * [Optimality conditions](#optimality-conditions)
         * [Primal residual](#primal-residual)
         * [Dual residual](#dual-residual)
@@ -327,7 +396,7 @@ class Report:
         Args:
             fh: Output file handle.
         """
-        qpsolvers_version = metadata.version("qpsolvers")
+        qpsolvers_version = self.run_metadata["qpsolvers_version"]
         fh.write("## Solvers\n\n")
         fh.write(f"{self.get_solver_versions_table()}\n\n")
         fh.write(
@@ -342,7 +411,25 @@ class Report:
         Args:
             fh: Output file handle.
         """
-        fh.write(f"## CPU info\n\n{get_cpu_info_table()}\n")
+        host = self.run_metadata["host"]
+        blas = host["blas"]
+        blas_summary = (
+            f"{blas.get('name', '?')} {blas.get('version', '')}".strip()
+            if blas
+            else "unknown"
+        )
+        fh.write("## CPU info\n\n")
+        fh.write(
+            f"""| Number of cores    | {host["cpu_count"]} |
+|:-------------------|:--------------------|
+| Frequency governor | {host["cpu_governor"] or "unknown"} |
+| BLAS               | {blas_summary} |
+| Platform           | {host["platform"]} |
+| Python             | {host["python_version"]} |
+
+"""
+        )
+        fh.write(f"{get_cpu_info_table(host['cpu_info'])}\n")
 
     def __write_settings_section(self, fh: io.TextIOWrapper) -> None:
         """Write Settings section.
@@ -418,6 +505,103 @@ class Report:
             fh.write(f"{shm_desc}\n\n")
             fh.write(f'{df.to_markdown(index=True, floatfmt=".1f")}\n\n')
 
+    def __write_runtime_breakdown(self, fh: io.TextIOWrapper) -> None:
+        """Write solve times and wrapper overheads in Computation time.
+
+        Args:
+            fh: Output file handle.
+        """
+        if self.__solve_time_df.empty:
+            return
+
+        solve_time_desc = (
+            "Runtimes above cover the whole call to qpsolvers, including "
+            "input conversions, checks and solution construction by the "
+            "wrapper. Solve times exclude this overhead as well as solver "
+            "setup. They are reported by solvers when available, otherwise "
+            "measured by qpsolvers around the solver call."
+        )
+
+        fh.write(f"{solve_time_desc}\n\n")
+        fh.write(
+            "Shifted geometric mean of solver solve times "
+            "(1.0 is the best):\n\n"
+        )
+        fh.write(
+            f"{self.__solve_time_df.to_markdown(index=True, floatfmt='.1f')}"
+            "\n\n"
+        )
+
+        solve_time_table_desc = (
+            "Rows are solvers and columns are solver settings. "
+            "The shift is $sh = 10$. A solver that fails to solve a problem "
+            "receives a solve time equal to the [time limit](#settings)."
+        )
+
+        fh.write(f"{solve_time_table_desc}\n\n")
+        fh.write("Median wrapper overhead per solver call (ms):\n\n")
+        fh.write(
+            f"{self.__overhead_df.to_markdown(index=True, floatfmt='.2f')}"
+            "\n\n"
+        )
+
+        overhead_table_desc = (
+            "Rows are solvers and columns are solver settings. Overhead is "
+            "the part of the runtime spent neither in solver setup nor in "
+            "solving. It weighs most on small problems, where it can "
+            "dominate the runtime of fast solvers."
+        )
+
+        fh.write(f"{overhead_table_desc}\n\n")
+
+    def __write_resource_usage(self, fh: io.TextIOWrapper) -> None:
+        """Write Resource usage subsection of Results by metric.
+
+        Args:
+            fh: Output file handle.
+        """
+        fh.write("### Resource usage\n\n")
+        if self.__cpu_time_df.empty:
+            fh.write("Resource usage was not recorded for these results.\n\n")
+            return
+
+        cpu_time_shm_desc = (
+            "CPU time adds user and system times over all threads of the "
+            "solver. A solver that parallelizes its computations can be "
+            "faster in wall-clock runtime while using more CPU time, which "
+            "matters when several jobs share the same machine."
+        )
+
+        fh.write(f"{cpu_time_shm_desc}\n\n")
+        fh.write(
+            "Shifted geometric mean of solver CPU times "
+            "(1.0 is the best):\n\n"
+        )
+        fh.write(
+            f'{self.__cpu_time_df.to_markdown(index=True, floatfmt=".1f")}\n\n'
+        )
+
+        cpu_time_table_desc = (
+            "Rows are solvers and columns are solver settings. "
+            "The shift is $sh = 10$. A solver that fails to solve a problem "
+            "receives a CPU time equal to the [time limit](#settings)."
+        )
+
+        fh.write(f"{cpu_time_table_desc}\n\n")
+        fh.write("Median increase in peak resident memory (MiB):\n\n")
+        fh.write(
+            f'{self.__memory_df.to_markdown(index=True, floatfmt=".1f")}\n\n'
+        )
+
+        memory_table_desc = (
+            "Rows are solvers and columns are solver settings. Peak memory "
+            "is a high-water mark of the process solving problems, so that "
+            "it is best measured in isolated mode where each instance runs "
+            "in its own process."
+        )
+
+        fh.write(f"{memory_table_desc}\n\n")
+
     def __write_results_by_metric(self, fh: io.TextIOWrapper) -> None:
         """Write Results by metric.
 
@@ -485,6 +669,8 @@ class Report:
         )
 
         fh.write(f"{comp_times_table_desc}\n\n")
+        self.__write_runtime_breakdown(fh)
+        self.__write_resource_usage(fh)
         fh.write("### Optimality conditions\n\n")
         fh.write("#### Primal residual\n\n")
 
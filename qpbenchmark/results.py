@@ -6,31 +6,156 @@
 
 """Test case results."""
 
+import json
+import time
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Union
+from typing import IO, Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas
+import pyarrow
+import pyarrow.compute
+import pyarrow.dataset
+import pyarrow.parquet
 import qpsolvers
 
 from .exceptions import BenchmarkError, ResultsError
 from .problem import Problem
-from .shgeom import shgeom
+from .results_database import ResultsDatabase
+from .shgeom import grouped_shgeom
 from .spdlog import logging
 from .test_set import TestSet
 
 
+def concat_results(dfs: List[pandas.DataFrame]) -> pandas.DataFrame:
+    """Concatenate results data frames with categorical string columns.
+
+    Args:
+        dfs: Results data frames to concatenate.
+
+    Returns:
+        Concatenated data frame with all results columns, where string
+        columns such as problem, solver and settings names are categorical.
+        Their categories are the sorted union of the values in all data
+        frames.
+
+    Note:
+        Columns missing from a data frame, for instance runtime statistics
+        in results files from earlier versions of the benchmark, are filled
+        with NaN values.
+    """
+    str_columns = [
+        column
+        for column, column_type in Results.COLUMNS.items()
+        if column_type is str
+    ]
+    float_columns = [
+        column
+        for column, column_type in Results.COLUMNS.items()
+        if column_type is float
+    ]
+    template = pandas.DataFrame([], columns=list(Results.COLUMNS)).astype(
+        Results.COLUMNS
+    )
+    typed_dfs = []
+    for df in [template] + dfs:
+        df = df.assign(
+            **{
+                column: np.nan
+                for column in Results.COLUMNS
+                if column not in df
+            }
+        ).astype({column: float for column in float_columns})
+        typed_dfs.append(
+            df.assign(  # same dtype for all string values, categorical or not
+                **{
+                    column: df[column].astype(str).where(df[column].notna())
+                    for column in str_columns
+                }
+            )
+        )
+    for column in str_columns:
+        categories = pandas.Index(
+            sorted(
+                set().union(
+                    *(df[column].dropna().unique() for df in typed_dfs)
+                )
+            ),
+            dtype=str,
+        )
+        typed_dfs = [
+            df.assign(
+                **{
+                    column: pandas.Categorical(
+                        df[column], categories=categories
+                    )
+                }
+            )
+            for df in typed_dfs
+        ]
+    return pandas.concat(typed_dfs, ignore_index=True)
+
+
 class Results:
     """Test set results.
 
+    Results are indexed by (problem, solver, settings) so that lookups and
+    updates take constant time. New rows are buffered and only merged into
+    the results data frame when it is read or written.
+
+    When results are associated with a CSV or Parquet file, each update is
+    also appended to a journal next to that file. The journal is compacted
+    into the results file by :func:`write`, and replayed upon loading if a
+    previous run was interrupted before compaction. When results are
+    associated with an SQLite database, each update is instead upserted into
+    the database, which several local processes can write to concurrently.
+
+    Parquet results files are read with a filter on the problems of the test
+    set, and optionally on solvers and settings, so that only matching row
+    groups are decoded. Other rows are carried over from the file when
+    writing results back to it, without being loaded into pandas.
+
     Attributes:
+        COLUMNS: Results columns with their types.
         df: Data frame storing the results.
-        file_path: Path to the results CSV file.
+        file_path: Path to the results CSV, Parquet or SQLite file.
+        journal_path: Path to the journal of updates not written to the
+            results file yet, or None for SQLite databases.
+        metadata_path: Path to the metadata on the host and solvers that
+            produced the results.
         test_set: Test set from which results were produced.
     """
 
-    df: pandas.DataFrame
+    COLUMNS: Dict[str, type] = {
+        "problem": str,
+        "solver": str,
+        "settings": str,
+        "runtime": float,
+        "found": bool,
+        "primal_residual": float,
+        "dual_residual": float,
+        "duality_gap": float,
+        "runtime_min": float,
+        "runtime_median": float,
+        "runtime_iqr": float,
+        "setup_time": float,
+        "solve_time": float,
+        "overhead_time": float,
+        "cpu_time": float,
+        "cpu_user_time": float,
+        "cpu_system_time": float,
+        "peak_rss_delta": float,
+        "voluntary_ctx_switches": float,
+        "involuntary_ctx_switches": float,
+        "problem_hash": str,
+        "solver_version": str,
+        "settings_hash": str,
+        "timestamp": float,
+    }
+
     file_path: Optional[Path]
+    journal_path: Optional[Path]
+    metadata_path: Optional[Path]
     test_set: TestSet
 
     @staticmethod
@@ -44,11 +169,61 @@ class Results:
             raise ResultsError('"found" column has some non-boolean values')
 
     @staticmethod
-    def read_from_file(path: Union[str, Path]) -> Optional[pandas.DataFrame]:
+    def get_arrow_schema() -> pyarrow.Schema:
+        """Get the Arrow schema of results columns.
+
+        Returns:
+            Arrow schema where string columns are dictionary-encoded.
+        """
+        arrow_types = {
+            bool: pyarrow.bool_(),
+            float: pyarrow.float64(),
+            str: pyarrow.dictionary(pyarrow.int32(), pyarrow.string()),
+        }
+        return pyarrow.schema(
+            [
+                (column, arrow_types[column_type])
+                for column, column_type in Results.COLUMNS.items()
+            ]
+        )
+
+    @staticmethod
+    def conform_table(table: pyarrow.Table) -> pyarrow.Table:
+        """Conform an Arrow table of results to the results schema.
+
+        Args:
+            table: Arrow table read from a results file, possibly written by
+                an earlier version of the benchmark.
+
+        Returns:
+            Table with the columns of the results schema, in order, where
+            missing columns are filled with nulls.
+        """
+        schema = Results.get_arrow_schema()
+        columns = []
+        for field in schema:
+            if field.name not in table.column_names:
+                columns.append(pyarrow.nulls(table.num_rows, field.type))
+                continue
+            column = table.column(field.name)
+            is_encoded = pyarrow.types.is_dictionary(column.type)
+            if pyarrow.types.is_dictionary(field.type) and not is_encoded:
+                column = column.cast(pyarrow.string()).dictionary_encode()
+            columns.append(column.cast(field.type))
+        return pyarrow.Table.from_arrays(columns, schema=schema)
+
+    @staticmethod
+    def read_from_file(
+        path: Union[str, Path],
+        selection: Optional[pyarrow.compute.Expression] = None,
+    ) -> Optional[pandas.DataFrame]:
         """Load a pandas dataframe from a CSV or Parquet file.
 
         Args:
             path: Path to the file to load.
+            selection: Filter on rows to load from Parquet files, pushed down
+                to skip row groups that have no matching row. Rows from other
+                file formats are all loaded.
 
         Returns:
             Loaded dataframe, or None if the file does not exist.
@@ -56,92 +231,338 @@ class Results:
         file_path = Path(path)
         if not file_path.exists():
             return None
-        elif file_path.suffix not in (".csv", ".parquet"):
+        elif file_path.suffix not in (".csv", ".parquet", ".sqlite"):
             raise BenchmarkError(
                 "unknown file extension to read results from "
                 f"in '{file_path}'"
             )
         logging.info("Loading existing results from '%s'...", file_path)
-        read_func = (
-            pandas.read_csv
-            if file_path.suffix == ".csv"
-            else pandas.read_parquet
-        )
-        df = read_func(file_path)
+        if file_path.suffix == ".csv":
+            # Parse string columns as such, e.g. versions like "0.10"
+            str_columns = [
+                column
+                for column, column_type in Results.COLUMNS.items()
+                if column_type is str
+            ]
+            df = pandas.read_csv(
+                file_path, dtype={column: str for column in str_columns}
+            )
+        elif file_path.suffix == ".parquet":
+            df = pandas.read_parquet(file_path, filters=selection)
+        else:  # file_path.suffix == ".sqlite"
+            database = ResultsDatabase(file_path, Results.COLUMNS)
+            df = database.read()
+            database.close()
         logging.info("Loaded %d rows from '%s'", df.shape[0], file_path)
         return df
 
+    @staticmethod
+    def read_journal(path: Union[str, Path]) -> Optional[pandas.DataFrame]:
+        """Load a pandas dataframe from a journal of results updates.
+
+        Args:
+            path: Path to the JSON Lines journal to load.
+
+        Returns:
+            Loaded dataframe, or None if there is no journal to replay.
+
+        Note:
+            A truncated last line, as may happen when a run is killed while
+            writing to the journal, is skipped with a warning.
+        """
+        journal_path = Path(path)
+        if not journal_path.exists():
+            return None
+        rows = []
+        with open(journal_path, "r", encoding="utf-8") as journal:
+            for line_number, line in enumerate(journal, start=1):
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logging.warning(
+                        "Skipping invalid line %d in journal '%s'",
+                        line_number,
+                        journal_path,
+                    )
+        if not rows:
+            return None
+        logging.info(
+            "Replaying %d results updates from journal '%s'",
+            len(rows),
+            journal_path,
+        )
+        return pandas.DataFrame.from_records(rows)
+
+    @staticmethod
+    def read_results(
+        path: Optional[Union[str, Path]],
+        selection: Optional[pyarrow.compute.Expression] = None,
+    ) -> pandas.DataFrame:
+        """Load results from a file and replay its journal.
+
+        Args:
+            path: Path to the results file, or None for no results.
+            selection: Filter on rows to load from Parquet files, see
+                :func:`read_from_file`.
+
+        Returns:
+            Results dataframe, empty if there is no results file or journal.
+        """
+        dfs = []
+        if path is not None:
+            df_from_file = Results.read_from_file(path, selection)
+            if df_from_file is not None:
+                dfs.append(df_from_file)
+            df_from_journal = Results.read_journal(f"{path}.journal.jsonl")
+            if df_from_journal is not None:
+                dfs.append(df_from_journal)
+        df = concat_results(dfs).drop_duplicates(
+            subset=["problem", "solver", "settings"], keep="last"
+        )
+        Results.check_df(df)
+        return df
+
     def __init__(
-        self, file_path: Optional[Union[str, Path]], test_set: TestSet
+        self,
+        file_path: Optional[Union[str, Path]],
+        test_set: TestSet,
+        solvers: Optional[Iterable[str]] = None,
+        settings: Optional[Iterable[str]] = None,
     ):
         """Initialize results.
 
         Args:
-            file_path: Path to the results file (format: CSV or Parquet), or
-                `None` if there is no file associated with these results.
+            file_path: Path to the results file (format: CSV, Parquet or
+                SQLite), or `None` if there is no file associated with these
+                results.
             test_set: Test set from which results were produced.
+            solvers: If set, only hold results from these solvers.
+            settings: If set, only hold results with these settings.
+
+        Note:
+            Results from other test sets, solvers or settings are kept in the
+            results file, but they are not available from :attr:`df`.
         """
-        df = pandas.DataFrame(
-            [],
-            columns=[
-                "problem",
-                "solver",
-                "settings",
-                "runtime",
-                "found",
-                "primal_residual",
-                "dual_residual",
-                "duality_gap",
-            ],
-        ).astype(
-            {
-                "problem": str,
-                "solver": str,
-                "settings": str,
-                "runtime": float,
-                "found": bool,
-                "primal_residual": float,
-                "dual_residual": float,
-                "duality_gap": float,
-            }
+        self.__problems = set(info.name for info in test_set.manifest())
+        self.__solvers = set(solvers) if solvers is not None else None
+        self.__settings = set(settings) if settings is not None else None
+        selection = self.__get_selection()
+
+        # Other rows are loaded as well when replaying a journal, as the
+        # journal may update them
+        self.__pushdown = (
+            file_path is not None
+            and Path(file_path).suffix == ".parquet"
+            and Path(file_path).exists()
+            and not Path(f"{file_path}.journal.jsonl").exists()
+        )
+        df = Results.read_results(
+            file_path, selection if self.__pushdown else None
+        )
+        database = (
+            ResultsDatabase(file_path, Results.COLUMNS)
+            if file_path is not None and Path(file_path).suffix == ".sqlite"
+            else None
+        )
+        journal_path = (  # databases are updated in place instead
+            Path(f"{file_path}.journal.jsonl")
+            if file_path is not None and database is None
+            else None
         )
-        if file_path is not None:
-            df_from_file = Results.read_from_file(file_path)
-            if df_from_file is not None:
-                df = pandas.concat([df, df_from_file])
-        Results.check_df(df)
-
-        # Filter out problems from the CSV that are in the test set
-        problems = set(problem.name for problem in test_set)
-        test_set_df = df[df["problem"].isin(problems)]
-        complementary_df = df[~df["problem"].isin(problems)]
 
-        self.__complementary_df = complementary_df
-        self.df = test_set_df
+        self.__complementary_df = pandas.DataFrame()
+        self.__database = database
+        self.__df = pandas.DataFrame()
+        self.__index: Dict[Tuple[str, str, str], int] = {}
+        self.__new_rows: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self.__journal: Optional[IO[str]] = None
         self.file_path = Path(file_path) if file_path is not None else None
+        self.journal_path = journal_path
+        self.metadata_path = (
+            Path(f"{file_path}.metadata.json")
+            if file_path is not None
+            else None
+        )
         self.test_set = test_set
+        self.__set_all_rows(df)
+        self.__unsaved = False
+
+    def __get_selection(self) -> pyarrow.compute.Expression:
+        """Get the filter on rows held in the results data frame.
+
+        Returns:
+            Arrow expression matching rows of test set problems, with the
+            selected solvers and settings if any.
+        """
+        selection = pyarrow.compute.field("problem").isin(
+            sorted(self.__problems)
+        )
+        if self.__solvers is not None:
+            selection &= pyarrow.compute.field("solver").isin(
+                sorted(self.__solvers)
+            )
+        if self.__settings is not None:
+            selection &= pyarrow.compute.field("settings").isin(
+                sorted(self.__settings)
+            )
+        return selection
+
+    def __set_all_rows(self, df: pandas.DataFrame) -> None:
+        """Replace all results, from test set problems or not.
+
+        Args:
+            df: New results data frame.
+        """
+        selected = df["problem"].isin(self.__problems)
+        if self.__solvers is not None:
+            selected &= df["solver"].isin(self.__solvers)
+        if self.__settings is not None:
+            selected &= df["settings"].isin(self.__settings)
+        self.__complementary_df = df[~selected]
+        self.df = df[selected]
+
+    def __read_complementary_rows(self) -> pyarrow.Table:
+        """Read rows left in the results file when loading it.
+
+        Returns:
+            Arrow table of the rows that were filtered out when loading the
+            results file.
+        """
+        dataset = pyarrow.dataset.dataset(self.file_path)
+        table = dataset.to_table(filter=~self.__get_selection())
+        return Results.conform_table(table)
+
+    def __load_complementary_rows(self) -> None:
+        """Load rows left in the results file into pandas."""
+        if not self.__pushdown:
+            return
+        self.__complementary_df = concat_results(
+            [
+                self.__read_complementary_rows().to_pandas(),
+                self.__complementary_df,
+            ]
+        )
+        self.__pushdown = False
+
+    @property
+    def df(self) -> pandas.DataFrame:
+        """Data frame storing the results."""
+        if self.__new_rows:
+            self.__merge_new_rows()
+        return self.__df
+
+    @df.setter
+    def df(self, df: pandas.DataFrame) -> None:
+        """Replace the data frame storing the results.
+
+        Args:
+            df: New results data frame.
+        """
+        self.__set_df(df)
+        self.__unsaved = True
+
+    def __set_df(self, df: pandas.DataFrame) -> None:
+        """Replace the data frame storing the results and its index.
+
+        Args:
+            df: New results data frame.
+        """
+        df = df.drop_duplicates(
+            subset=["problem", "solver", "settings"], keep="last"
+        )
+        self.__df = df.reset_index(drop=True)
+        self.__index = {
+            key: i
+            for i, key in enumerate(
+                zip(df["problem"], df["solver"], df["settings"])
+            )
+        }
+        self.__new_rows = {}
+
+    def __merge_new_rows(self) -> None:
+        """Merge buffered rows into the results data frame."""
+        replaced_rows = [
+            self.__index[key] for key in self.__new_rows if key in self.__index
+        ]
+        new_rows_df = pandas.DataFrame.from_records(
+            list(self.__new_rows.values()), columns=self.__df.columns
+        )
+        self.__set_df(
+            concat_results([self.__df.drop(index=replaced_rows), new_rows_df])
+        )
+
+    def __get_value(self, key: Tuple[str, str, str], column: str) -> Any:
+        """Get a value from the results.
+
+        Args:
+            key: Tuple of problem name, solver name and settings name.
+            column: Column to get the value from.
+
+        Returns:
+            Value of the column for this instance.
+        """
+        if key in self.__new_rows:
+            return self.__new_rows[key][column]
+        return self.__df[column].iat[self.__index[key]]
 
     @property
     def nb_rows(self) -> int:
         """Number of rows in the dataframe."""
-        return self.df.shape[0]
+        return len(self.__index) + sum(
+            1 for key in self.__new_rows if key not in self.__index
+        )
 
     def write(self, path: Optional[Union[str, Path]] = None) -> None:
-        """Write results to their CSV file for persistence.
+        """Write results to their file for persistence.
 
         Args:
-            path: Optional path to a separate file to write to.
+            path: Optional path to a separate file to write to, for instance
+                to export results from an SQLite database to CSV or Parquet.
+
+        Note:
+            Writing to the results file compacts the journal into it. SQLite
+            databases are updated in place by :func:`update`, so that writing
+            to them only saves results replaced by other means, for instance
+            by :func:`merge`.
         """
         path_check = path or self.file_path
         if path_check is None:
             raise BenchmarkError("no path to save results to")
         save_path = Path(path_check)
-        save_df = pandas.concat([self.df, self.__complementary_df])
+        if (
+            save_path == self.file_path
+            and self.__database is not None
+            and not self.__unsaved
+        ):
+            return  # all updates are already in the database
+        if save_path.suffix != ".parquet":
+            self.__load_complementary_rows()
+        save_df = concat_results([self.df, self.__complementary_df])
         save_df = save_df.sort_values(by=["problem", "solver", "settings"])
         if save_path.suffix == ".csv":
             save_df.to_csv(save_path, index=False)
         elif save_path.suffix == ".parquet":
-            save_df.to_parquet(save_path, index=False)
+            tables = [
+                pyarrow.Table.from_pandas(
+                    save_df,
+                    schema=Results.get_arrow_schema(),
+                    preserve_index=False,
+                )
+            ]
+            if self.__pushdown:
+                tables.append(self.__read_complementary_rows())
+            pyarrow.parquet.write_table(
+                pyarrow.concat_tables(tables), save_path
+            )
+        elif save_path.suffix == ".sqlite":
+            database = (
+                self.__database
+                if save_path == self.file_path and self.__database is not None
+                else ResultsDatabase(save_path, Results.COLUMNS)
+            )
+            database.upsert(save_df.to_dict("records"))
+            if database is not self.__database:
+                database.close()
         else:  # unknown file extension
             raise BenchmarkError(
                 f"unknown results file extension in '{save_path}'"
@@ -151,33 +572,109 @@ class Results:
             save_path,
             save_df.shape[0],
         )
+        if save_path == self.file_path:
+            self.__clear_journal()
+            self.__unsaved = False
+
+    def merge(self, paths: Iterable[Union[str, Path]]) -> None:
+        """Merge results from other files into the present ones.
+
+        Args:
+            paths: Paths to the results files to merge, for instance from
+                different shards of a benchmark run.
+
+        Note:
+            When several files have a result for the same instance, the one
+            with the latest timestamp is kept. Results without timestamps,
+            from previous versions of the benchmark, are older than all
+            others, and ties go to the last file in the list. Merged results
+            are saved to the results file by :func:`write`.
+        """
+        self.__load_complementary_rows()
+        df = concat_results(
+            [self.df, self.__complementary_df]
+            + [Results.read_results(path) for path in paths]
+        )
+        df = df.sort_values(by="timestamp", na_position="first", kind="stable")
+        df = df.drop_duplicates(
+            subset=["problem", "solver", "settings"], keep="last"
+        )
+        self.__set_all_rows(df)
+
+    def __append_to_journal(self, row: Dict[str, Any]) -> None:
+        """Append a results row to the journal, if there is one.
 
-    def has(self, problem: Problem, solver: str, settings: str) -> bool:
+        Args:
+            row: Results row to append.
+        """
+        if self.journal_path is None:
+            return
+        if self.__journal is None:
+            self.__journal = open(self.journal_path, "a", encoding="utf-8")
+        self.__journal.write(json.dumps(row) + "\n")
+        self.__journal.flush()
+
+    def __clear_journal(self) -> None:
+        """Delete the journal once its updates are in the results file."""
+        if self.__journal is not None:
+            self.__journal.close()
+            self.__journal = None
+        if self.journal_path is not None:
+            self.journal_path.unlink(missing_ok=True)
+
+    def has(
+        self,
+        problem: Problem,
+        solver: str,
+        settings: str,
+        inputs: Optional[Dict[str, Optional[str]]] = None,
+    ) -> bool:
         """Check if results contain a given run of a solver on a problem.
 
         Args:
             problem: Test set problem.
             solver: Name of the QP solver.
             settings: Name of the corresponding solver settings.
+            inputs: If set, problem hash, solver version and settings hash of
+                the instance to run now. Results produced from different
+                inputs are then considered stale and not counted.
 
         Returns:
-            True if a result for this instance is present.
+            True if an up-to-date result for this instance is present.
+
+        Note:
+            Inputs that were not recorded, for instance in results from
+            previous versions of the benchmark, are unknown and do not make
+            results stale.
         """
-        return (
-            (self.df["problem"] == problem.name)
-            & (self.df["solver"] == solver)
-            & (self.df["settings"] == settings)
-        ).any()
+        key = (problem.name, solver, settings)
+        if key not in self.__new_rows and key not in self.__index:
+            row = (
+                self.__database.get(key)
+                if self.__database is not None
+                else None
+            )
+            if row is None:
+                return False
+            self.__new_rows[key] = row  # written by another process
+        for column, value in (inputs or {}).items():
+            recorded = self.__get_value(key, column)
+            if value is None or not isinstance(recorded, str):
+                continue  # unknown input
+            if recorded != value:
+                logging.info(
+                    f"Rerunning {problem.name} with {solver} and {settings} "
+                    f"settings as its {column} changed"
+                )
+                return False
+        return True
 
     def is_timeout(
         self, problem: Problem, solver: str, settings: str, time_limit: float
     ) -> bool:
         """Check whether a particular result was a timeout."""
-        runtime = self.df[
-            (self.df["problem"] == problem.name)
-            & (self.df["solver"] == solver)
-            & (self.df["settings"] == settings)
-        ]["runtime"].iat[0]
+        key = (problem.name, solver, settings)
+        runtime = self.__get_value(key, "runtime")
         return runtime > 0.99 * time_limit
 
     def update(
@@ -187,6 +684,8 @@ class Results:
         settings: str,
         solution: qpsolvers.Solution,
         runtime: float,
+        stats: Optional[Dict[str, float]] = None,
+        inputs: Optional[Dict[str, Optional[str]]] = None,
     ) -> None:
         """Update entry for a given (problem, solver) pair.
 
@@ -196,32 +695,99 @@ class Results:
             settings: Solver settings.
             solution: Solution found by the solver.
             runtime: Duration the solver took, in seconds.
+            stats: Optional values for other numeric columns, for instance
+                runtime statistics from repeated solver calls or resources
+                used by the solver.
+            inputs: Optional problem hash, solver version and settings hash
+                the result was produced from, to detect stale results.
+
+        Raises:
+            ResultsError: if a statistic or an input is not a results
+                column.
         """
-        self.df = self.df.drop(
-            self.df.index[
-                (self.df["problem"] == problem.name)
-                & (self.df["solver"] == solver)
-                & (self.df["settings"] == settings)
-            ]
-        )
         found: bool = True if solution.found else False  # make sure not None
-        self.df = pandas.concat(
-            [
-                self.df,
-                pandas.DataFrame(
-                    {
-                        "problem": [problem.name],
-                        "solver": [solver],
-                        "settings": [settings],
-                        "runtime": [runtime],
-                        "found": [found],
-                        "primal_residual": [solution.primal_residual()],
-                        "dual_residual": [solution.dual_residual()],
-                        "duality_gap": [solution.duality_gap()],
-                    }
-                ),
-            ],
-            ignore_index=True,
+        row = {
+            "problem": problem.name,
+            "solver": solver,
+            "settings": settings,
+            "runtime": float(runtime),
+            "found": found,
+            "primal_residual": solution.primal_residual(),
+            "dual_residual": solution.dual_residual(),
+            "duality_gap": solution.duality_gap(),
+            "timestamp": time.time(),
+        }
+        if stats is not None:
+            unknown_columns = set(stats) - set(Results.COLUMNS)
+            if unknown_columns:
+                raise ResultsError(
+                    f"unknown results columns {sorted(unknown_columns)}"
+                )
+            row.update({key: float(value) for key, value in stats.items()})
+        if inputs is not None:
+            unknown_columns = set(inputs) - set(Results.COLUMNS)
+            if unknown_columns:
+                raise ResultsError(
+                    f"unknown results columns {sorted(unknown_columns)}"
+                )
+            row.update(inputs)
+        self.__new_rows[(problem.name, solver, settings)] = row
+        if self.__database is not None:
+            self.__database.upsert([row])
+        self.__append_to_journal(row)
+
+    def __get_found_and_valid(
+        self,
+        primal_tolerances: Dict[str, float],
+        dual_tolerances: Dict[str, float],
+        gap_tolerances: Dict[str, float],
+    ) -> pandas.DataFrame:
+        """Check solutions against the tolerances of their settings.
+
+        Args:
+            primal_tolerances: Primal-residual tolerance for each settings.
+            dual_tolerances: Dual-residual tolerance for each settings.
+            gap_tolerances: Duality-gap tolerance for each settings.
+
+        Returns:
+            Data frame with the solver, settings and found columns of the
+            results, along with a "found_and_valid" column that is true when
+            the solver found a solution that satisfies tolerances.
+        """
+        df = self.df.fillna(value=np.nan)  # replace None by NaN for abs()
+        settings = df["settings"].astype(str)  # map to floats, not categories
+        found_and_valid = (
+            df["found"]
+            & (df["primal_residual"] < settings.map(primal_tolerances))
+            & (df["dual_residual"] < settings.map(dual_tolerances))
+            & (df["duality_gap"] < settings.map(gap_tolerances))
+        )
+        return df[["solver", "settings", "found"]].assign(
+            found_and_valid=found_and_valid
+        )
+
+    @staticmethod
+    def __build_rate_df(
+        df: pandas.DataFrame, success: pandas.Series
+    ) -> pandas.DataFrame:
+        """Build a table of success rates by solver and settings.
+
+        Args:
+            df: Data frame with solver and settings columns.
+            success: Boolean series with the same index as the data frame.
+
+        Returns:
+            Percentage of successes for each solver (row) and settings
+            (column).
+        """
+        return (
+            (100.0 * success.astype(float))
+            .groupby([df["solver"], df["settings"]], observed=True)
+            .mean()
+            .unstack("settings")
+            .rename_axis(index=None, columns=None)
+            .sort_index(axis=0)
+            .sort_index(axis=1)
         )
 
     def build_success_rate_df(
@@ -229,7 +795,7 @@ class Results:
         primal_tolerances: Dict[str, float],
         dual_tolerances: Dict[str, float],
         gap_tolerances: Dict[str, float],
-    ) -> Tuple[pandas.DataFrame, pandas.DataFrame]:
+    ) -> pandas.DataFrame:
         """Build the success-rate data frame.
 
         Args:
@@ -238,45 +804,19 @@ class Results:
             gap_tolerances: Duality-gap tolerance for each settings.
 
         Returns:
-            Success-rate data frames.
+            Success-rate data frame.
         """
-        solvers = set(self.df["solver"].to_list())
-        all_settings = set(self.df["settings"].to_list())
-        df = self.df.fillna(value=np.nan)  # replace None by NaN for abs()
-        found_and_valid = {
-            settings: df["found"]
-            & (df["primal_residual"] < primal_tolerances[settings])
-            & (df["dual_residual"] < dual_tolerances[settings])
-            & (df["duality_gap"] < gap_tolerances[settings])
-            for settings in all_settings
-        }
-        success_rate_df = (
-            pandas.DataFrame(
-                {
-                    settings: {
-                        solver: 100.0
-                        * found_and_valid[settings][
-                            (df["settings"] == settings)
-                            & (df["solver"] == solver)
-                        ]
-                        .astype(float)
-                        .mean()
-                        for solver in solvers
-                    }
-                    for settings in all_settings
-                }
-            )
-            .reindex(columns=sorted(all_settings))
-            .sort_index()
+        df = self.__get_found_and_valid(
+            primal_tolerances, dual_tolerances, gap_tolerances
         )
-        return success_rate_df
+        return self.__build_rate_df(df, df["found_and_valid"])
 
     def build_correct_rate_df(
         self,
         primal_tolerances: Dict[str, float],
         dual_tolerances: Dict[str, float],
         gap_tolerances: Dict[str, float],
-    ) -> Tuple[pandas.DataFrame, pandas.DataFrame]:
+    ) -> pandas.DataFrame:
         """Build the correctness-rate data frame.
 
         Args:
@@ -285,44 +825,12 @@ class Results:
             gap_tolerances: Duality-gap tolerance for each settings.
 
         Returns:
-            Correctness-rate data frames.
+            Correctness-rate data frame.
         """
-        solvers = set(self.df["solver"].to_list())
-        all_settings = set(self.df["settings"].to_list())
-        df = self.df.fillna(value=np.nan)  # replace None by NaN for abs()
-        found_and_valid = {
-            settings: df["found"]
-            & (df["primal_residual"] < primal_tolerances[settings])
-            & (df["dual_residual"] < dual_tolerances[settings])
-            & (df["duality_gap"] < gap_tolerances[settings])
-            for settings in all_settings
-        }
-        correctness_rate_df = (
-            pandas.DataFrame(
-                {
-                    settings: {
-                        solver: 100.0
-                        * (
-                            df[
-                                (df["settings"] == settings)
-                                & (df["solver"] == solver)
-                            ]["found"]
-                            == found_and_valid[settings][
-                                (df["settings"] == settings)
-                                & (df["solver"] == solver)
-                            ]
-                        )
-                        .astype(float)
-                        .mean()
-                        for solver in solvers
-                    }
-                    for settings in all_settings
-                }
-            )
-            .reindex(columns=sorted(all_settings))
-            .sort_index()
+        df = self.__get_found_and_valid(
+            primal_tolerances, dual_tolerances, gap_tolerances
         )
-        return correctness_rate_df
+        return self.__build_rate_df(df, df["found"] == df["found_and_valid"])
 
     def get_shgeom_for_metric_and_settings(
         self,
@@ -343,31 +851,10 @@ class Results:
         Returns:
             Dictionary with the shifted geometric mean of each solver.
         """
-        solvers = set(self.df["solver"].to_list())
-        means = {}
-        for solver in solvers:
-            solver_df = self.df[
-                (self.df["solver"] == solver)
-                & (self.df["settings"] == settings)
-            ]
-            column_values = np.array(
-                [
-                    (
-                        solver_df.at[i, metric]
-                        if solver_df.at[i, "found"]
-                        else not_found_value
-                    )
-                    for i in solver_df.index
-                ]
-            )
-            try:
-                means[solver] = shgeom(column_values, shift)
-            except BenchmarkError as exn:
-                raise BenchmarkError(
-                    f"Cannot evaluate mean for {settings=} of {solver=}"
-                ) from exn
-        best_mean = np.min(list(means.values()))
-        return {solver: means[solver] / best_mean for solver in solvers}
+        shgeom_df = self.build_shgeom_df(
+            metric, shift, not_found_values={settings: not_found_value}
+        )
+        return shgeom_df[settings].to_dict()
 
     def build_shgeom_df(
         self, metric: str, shift: float, not_found_values: Dict[str, float]
@@ -382,21 +869,40 @@ class Results:
                 for the runtime of a solver that fails to solve a problem.
 
         Returns:
-            Shifted geometric mean of the prescribed column.
+            Shifted geometric mean of the prescribed column, for each solver
+            (row) and settings (column), relative to the best solver for
+            these settings.
+
+        Raises:
+            BenchmarkError: if the metric has negative values.
         """
-        all_settings = set(self.df["settings"].to_list())
-        return (
-            pandas.DataFrame(
-                {
-                    settings: self.get_shgeom_for_metric_and_settings(
-                        metric,
-                        settings,
-                        shift=shift,
-                        not_found_value=not_found_values[settings],
-                    )
-                    for settings in all_settings
-                }
+        df = self.df
+        values = pandas.Series(
+            np.where(
+                df["found"].astype(bool),
+                df[metric].astype(float),
+                df["settings"].map(not_found_values).astype(float),
+            ),
+            index=df.index,
+        )
+        try:
+            means = grouped_shgeom(
+                values, [df["solver"], df["settings"]], shift
             )
-            .reindex(columns=sorted(all_settings))
-            .sort_index()
+        except BenchmarkError as exn:
+            first_negative = df[values < 0.0].iloc[:1]
+            solver, settings = (
+                first_negative[["solver", "settings"]].iloc[0]
+                if not first_negative.empty
+                else (None, None)
+            )
+            raise BenchmarkError(
+                f"Cannot evaluate mean for {settings=} of {solver=}"
+            ) from exn
+        shgeom_df = (
+            means.unstack("settings")
+            .rename_axis(index=None, columns=None)
+            .sort_index(axis=0)
+            .sort_index(axis=1)
         )
+        return shgeom_df / shgeom_df.min(axis=0, skipna=False)
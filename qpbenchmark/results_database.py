@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Results stored in an SQLite database."""
+
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+import pandas
+
+SQL_TYPES = {bool: "INTEGER", float: "REAL", str: "TEXT"}
+
+
+def to_sql_value(value: Any) -> Any:
+    """Convert a value to a type supported by SQLite.
+
+    Args:
+        value: Value from a results row, possibly a NumPy scalar.
+
+    Returns:
+        Python version of the value.
+    """
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class ResultsDatabase:
+    """Results stored in an SQLite database, one row per instance.
+
+    Rows are indexed by their (problem, solver, settings) primary key, and
+    each update is an upsert committed in its own transaction. Several
+    processes on the same machine can thus write to the same database.
+
+    Attributes:
+        columns: Names and types of the results columns.
+        path: Path to the database file.
+
+    Note:
+        SQLite locking is not reliable on network file systems. To run on
+        several machines, write to a database per machine and merge them.
+    """
+
+    columns: Dict[str, type]
+    path: Path
+
+    def __init__(self, path: Union[str, Path], columns: Dict[str, type]):
+        """Open database, creating its results table if needed.
+
+        Args:
+            path: Path to the database file.
+            columns: Names and types of the results columns, starting with the
+                problem, solver and settings columns of the primary key.
+        """
+        self.__connection = sqlite3.connect(path, timeout=60.0)
+        self.columns = columns
+        self.path = Path(path)
+        with self.__connection:
+            self.__connection.execute("PRAGMA journal_mode=WAL")
+            self.__create_table()
+
+    def __create_table(self) -> None:
+        """Create results table, or add columns missing from it."""
+        definitions = ", ".join(
+            f"{column} {SQL_TYPES[column_type]}"
+            for column, column_type in self.columns.items()
+        )
+        self.__connection.execute(
+            f"CREATE TABLE IF NOT EXISTS results ({definitions}, "
+            "PRIMARY KEY (problem, solver, settings))"
+        )
+        existing_columns = set(
+            row[1]
+            for row in self.__connection.execute("PRAGMA table_info(results)")
+        )
+        for column, column_type in self.columns.items():
+            if column not in existing_columns:  # from a previous version
+                self.__connection.execute(
+                    f"ALTER TABLE results ADD COLUMN "
+                    f"{column} {SQL_TYPES[column_type]}"
+                )
+
+    def close(self) -> None:
+        """Close connection to the database."""
+        self.__connection.close()
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[Dict[str, Any]]:
+        """Get the row of an instance.
+
+        Args:
+            key: Tuple of problem name, solver name and settings name.
+
+        Returns:
+            Row of the instance, or None if it is not in the database.
+        """
+        cursor = self.__connection.execute(
+            "SELECT * FROM results "
+            "WHERE problem = ? AND solver = ? AND settings = ?",
+            key,
+        )
+        values = cursor.fetchone()
+        if values is None:
+            return None
+        names = [description[0] for description in cursor.description]
+        row = dict(zip(names, values))
+        row["found"] = bool(row["found"])
+        return row
+
+    def read(self) -> pandas.DataFrame:
+        """Read all rows of the database.
+
+        Returns:
+            Results data frame.
+        """
+        df = pandas.read_sql_query("SELECT * FROM results", self.__connection)
+        return df.astype({"found": bool})
+
+    def upsert(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Insert or replace rows in a single transaction.
+
+        Args:
+            rows: Rows to insert, replacing existing rows of the same
+                instances. Missing columns are set to NULL.
+        """
+        columns = list(self.columns)
+        with self.__connection:
+            self.__connection.executemany(
+                f"INSERT OR REPLACE INTO results ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)})",
+                (
+                    [to_sql_value(row.get(column)) for column in columns]
+                    for row in rows
+                ),
+            )
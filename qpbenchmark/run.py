@@ -6,28 +6,78 @@
 
 """Main function of the benchmark."""
 
+import math
+from contextlib import nullcontext
+from functools import partial
+from itertools import product
+from pathlib import Path
 from time import perf_counter
-from typing import Optional
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-import qpsolvers
-from qpsolvers.exceptions import SolverNotFound
-from tqdm import tqdm
-
-from .results import Results
+from .prefetcher import Prefetcher
 from .spdlog import logging
 from .test_set import TestSet
-from .utils import time_solve_problem
+
+if TYPE_CHECKING:
+    from .problem import Problem
+    from .results import Results
+
+# Fraction of the expected duration of a parallel run above which instances
+# are considered long, and scheduled in a first pass over the test set
+LONG_INSTANCE_FRACTION = 0.01
+
+
+def iter_until_seen(
+    problems: Iterable["Problem"], names: Set[str]
+) -> Iterator["Problem"]:
+    """Yield problems until all those with given names have been yielded.
+
+    Args:
+        problems: Iterable of problems, for instance a test set.
+        names: Names of the problems to wait for.
+
+    Returns:
+        Iterator over the problems, that stops loading them right after the
+        last one with a name in the set.
+    """
+    remaining = set(names)
+    if not remaining:
+        return
+    for problem in problems:
+        yield problem
+        remaining.discard(problem.name)
+        if not remaining:
+            return
 
 
 def run(
     test_set: TestSet,
-    results: Results,
+    results: "Results",
     only_problem: Optional[str] = None,
     only_settings: Optional[str] = None,
     only_solver: Optional[str] = None,
     rerun: bool = False,
     rerun_timeouts: bool = False,
     verbose: bool = False,
+    jobs: int = 1,
+    isolate: bool = False,
+    nb_warmups: int = 0,
+    nb_timings: int = 1,
+    target_rel_ci: Optional[float] = None,
+    prefetch: int = 0,
+    strict_timing: bool = False,
+    shard: Optional[Tuple[int, int]] = None,
+    work_queue: Optional[Union[str, Path]] = None,
 ) -> None:
     """Run a given test set and store results.
 
@@ -37,10 +87,68 @@ def run(
         only_problem: If set, only run that specific problem in the set.
         only_settings: If set, only run with these solver settings.
         only_solver: If set, only run that specific solver.
-        rerun: If set, rerun instances that already have a result.
+        rerun: If set, rerun instances that already have a result. Results
+            produced from a different problem, solver version or solver
+            settings than the present ones are rerun in any case.
         rerun_timeouts: If set, also rerun known timeouts.
         verbose: If set, log info messages for each QP solver call.
+        jobs: Number of worker processes solving instances in parallel, each
+            pinned to its own CPU core. The default value of one solves
+            instances sequentially in the calling process, which is
+            recommended for timing-sensitive runs. Parallel runs dispatch
+            instances with the longest expected runtime first, see the note
+            below.
+        isolate: If set, solve each instance in a child process that is killed
+            when it reaches the time limit of its settings. Crashes in native
+            solver code are then recorded as failures rather than stopping the
+            benchmark.
+        nb_warmups: Number of untimed solver calls before timed ones.
+        nb_timings: Maximum number of timed solver calls per instance. When
+            there are more than one, the runtime of an instance is the median
+            over calls, and its minimum and interquartile range are recorded
+            as well.
+        target_rel_ci: If set, stop timing an instance once the relative width
+            of the confidence interval on its median runtime is below this
+            value.
+        prefetch: Number of problems loaded ahead of time by a background
+            thread while solvers run. The default value of zero loads each
+            problem once the previous one is done.
+        strict_timing: If set, pause prefetching while solver calls are
+            timed, so that it does not compete with solvers for the CPU.
+        shard: If set, pair ``(i, N)`` to only run the i-th of N shards of
+            the test set, with i between 0 and N - 1. Shards are disjoint sets
+            of problems with similar total sizes.
+        work_queue: If set, path to a queue directory shared by several
+            benchmark processes, possibly on different machines. Each problem
+            is then only run by the first process that claims it.
+
+    Note:
+        Problems are streamed from the test set, so that the order of
+        parallel runs is only approximately longest-first: the worker pool
+        dispatches the longest instance among those it has been submitted,
+        and its submission window is bounded. To start long instances
+        early, parallel runs make a first pass over the test set for
+        instances expected to take more than ``LONG_INSTANCE_FRACTION`` of
+        the run per worker, then a second pass for the others. Each pass
+        stops loading the test set after its last selected problem, so that
+        only problems up to the last one with a long instance are loaded
+        twice.
     """
+    # Solver backends are only imported when running, not with the package
+    import qpsolvers
+    from qpsolvers.exceptions import SolverNotFound
+    from tqdm import tqdm
+
+    from .cost_model import CostModel
+    from .run_metadata import update_run_metadata
+    from .sharding import WorkQueue, get_shard_problems
+    from .solver_pool import SolverPool
+    from .utils import get_solver_versions, time_solve_instance
+
+    if jobs < 1:
+        raise ValueError(f"invalid number of jobs {jobs=}")
+    if prefetch < 0:
+        raise ValueError(f"invalid number of problems to prefetch {prefetch=}")
     if only_settings and only_settings not in test_set.solver_settings:
         raise ValueError(
             f"settings '{only_settings}' not in the list of settings "
@@ -63,94 +171,233 @@ def run(
         if only_settings is None or settings == only_settings
     ]
 
+    # Probe the host and solvers once, so that reports do not have to
+    if results.metadata_path is not None:
+        run_metadata = update_run_metadata(
+            results.metadata_path, filtered_solvers
+        )
+        solver_versions = run_metadata["solver_versions"]
+    else:  # no file to record metadata to
+        solver_versions = get_solver_versions(set(filtered_solvers))
+
+    def get_inputs(problem, solver, settings) -> Dict[str, Optional[str]]:
+        """Get the inputs a result depends on, to detect stale results."""
+        return {
+            "problem_hash": problem.get_content_hash(),
+            "solver_version": solver_versions.get(solver),
+            "settings_hash": test_set.solver_settings[settings].get_hash(
+                solver
+            ),
+        }
+
+    # Problems of the test set selected for this run
+    manifest = test_set.manifest()
+    shard_problems = (
+        get_shard_problems(manifest, *shard) if shard is not None else None
+    )
+    selected_problems = [
+        info
+        for info in manifest
+        if (not only_problem or info.name == only_problem)
+        and (shard_problems is None or info.name in shard_problems)
+    ]
+
+    # Expected runtime of each instance, to schedule them and estimate ETAs
+    cost_model = CostModel(manifest, results.df)
+    costs = {
+        (info.name, solver, settings): cost_model.predict(
+            info.name, solver, settings, test_set.tolerances[settings].runtime
+        )
+        for info in selected_problems
+        for solver, settings in product(filtered_solvers, filtered_settings)
+    }
+    total_cost = sum(costs.values())
+    problem_instances: Dict[str, List[Tuple[str, str, float]]] = {}
+    for (name, solver, settings), cost in costs.items():
+        problem_instances.setdefault(name, []).append((solver, settings, cost))
+
+    # Parallel runs start with long instances, so that they don't end up
+    # running alone at the end of the benchmark, then run the others
+    passes = [(0.0, math.inf)]
+    if jobs > 1:
+        threshold = LONG_INSTANCE_FRACTION * total_cost / jobs
+        if any(cost < threshold for cost in costs.values()) and any(
+            cost >= threshold for cost in costs.values()
+        ):
+            passes = [(threshold, math.inf), (0.0, threshold)]
+
     nb_calls = 0
-    nb_calls_since_last_save = 0
+    nb_instances_done = 0
     start_counter = perf_counter()
-    last_save = perf_counter()
 
     progress_bar = None
     if not verbose:
-        nb_problems = 1 if only_problem else test_set.count_problems()
-        nb_solvers = len(filtered_solvers)
-        nb_settings = len(filtered_settings)
         progress_bar = tqdm(
-            total=nb_problems * nb_solvers * nb_settings,
-            initial=0,
+            total=total_cost,
+            bar_format="{l_bar}{bar}| [{elapsed}<{remaining}]",
+            desc=f"0/{len(costs)} instances",
         )
 
-    for problem in test_set:
-        if only_problem and problem.name != only_problem:
-            continue
-        for solver in filtered_solvers:
-            for settings in filtered_settings:
-                time_limit = test_set.tolerances[settings].runtime
-                if results.has(problem, solver, settings):
-                    if not rerun:
-                        logging.debug(
-                            f"{problem.name} already solved by {solver} "
-                            f"with {settings} settings..."
+    def advance(problem, solver, settings, solved: bool) -> None:
+        """Advance progress bar by the expected cost of an instance.
+
+        Instances that are not solved are removed from the total rather than
+        counted as progress, so that they don't make the ETA optimistic.
+        """
+        nonlocal nb_instances_done
+        if progress_bar is None:
+            return
+        nb_instances_done += 1
+        cost = costs.get((problem.name, solver, settings), 0.0)
+        if solved:
+            progress_bar.update(cost)
+        else:  # skipped instance
+            progress_bar.total = max(progress_bar.total - cost, 0.0)
+        progress_bar.set_description_str(
+            f"{nb_instances_done}/{len(costs)} instances"
+        )
+
+    def record(
+        problem, solver, settings, solution, runtime, stats: Dict[str, float]
+    ) -> None:
+        """Record the outcome of a QP solver call."""
+        nonlocal nb_calls
+        nb_calls += 1
+        inputs = get_inputs(problem, solver, settings)
+        results.update(
+            problem, solver, settings, solution, runtime, stats, inputs
+        )
+        advance(problem, solver, settings, solved=True)
+
+    solve = partial(
+        time_solve_instance,
+        isolate=isolate,
+        nb_warmups=nb_warmups,
+        nb_timings=nb_timings,
+        target_rel_ci=target_rel_ci,
+    )
+    pool = SolverPool(jobs, solve) if jobs > 1 else None
+    queue = WorkQueue(work_queue) if work_queue is not None else None
+    prefetcher = None
+    try:
+        for min_cost, max_cost in passes:
+            # Only load the test set up to the last problem of the pass
+            pass_problems = iter_until_seen(
+                test_set,
+                {
+                    name
+                    for (name, _, _), cost in costs.items()
+                    if min_cost <= cost < max_cost
+                },
+            )
+            prefetcher = (
+                Prefetcher(pass_problems, prefetch) if prefetch > 0 else None
+            )
+            problems = prefetcher if prefetcher is not None else pass_problems
+            timed_region = (
+                prefetcher.paused
+                if prefetcher is not None and strict_timing
+                else nullcontext
+            )
+            for problem in problems:
+                instances = [
+                    (solver, settings, cost)
+                    for solver, settings, cost in problem_instances.get(
+                        problem.name, []
+                    )
+                    if min_cost <= cost < max_cost
+                ]
+                if not instances:
+                    continue  # problem not selected or in another pass
+                if queue is not None and not queue.claim(problem.name):
+                    logging.debug(f"{problem.name} claimed by another run")
+                    for solver, settings, _ in instances:
+                        advance(problem, solver, settings, solved=False)
+                    continue
+                for solver, settings, cost in instances:
+                    time_limit = test_set.tolerances[settings].runtime
+                    inputs = get_inputs(problem, solver, settings)
+                    if results.has(problem, solver, settings, inputs):
+                        if not rerun:
+                            logging.debug(
+                                f"{problem.name} already solved by {solver} "
+                                f"with {settings} settings..."
+                            )
+                            advance(problem, solver, settings, solved=False)
+                            continue
+                        if not rerun_timeouts and results.is_timeout(
+                            problem, solver, settings, time_limit
+                        ):
+                            logging.info(
+                                f"Skipping {problem.name} with {solver} and "
+                                f"{settings} settings as a previous timeout..."
+                            )
+                            advance(problem, solver, settings, solved=False)
+                            continue
+                    if test_set.skip_solver_issue(problem, solver):
+                        failure = (
+                            problem,
+                            solver,
+                            settings,
+                            qpsolvers.Solution(problem),
+                            0.0,
                         )
-                        if progress_bar is not None:
-                            # We don't count existing results beforehand
-                            progress_bar.update(1)
+                        results.update(*failure, inputs=inputs)
+                        advance(problem, solver, settings, solved=False)
                         continue
-                    if not rerun_timeouts and results.is_timeout(
-                        problem, solver, settings, time_limit
+                    if test_set.skip_solver_timeout(
+                        time_limit, problem, solver, settings
                     ):
+                        failure = (
+                            problem,
+                            solver,
+                            settings,
+                            qpsolvers.Solution(problem),
+                            0.0,
+                        )
+                        results.update(*failure, inputs=inputs)
+                        advance(problem, solver, settings, solved=False)
+                        continue
+                    if verbose:
                         logging.info(
-                            f"Skipping {problem.name} with {solver} and "
-                            f"{settings} settings as a previous timeout..."
+                            f"Solving {problem.name} by {solver} "
+                            f"with {settings} settings..."
+                        )
+                    kwargs = test_set.solver_settings[settings][solver]
+                    if pool is not None:
+                        pool.submit(
+                            problem, solver, settings, kwargs, time_limit, cost
                         )
-                        if progress_bar is not None:
-                            # We don't count existing results beforehand
-                            progress_bar.update(1)
+                        for instance in pool.collect(pool.max_pending):
+                            record(*instance)
                         continue
-                if test_set.skip_solver_issue(problem, solver):
-                    failure = (
-                        problem,
-                        solver,
-                        settings,
-                        qpsolvers.Solution(problem),
-                        0.0,
-                    )
-                    results.update(*failure)
-                    if progress_bar is not None:
-                        progress_bar.update(1)
-                    continue
-                if test_set.skip_solver_timeout(
-                    time_limit, problem, solver, settings
-                ):
-                    failure = (
-                        problem,
-                        solver,
-                        settings,
-                        qpsolvers.Solution(problem),
-                        0.0,
-                    )
-                    results.update(*failure)
-                    if progress_bar is not None:
-                        progress_bar.update(1)
-                    continue
-                if verbose:
-                    logging.info(
-                        f"Solving {problem.name} by {solver} "
-                        f"with {settings} settings..."
-                    )
-                kwargs = test_set.solver_settings[settings][solver]
-                solution, runtime = time_solve_problem(
-                    problem, solver, **kwargs
-                )
-                nb_calls += 1
-                nb_calls_since_last_save += 1
-                results.update(problem, solver, settings, solution, runtime)
-                if progress_bar is not None:
-                    progress_bar.update(1)
-
-        # Save results to file after problem has been fully processed
-        if perf_counter() - last_save > 10.0 and nb_calls_since_last_save > 0:
-            results.write()
-            last_save = perf_counter()
-            nb_calls_since_last_save = 0
+                    with timed_region():
+                        solution, runtime, stats = solve(
+                            problem, solver, kwargs, time_limit
+                        )
+                    record(problem, solver, settings, solution, runtime, stats)
+
+                # Release dense and sparse conversions of the problem
+                problem.clear_cache()
+
+            if prefetcher is not None:
+                prefetcher.close()
+                prefetcher = None
+
+        if pool is not None:
+            for instance in pool.collect():
+                record(*instance)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if prefetcher is not None:
+            prefetcher.close()
+
+    # Results are journaled as they come, compact them into the results file
+    if results.file_path is not None:
+        results.write()
+    if queue is not None:
+        queue.complete()
 
     duration = perf_counter() - start_counter
     logging.info(f"Ran the test set in {duration:.0f} seconds")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Metadata on the host and solvers that produced benchmark results."""
+
+import datetime
+import json
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .spdlog import logging
+from .utils import get_host_info, get_solver_versions
+from .version import get_version
+
+
+def capture_run_metadata(solvers: Iterable[str]) -> Dict[str, Any]:
+    """Capture metadata on the calling host and solvers.
+
+    Args:
+        solvers: Names of the solvers to get the version of.
+
+    Returns:
+        Dictionary with the benchmark and qpsolvers versions, the date, the
+        host information from :func:`utils.get_host_info` and solver versions.
+    """
+    return {
+        "benchmark_version": get_version(),
+        "date": str(datetime.datetime.now(datetime.timezone.utc)),
+        "host": get_host_info(),
+        "qpsolvers_version": metadata.version("qpsolvers"),
+        "solver_versions": get_solver_versions(set(solvers)),
+    }
+
+
+def read_run_metadata(path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """Read run metadata from a file.
+
+    Args:
+        path: Path to the metadata JSON file.
+
+    Returns:
+        Run metadata, or None if the file does not exist or is invalid.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as exn:
+        logging.warning("Could not read run metadata '%s': %s", path, exn)
+        return None
+
+
+def update_run_metadata(
+    path: Union[str, Path], solvers: Iterable[str]
+) -> Dict[str, Any]:
+    """Capture run metadata and save it to a file.
+
+    Args:
+        path: Path to the metadata JSON file.
+        solvers: Names of the solvers about to run.
+
+    Returns:
+        Updated run metadata.
+
+    Note:
+        Versions of solvers that are not part of this run are kept from the
+        previous metadata file, if any, as their results are kept as well.
+    """
+    run_metadata = capture_run_metadata(solvers)
+    previous = read_run_metadata(path)
+    if previous is not None:
+        previous_cpu = previous.get("host", {}).get("cpu_info", {})
+        current_cpu = run_metadata["host"]["cpu_info"]
+        if previous_cpu.get("brand_raw") != current_cpu.get("brand_raw"):
+            logging.warning(
+                "Previous results in '%s' were produced on a different CPU "
+                "(%s), they will be reported with the present one (%s)",
+                path,
+                previous_cpu.get("brand_raw"),
+                current_cpu.get("brand_raw"),
+            )
+        run_metadata["solver_versions"] = {
+            **previous.get("solver_versions", {}),
+            **run_metadata["solver_versions"],
+        }
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(run_metadata, fh, indent=4, sort_keys=True)
+    return run_metadata
+
+
+def merge_run_metadata(
+    path: Union[str, Path], paths: Iterable[Union[str, Path]]
+) -> Optional[Dict[str, Any]]:
+    """Merge run metadata from several files into one.
+
+    Args:
+        path: Path to the metadata JSON file to write, which is also merged if
+            it exists.
+        paths: Paths to the metadata JSON files to merge.
+
+    Returns:
+        Merged run metadata, or None if there was no metadata to merge.
+
+    Note:
+        Host information is taken from the last file. Merging results from
+        different CPUs is reported as a warning, as reports assume a single
+        host.
+    """
+    all_metadata: List[Dict[str, Any]] = [
+        run_metadata
+        for run_metadata in map(read_run_metadata, [path, *paths])
+        if run_metadata is not None
+    ]
+    if not all_metadata:
+        return None
+    cpus = set(
+        run_metadata.get("host", {}).get("cpu_info", {}).get("brand_raw")
+        for run_metadata in all_metadata
+    )
+    if len(cpus) > 1:
+        logging.warning(
+            "Merging results from different CPUs: %s", sorted(map(str, cpus))
+        )
+    merged = dict(all_metadata[-1])
+    merged["solver_versions"] = {
+        solver: version
+        for run_metadata in all_metadata
+        for solver, version in run_metadata.get("solver_versions", {}).items()
+    }
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(merged, fh, indent=4, sort_keys=True)
+    return merged
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Base class for test sets of parametric QP sequences."""
+
+import abc
+from typing import TYPE_CHECKING, Iterable, Iterator, Tuple
+
+from .test_set import TestSet
+
+if TYPE_CHECKING:  # qpsolvers is only imported once problems are built
+    from .problem import Problem
+
+
+class SequenceTestSet(TestSet):
+    """Abstract base class for a test set of parametric QP sequences.
+
+    A sequence is a list of problems solved one after the other, for instance
+    the QPs of a model predictive controller over successive time steps. They
+    usually share cost and constraint matrices and only differ in their
+    vectors, so that solvers can warm-start each problem from the solution
+    to the previous one.
+
+    Iterating over the test set yields the problems of all sequences, so that
+    it can also be run as a regular test set of independent problems.
+    """
+
+    @abc.abstractmethod
+    def sequences(self) -> Iterator[Tuple[str, Iterable["Problem"]]]:
+        """Yield test-set sequences one by one.
+
+        Returns:
+            Iterator over pairs of sequence name and problems of the sequence,
+            in the order they should be solved. Problem names should be unique
+            across sequences.
+        """
+
+    def __iter__(self) -> Iterator["Problem"]:
+        """Yield problems of all sequences one by one."""
+        for _, problems in self.sequences():
+            yield from problems
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Split benchmark runs across processes or machines."""
+
+import json
+import os
+import socket
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple, Union
+
+from .cost_model import get_problem_size
+from .problem_info import ProblemInfo
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse a shard specification.
+
+    Args:
+        value: Shard specification "i/N", where N is the number of shards and
+            i is the index of the shard, between 0 and N - 1.
+
+    Returns:
+        Pair ``(index, count)`` of shard index and number of shards.
+
+    Raises:
+        ValueError: if the specification is invalid.
+    """
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError as exn:
+        raise ValueError(
+            f"invalid shard '{value}', expected 'i/N' e.g. '0/4'"
+        ) from exn
+    if not 0 <= index < count:
+        raise ValueError(
+            f"invalid shard '{value}', index should be between 0 and {count-1}"
+        )
+    return index, count
+
+
+def get_shard_problems(
+    manifest: List[ProblemInfo], index: int, count: int
+) -> Set[str]:
+    """Get the names of the problems in a shard of a test set.
+
+    Problems are assigned, from largest to smallest, to the shard with the
+    smallest total problem size so far. The partition only depends on the
+    manifest, so that all shards of a test set agree on it.
+
+    Args:
+        manifest: Metadata of the problems in the test set.
+        index: Index of the shard, between 0 and ``count - 1``.
+        count: Number of shards.
+
+    Returns:
+        Names of the problems in the shard.
+    """
+    loads = [0.0] * count
+    problems: Set[str] = set()
+    for info in sorted(
+        manifest, key=lambda info: (-get_problem_size(info), info.name)
+    ):
+        shard = min(range(count), key=lambda i: (loads[i], i))
+        loads[shard] += get_problem_size(info)
+        if shard == index:
+            problems.add(info.name)
+    return problems
+
+
+class WorkQueue:
+    """Work queue shared by benchmark processes through a directory.
+
+    Each problem is solved by the first process that claims it. Claims are
+    lock files created atomically in the queue directory, which can be on a
+    network file system shared by several machines.
+
+    Attributes:
+        path: Path to the queue directory.
+
+    Note:
+        Claims are kept after problems are solved, so that a queue directory
+        corresponds to a single benchmark campaign. Claims of processes that
+        stopped before calling :func:`complete` are reclaimed by processes on
+        the same machine, while claims from other machines need to be deleted
+        from the directory by hand. Reclaiming is not atomic: restart a single
+        process per machine after a crash.
+    """
+
+    path: Path
+
+    def __init__(self, path: Union[str, Path]):
+        """Open work queue, creating its directory if needed.
+
+        Args:
+            path: Path to the queue directory.
+        """
+        self.__claimed: Set[str] = set()
+        self.__hostname = socket.gethostname()
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def __get_lock_path(self, name: str) -> Path:
+        """Get path to the lock file of a problem.
+
+        Args:
+            name: Name of the problem.
+
+        Returns:
+            Path to the lock file.
+        """
+        return self.path / f"{name}.lock"
+
+    def __is_orphan(self, lock_path: Path) -> bool:
+        """Check whether a claim belongs to a stopped process on this host.
+
+        Args:
+            lock_path: Path to the lock file of the claim.
+
+        Returns:
+            True if the claim was made from this host by a process that is not
+            running any more.
+        """
+        try:
+            with open(lock_path, "r", encoding="utf-8") as fh:
+                claim = json.load(fh)
+        except (OSError, json.JSONDecodeError):
+            return False  # claim being written, or deleted in the meantime
+        if claim.get("done") or claim.get("hostname") != self.__hostname:
+            return False
+        try:
+            os.kill(claim["pid"], 0)
+        except ProcessLookupError:
+            return True
+        except (KeyError, PermissionError, TypeError):
+            pass
+        return False
+
+    def claim(self, name: str) -> bool:
+        """Claim a problem for the calling process.
+
+        Args:
+            name: Name of the problem.
+
+        Returns:
+            True if the calling process owns the claim on this problem.
+        """
+        if name in self.__claimed:
+            return True
+        lock_path = self.__get_lock_path(name)
+        if lock_path.exists() and self.__is_orphan(lock_path):
+            lock_path.unlink(missing_ok=True)
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(self.__get_claim(done=False), fh)
+        self.__claimed.add(name)
+        return True
+
+    def __get_claim(self, done: bool) -> Dict[str, Any]:
+        """Get the contents of a lock file from the calling process.
+
+        Args:
+            done: Whether the claimed problem has been solved.
+
+        Returns:
+            Claim dictionary.
+        """
+        return {
+            "done": done,
+            "hostname": self.__hostname,
+            "pid": os.getpid(),
+            "time": time.time(),
+        }
+
+    def complete(self) -> None:
+        """Mark all problems claimed by the calling process as solved."""
+        for name in self.__claimed:
+            with open(self.__get_lock_path(name), "w", encoding="utf-8") as fh:
+                json.dump(self.__get_claim(done=True), fh)
@@ -6,7 +6,10 @@
 
 """Shifted geometric mean."""
 
+from typing import List
+
 import numpy as np
+import pandas
 
 from .exceptions import BenchmarkError
 
@@ -41,3 +44,36 @@ def shgeom(v: np.ndarray, sh: float) -> float:
     if sh < 1.0:
         raise BenchmarkError(f"Invalid shift parameter {sh=}")
     return np.exp(np.sum(np.log(v + sh)) / len(v)) - sh
+
+
+def grouped_shgeom(
+    values: pandas.Series, by: List[pandas.Series], sh: float
+) -> pandas.Series:
+    """Shifted geometric means of values grouped by keys, in a single pass.
+
+    Args:
+        values: Nonnegative values.
+        by: Series of group keys, with the same index as values.
+        sh: Shift parameter.
+
+    Returns:
+        Shifted geometric mean of each group, indexed by group keys.
+
+    Note:
+        Shifted logarithms are computed as ``log(sh) + log1p(v / sh)``, which
+        is more accurate than ``log(v + sh)`` for values small compared to the
+        shift. As with :func:`shgeom`, the mean of a group that contains NaN
+        values is NaN.
+    """
+    v = values.to_numpy(dtype=float)
+    if (v < 0.0).any():
+        raise BenchmarkError(
+            "Cannot compute shifted geometric mean, "
+            f"negative values detected: {v[v < 0.0]}"
+        )
+    if sh < 1.0:
+        raise BenchmarkError(f"Invalid shift parameter {sh=}")
+    logs = pandas.Series(np.log1p(v / sh), index=values.index)
+    means = logs.groupby(by, observed=True).mean()
+    has_nan = logs.isna().groupby(by, observed=True).any()
+    return sh * np.expm1(means.mask(has_nan))
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Pool of worker processes solving benchmark instances in parallel."""
+
+import heapq
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor
+from concurrent.futures import wait as wait_futures
+from itertools import count
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+import qpsolvers
+
+from .problem import Problem
+from .utils import detach_solution, time_solve_instance
+
+
+def get_available_cores() -> List[int]:
+    """Get the list of CPU cores the calling process is allowed to run on.
+
+    Returns:
+        Sorted list of core identifiers.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def pin_worker_to_core(cores: Any) -> None:
+    """Pin the calling worker process to a single CPU core.
+
+    Args:
+        cores: Queue of core identifiers, one per worker.
+
+    Note:
+        Pinning is only available on platforms that provide
+        ``os.sched_setaffinity``, i.e. Linux. Elsewhere workers are left to
+        the scheduler of the operating system.
+    """
+    core = cores.get()
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {core})
+
+
+def solve_instance(
+    solve: Callable[..., Tuple[qpsolvers.Solution, float, Dict[str, float]]],
+    problem: Problem,
+    solver: str,
+    kwargs: Dict[str, Any],
+    time_limit: float,
+) -> Tuple[qpsolvers.Solution, float, Dict[str, float]]:
+    """Solve a problem in a worker process.
+
+    Args:
+        solve: Function called to solve the instance, with the same arguments
+            as :func:`utils.time_solve_instance`.
+        problem: Problem to solve.
+        solver: Name of the backend QP solver to call.
+        kwargs: Keyword arguments forwarded to underlying solver.
+        time_limit: Time limit of the instance settings, in seconds.
+
+    Returns:
+        Solution to the quadratic program, along with the time the solver took
+        to compute it and runtime statistics. The solution is detached from
+        its problem, which the parent process already has, and from
+        solver-specific extras, which may not be picklable.
+    """
+    solution, runtime, stats = solve(problem, solver, kwargs, time_limit)
+    return detach_solution(solution), runtime, stats
+
+
+class SolverPool:
+    """Pool of worker processes, each pinned to its own CPU core.
+
+    Submitted instances are dispatched to workers as they become idle, the
+    instance with the largest expected cost first. Starting long instances
+    early keeps them from running alone at the end of the benchmark.
+
+    Attributes:
+        max_pending: Maximum number of instances submitted to the pool and not
+            collected yet. This bounds the number of problems held in memory.
+        nb_workers: Number of worker processes.
+        solve: Function called by workers to solve an instance.
+    """
+
+    max_pending: int
+    nb_workers: int
+    solve: Callable[..., Tuple[qpsolvers.Solution, float, Dict[str, float]]]
+
+    def __init__(
+        self,
+        nb_workers: int,
+        solve: Callable[
+            ..., Tuple[qpsolvers.Solution, float, Dict[str, float]]
+        ] = time_solve_instance,
+    ):
+        """Start worker processes.
+
+        Args:
+            nb_workers: Number of worker processes.
+            solve: Function called by workers to solve an instance, with the
+                same arguments as :func:`utils.time_solve_instance`. It needs
+                to be picklable, for instance a partial application of a
+                module-level function.
+        """
+        context = multiprocessing.get_context()
+        available_cores = get_available_cores()
+        cores = context.Queue()
+        for i in range(nb_workers):
+            cores.put(available_cores[i % len(available_cores)])
+        self.__executor = ProcessPoolExecutor(
+            max_workers=nb_workers,
+            mp_context=context,
+            initializer=pin_worker_to_core,
+            initargs=(cores,),
+        )
+        self.__counter = count()  # tie-breaker between equal costs
+        self.__pending: Dict[Future, Tuple[Problem, str, str]] = {}
+        self.__queued: List[Tuple[float, int, Tuple[Any, ...]]] = []
+        self.max_pending = 2 * nb_workers
+        self.nb_workers = nb_workers
+        self.solve = solve
+
+    def __enter__(self) -> "SolverPool":
+        """Enter context."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Shut down worker processes when exiting context."""
+        self.shutdown()
+
+    @property
+    def nb_pending(self) -> int:
+        """Number of instances submitted and not collected yet."""
+        return len(self.__pending) + len(self.__queued)
+
+    def submit(
+        self,
+        problem: Problem,
+        solver: str,
+        settings: str,
+        kwargs: Dict[str, Any],
+        time_limit: float,
+        cost: float = 0.0,
+    ) -> None:
+        """Submit a new instance to the pool.
+
+        Args:
+            problem: Problem to solve.
+            solver: Name of the backend QP solver to call.
+            settings: Name of the solver settings.
+            kwargs: Keyword arguments forwarded to underlying solver.
+            time_limit: Time limit of the instance settings, in seconds.
+            cost: Expected cost of the instance. Queued instances with larger
+                costs are dispatched to workers first.
+        """
+        instance = (problem, solver, settings, kwargs, time_limit)
+        heapq.heappush(self.__queued, (-cost, next(self.__counter), instance))
+        self.__dispatch()
+
+    def __dispatch(self) -> None:
+        """Dispatch queued instances to idle workers."""
+        while self.__queued and len(self.__pending) < self.nb_workers:
+            _, _, instance = heapq.heappop(self.__queued)
+            problem, solver, settings, kwargs, time_limit = instance
+            future = self.__executor.submit(
+                solve_instance, self.solve, problem, solver, kwargs, time_limit
+            )
+            self.__pending[future] = (problem, solver, settings)
+
+    def collect(
+        self, max_pending: int = 0
+    ) -> Iterator[
+        Tuple[Problem, str, str, qpsolvers.Solution, float, Dict[str, float]]
+    ]:
+        """Wait for submitted instances to complete.
+
+        Args:
+            max_pending: Return once at most this number of instances are still
+                pending. The default value of zero waits for all of them.
+
+        Returns:
+            Generator of completed instances, as tuples ``(problem, solver,
+            settings, solution, runtime, stats)`` in order of completion.
+        """
+        while self.nb_pending > max_pending:
+            done, _ = wait_futures(
+                self.__pending.keys(), return_when=FIRST_COMPLETED
+            )
+            completed = [
+                (future, self.__pending.pop(future)) for future in done
+            ]
+            self.__dispatch()  # keep workers busy while we record results
+            for future, (problem, solver, settings) in completed:
+                solution, runtime, stats = future.result()
+                solution.problem = problem
+                yield problem, solver, settings, solution, runtime, stats
+
+    def shutdown(self) -> None:
+        """Shut down worker processes, cancelling pending instances."""
+        self.__executor.shutdown(wait=True, cancel_futures=True)
+        self.__pending.clear()
+        self.__queued.clear()
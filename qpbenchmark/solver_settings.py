@@ -6,6 +6,8 @@
 
 """Solver settings."""
 
+import hashlib
+import json
 from typing import Any, Dict, Iterator, Set
 
 import numpy as np
@@ -60,6 +62,21 @@ class SolverSettings:
         """
         return self.__settings[solver]
 
+    def get_hash(self, solver: str) -> str:
+        """Get a hash of the settings dictionary of a given solver.
+
+        Args:
+            solver: Name of the QP solver.
+
+        Returns:
+            Hexadecimal SHA-256 digest of the solver settings, which does not
+            depend on the order in which parameters were set.
+        """
+        serialized = json.dumps(
+            self.__settings[solver], sort_keys=True, default=repr
+        )
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
     def set_eps_abs(self, eps_abs: float) -> None:
         r"""Set absolute tolerances for solvers that support it.
 
@@ -7,16 +7,17 @@
 """Base class for test sets."""
 
 import abc
-from typing import Dict, Iterator, Optional, Set, Tuple
-
-import qpsolvers
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple
 
 from .exceptions import ProblemNotFound
-from .problem import Problem
+from .problem_info import ProblemInfo
 from .solver_settings import SolverSettings
 from .spdlog import logging
 from .tolerance import Tolerance
 
+if TYPE_CHECKING:  # qpsolvers is only imported once problems are built
+    from .problem import Problem
+
 
 class TestSet(abc.ABC):
     """Abstract base class for a test set.
@@ -28,13 +29,16 @@ class TestSet(abc.ABC):
         tolerances: Validation tolerances.
     """
 
+    __manifest: Optional[List[ProblemInfo]]
+    __solvers: Optional[Set[str]]
+
     known_solver_issues: Set[Tuple[str, str]]
     known_solver_timeouts: Dict[Tuple[str, str, str], float]
     solver_settings: Dict[str, SolverSettings]
     tolerances: Dict[str, Tolerance]
 
     @abc.abstractmethod
-    def __iter__(self) -> Iterator[Problem]:
+    def __iter__(self) -> Iterator["Problem"]:
         """Yield test-set problems one by one."""
 
     @property
@@ -129,6 +133,49 @@ class TestSet(abc.ABC):
 
     def __init__(self):
         """Initialize test set."""
+        self.__manifest = None
+        self.known_solver_issues = set()
+        self.known_solver_timeouts = {}
+        self.solver_settings = {}
+        self.__solvers = None
+        self.tolerances = {}
+
+        # Definitions that can be customized by child classes
+        self.define_tolerances()
+        self.define_solver_settings()
+
+        # Check that in fine settings are consistent
+        self.__check_definitions()
+
+    @property
+    def solvers(self) -> Set[str]:
+        """Names of the available solvers to run on the test set.
+
+        Note:
+            Solvers are listed upon first access, so that backend solver
+            modules are only imported by commands that need them.
+        """
+        if self.__solvers is None:
+            self.__solvers = self.__find_solvers()
+        return self.__solvers
+
+    @solvers.setter
+    def solvers(self, solvers: Set[str]) -> None:
+        """Set solvers to run on the test set.
+
+        Args:
+            solvers: Names of the solvers.
+        """
+        self.__solvers = set(solvers)
+
+    def __find_solvers(self) -> Set[str]:
+        """List available solvers with known settings.
+
+        Returns:
+            Names of the solvers.
+        """
+        import qpsolvers  # imports all installed solver backends
+
         candidate_solvers = set(
             qpsolvers.sparse_solvers
             if self.sparse_only
@@ -144,18 +191,7 @@ class TestSet(abc.ABC):
                 f"Solver '{solver}' is available but skipped "
                 "as its settings are unknown"
             )
-        self.known_solver_issues = set()
-        self.known_solver_timeouts = {}
-        self.solver_settings = {}
-        self.solvers = solvers
-        self.tolerances = {}
-
-        # Definitions that can be customized by child classes
-        self.define_tolerances()
-        self.define_solver_settings()
-
-        # Check that in fine settings are consistent
-        self.__check_definitions()
+        return solvers
 
     def __check_definitions(self):
         """Check that settings and tolerance definitions are consistent.
@@ -171,18 +207,32 @@ class TestSet(abc.ABC):
             logging.info(f"Tolerances: {tolerances}")
             raise ValueError("Settings are not consistent with tolerances")
 
+    def manifest(self) -> List[ProblemInfo]:
+        """Get lightweight metadata of all problems in the set.
+
+        This function can be overridden by child test-set classes that can
+        read problem names and dimensions without building problem matrices.
+        The default implementation builds every problem once, then caches
+        the list on the instance.
+
+        Returns:
+            Metadata of each problem in the test set, in iteration order.
+        """
+        if self.__manifest is None:
+            self.__manifest = [
+                ProblemInfo.from_problem(problem) for problem in self
+            ]
+        return self.__manifest
+
     def count_problems(self) -> int:
         """Count the number of problems in the set.
 
         Returns:
             Number of problems in the test set.
         """
-        nb_problems = 0
-        for _ in self:
-            nb_problems += 1
-        return nb_problems
+        return len(self.manifest())
 
-    def get_problem(self, name: str) -> Optional[Problem]:
+    def get_problem(self, name: str) -> Optional["Problem"]:
         """Get a specific test set problem.
 
         Args:
@@ -199,7 +249,7 @@ class TestSet(abc.ABC):
             f"in the {self.__class__.__name__} test set"
         )
 
-    def skip_solver_issue(self, problem: Problem, solver: str) -> bool:
+    def skip_solver_issue(self, problem: "Problem", solver: str) -> bool:
         """Skip known solver issue.
 
         Args:
@@ -219,7 +269,11 @@ class TestSet(abc.ABC):
         return True
 
     def skip_solver_timeout(
-        self, time_limit: float, problem: Problem, solver: str, settings: str
+        self,
+        time_limit: float,
+        problem: "Problem",
+        solver: str,
+        settings: str,
     ) -> bool:
         """Skip known solver timeouts.
 
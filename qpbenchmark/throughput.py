@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Measure solver throughput on parametric QP sequences."""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas
+from qpsolvers.exceptions import SolverNotFound
+
+from .problem import Problem
+from .sequence_test_set import SequenceTestSet
+from .spdlog import logging
+from .utils import time_solve_problem
+
+
+def solve_sequence(
+    problems: Iterable[Problem],
+    solver: str,
+    kwargs: Dict[str, Any],
+    warm_start: bool = True,
+) -> Tuple[List[float], int]:
+    """Solve the problems of a sequence one after the other.
+
+    Args:
+        problems: Problems of the sequence, in order.
+        solver: Name of the QP solver.
+        kwargs: Keyword arguments forwarded to the solver, e.g. settings.
+        warm_start: If set, pass the primal solution of each problem as
+            initial values to the next one. The warm start is reset after a
+            problem the solver failed to solve.
+
+    Returns:
+        Pair of the runtime of each solver call, in seconds, and the number
+        of problems for which the solver found a solution.
+    """
+    initvals: Optional[np.ndarray] = None
+    latencies: List[float] = []
+    nb_found = 0
+    for problem in problems:
+        solution, runtime, _ = time_solve_problem(
+            problem, solver, initvals=initvals, **kwargs
+        )
+        latencies.append(runtime)
+        if solution.found:
+            nb_found += 1
+        initvals = solution.x if warm_start and solution.found else None
+    return latencies, nb_found
+
+
+def measure_throughput(
+    test_set: SequenceTestSet,
+    settings: str,
+    solvers: Optional[Iterable[str]] = None,
+    warm_start: bool = True,
+) -> pandas.DataFrame:
+    """Measure the throughput of solvers on all sequences of a test set.
+
+    Args:
+        test_set: Test set of parametric QP sequences.
+        settings: Name of the solver settings to use.
+        solvers: Names of the solvers to measure, by default all solvers of
+            the test set.
+        warm_start: If set, warm-start each problem of a sequence from the
+            solution to the previous one.
+
+    Returns:
+        Data frame with one row per solver, sorted by decreasing throughput,
+        and columns "solves" (number of problems), "success_rate" (percentage
+        of problems solved), "solves_per_second" (sustained throughput),
+        "latency_median" and "latency_p99" (median and 99th percentile of
+        solver call runtimes, in seconds).
+
+    Raises:
+        SolverNotFound: if a solver is not available for the test set.
+        ValueError: if the settings are not defined by the test set.
+
+    Note:
+        Sustained throughput is the number of problems divided by the time
+        spent in solver calls, so that it does not depend on how fast the
+        test set loads problems.
+    """
+    if settings not in test_set.solver_settings:
+        raise ValueError(
+            f"settings '{settings}' not in the list of settings "
+            f"for this test set: {list(test_set.solver_settings.keys())}"
+        )
+    solver_names = sorted(test_set.solvers if solvers is None else solvers)
+    for solver in solver_names:
+        if solver not in test_set.solvers:
+            raise SolverNotFound(
+                f"solver '{solver}' not in the list of "
+                f"available solvers for this test set: {test_set.solvers}"
+            )
+    latencies: Dict[str, List[float]] = {solver: [] for solver in solver_names}
+    nb_found: Dict[str, int] = {solver: 0 for solver in solver_names}
+    for name, sequence in test_set.sequences():
+        problems = list(sequence)  # shared by all solvers
+        for solver in solver_names:
+            logging.info(
+                "Solving sequence %s (%d problems) by %s with %s settings...",
+                name,
+                len(problems),
+                solver,
+                settings,
+            )
+            sequence_latencies, sequence_found = solve_sequence(
+                problems,
+                solver,
+                test_set.solver_settings[settings][solver],
+                warm_start,
+            )
+            latencies[solver].extend(sequence_latencies)
+            nb_found[solver] += sequence_found
+        for problem in problems:
+            problem.clear_cache()
+    rows = []
+    for solver in solver_names:
+        runtimes = np.array(latencies[solver])
+        if runtimes.size < 1:
+            continue
+        rows.append(
+            {
+                "solver": solver,
+                "solves": runtimes.size,
+                "success_rate": 100.0 * nb_found[solver] / runtimes.size,
+                "solves_per_second": runtimes.size / runtimes.sum(),
+                "latency_median": float(np.median(runtimes)),
+                "latency_p99": float(np.percentile(runtimes, 99.0)),
+            }
+        )
+    df = pandas.DataFrame(
+        rows,
+        columns=[
+            "solver",
+            "solves",
+            "success_rate",
+            "solves_per_second",
+            "latency_median",
+            "latency_p99",
+        ],
+    )
+    return df.sort_values(
+        by="solves_per_second", ascending=False, ignore_index=True
+    )
@@ -42,6 +42,13 @@ class Tolerance:
             return self.dual
         if metric == "duality_gap":
             return self.gap
-        if metric == "runtime":
+        if metric in (
+            "runtime",
+            "runtime_min",
+            "runtime_median",
+            "cpu_time",
+            "cpu_user_time",
+            "cpu_system_time",
+        ):
             return self.runtime
         raise BenchmarkError(f"unknown metric '{metric}'")
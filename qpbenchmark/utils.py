@@ -6,10 +6,14 @@
 
 """Utility functions."""
 
+import multiprocessing
+import os
+import platform
+import sys
 from collections import OrderedDict
 from importlib import import_module, metadata
 from time import perf_counter
-from typing import Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import cpuinfo
 import numpy as np
@@ -18,6 +22,42 @@ import qpsolvers
 from .problem import Problem
 from .spdlog import logging
 
+try:
+    import resource
+except ImportError:  # resource is only available on Unix platforms
+    resource = None  # type: ignore[assignment]
+
+# Unit of the maximum resident set size reported by getrusage, in bytes
+RUSAGE_MAXRSS_UNIT: int = 1 if sys.platform == "darwin" else 1024
+
+# Some solvers don't support read-only inputs, e.g. views on Arrow buffers
+# TODO(scaron): check separately and report an issue for DAQP
+SOLVERS_REQUIRING_WRITABLE_INPUTS: Set[str] = set(["daqp"])
+
+# Setup and solve times reported by solvers in solution extras: path to each
+# time in the extras, and scale factor from its unit to seconds
+REPORTED_TIMES: Dict[str, Dict[str, Tuple[Tuple[str, ...], float]]] = {
+    "clarabel": {
+        "solve_time": (("solve_time",), 1.0),
+    },
+    "osqp": {
+        "setup_time": (("info", "setup_time"), 1.0),
+        "solve_time": (("info", "solve_time"), 1.0),
+    },
+    "piqp": {
+        "setup_time": (("info", "setup_time"), 1.0),
+        "solve_time": (("info", "solve_time"), 1.0),
+    },
+    "proxqp": {
+        "setup_time": (("info", "setup_time"), 1e-6),
+        "solve_time": (("info", "solve_time"), 1e-6),
+    },
+    "scs": {
+        "setup_time": (("setup_time",), 1e-3),
+        "solve_time": (("solve_time",), 1e-3),
+    },
+}
+
 
 def capitalize_settings(name: str) -> str:
     """Capitalize settings name.
@@ -31,13 +71,19 @@ def capitalize_settings(name: str) -> str:
     return name.replace("_", " ").capitalize()
 
 
-def get_cpu_info_summary() -> str:
+def get_cpu_info_summary(cpu_info: Optional[Dict[str, Any]] = None) -> str:
     """Get CPU information summary as a single string.
 
+    Args:
+        cpu_info: CPU information from ``cpuinfo.get_cpu_info()``. Probed from
+            the calling host if not provided.
+
     Returns:
         CPU information as a single string.
     """
-    return cpuinfo.get_cpu_info()["brand_raw"]
+    if cpu_info is None:
+        cpu_info = cpuinfo.get_cpu_info()
+    return cpu_info["brand_raw"]
 
 
 def get_gpu_info_summary() -> str:
@@ -58,13 +104,71 @@ def get_gpu_info_summary() -> str:
         return ""
 
 
-def get_cpu_info_table() -> str:
+def get_cpu_governor() -> Optional[str]:
+    """Get the frequency scaling governor of the first CPU core.
+
+    Returns:
+        Name of the governor, for instance "performance", or None if it is not
+        available on this platform.
+    """
+    path = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor"
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            return fh.read().strip()
+    except OSError:
+        return None
+
+
+def get_blas_info() -> Dict[str, Any]:
+    """Get the configuration of the BLAS library NumPy is linked against.
+
+    Returns:
+        BLAS configuration, for instance its name and version, or an empty
+        dictionary if NumPy does not report it.
+    """
+    try:
+        config = np.show_config(mode="dicts")
+        return dict(config["Build Dependencies"]["blas"])
+    except (KeyError, TypeError):  # NumPy < 1.25 only prints its config
+        return {}
+
+
+def get_host_info() -> Dict[str, Any]:
+    """Get information about the calling host.
+
+    Returns:
+        Dictionary with CPU information from ``cpuinfo``, the number of CPU
+        cores, the frequency scaling governor, the BLAS configuration, the
+        GPU, the platform and the Python version.
+
+    Note:
+        This function spawns a subprocess to probe the CPU and takes about a
+        second to run.
+    """
+    return {
+        "cpu_info": cpuinfo.get_cpu_info(),
+        "cpu_count": os.cpu_count(),
+        "cpu_governor": get_cpu_governor(),
+        "blas": get_blas_info(),
+        "gpu": get_gpu_info_summary(),
+        "platform": platform.platform(),
+        "python_version": platform.python_version(),
+    }
+
+
+def get_cpu_info_table(cpu_info: Optional[Dict[str, Any]] = None) -> str:
     """Get CPU information as a Markdown table.
 
+    Args:
+        cpu_info: CPU information from ``cpuinfo.get_cpu_info()``. Probed from
+            the calling host if not provided.
+
     Returns:
         CPU information as a Markdown table.
     """
-    info = OrderedDict(sorted(cpuinfo.get_cpu_info().items()))
+    if cpu_info is None:
+        cpu_info = cpuinfo.get_cpu_info()
+    info = OrderedDict(sorted(cpu_info.items()))
     skips = set(
         [
             "cpuinfo_version",
@@ -127,9 +231,134 @@ def get_solver_versions(solvers: Set[str]):
     return versions
 
 
+def get_resource_usage() -> Dict[str, float]:
+    """Get resources used by the calling process so far.
+
+    Returns:
+        Dictionary of CPU times in seconds, with keys "cpu_user_time" and
+        "cpu_system_time". When the ``resource`` module is available, it
+        also includes the peak resident set size in bytes ("peak_rss") and
+        the numbers of voluntary and involuntary context switches.
+    """
+    times = os.times()
+    usage = {"cpu_user_time": times.user, "cpu_system_time": times.system}
+    if resource is not None:
+        rusage = resource.getrusage(resource.RUSAGE_SELF)
+        usage["peak_rss"] = float(rusage.ru_maxrss * RUSAGE_MAXRSS_UNIT)
+        usage["voluntary_ctx_switches"] = float(rusage.ru_nvcsw)
+        usage["involuntary_ctx_switches"] = float(rusage.ru_nivcsw)
+    return usage
+
+
+def get_resource_usage_delta(
+    before: Dict[str, float], after: Dict[str, float]
+) -> Dict[str, float]:
+    """Get resources used between two calls to :func:`get_resource_usage`.
+
+    Args:
+        before: Resource usage at the beginning of the period.
+        after: Resource usage at the end of the period.
+
+    Returns:
+        Dictionary of resources used over the period, with keys matching
+        results columns. The peak resident set size is a high-water mark of
+        the process: its delta is zero unless the period used more memory
+        than anything before it in the same process.
+    """
+    delta = {key: after[key] - before[key] for key in before}
+    delta["cpu_time"] = delta["cpu_user_time"] + delta["cpu_system_time"]
+    if "peak_rss" in delta:
+        delta["peak_rss_delta"] = delta.pop("peak_rss")
+    return delta
+
+
+def get_extra(extras: Any, path: Tuple[str, ...]) -> Optional[float]:
+    """Get a numeric value from solver-specific solution extras.
+
+    Args:
+        extras: Solution extras, nesting dictionaries and info objects.
+        path: Keys or attribute names leading to the value.
+
+    Returns:
+        Value at the end of the path, or None if there is no such value.
+    """
+    value = extras
+    for key in path:
+        if isinstance(value, dict):
+            value = value.get(key)
+        else:
+            value = getattr(value, key, None)
+        if value is None:
+            return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_runtime_breakdown(
+    solution: qpsolvers.Solution, solver: str, runtime: float
+) -> Dict[str, float]:
+    """Split the runtime of a solver call into setup, solve and overhead.
+
+    Args:
+        solution: Solution returned by the solver call.
+        solver: Name of the backend QP solver.
+        runtime: Runtime of the whole call to ``qpsolvers.solve_problem``.
+
+    Returns:
+        Dictionary with keys "setup_time", "solve_time" and "overhead_time",
+        matching results columns, in seconds. Setup and solve times are those
+        reported by the solver in solution extras when available, otherwise
+        those measured by qpsolvers around the solver call. Overhead is the
+        rest of the runtime, for instance input conversions, checks and
+        solution construction by the wrapper. Times are NaN when unknown.
+    """
+    times = {
+        "setup_time": getattr(solution, "build_time", None),
+        "solve_time": getattr(solution, "solve_time", None),
+    }
+    for column, (path, scale) in REPORTED_TIMES.get(solver, {}).items():
+        value = get_extra(solution.extras, path)
+        if value is not None:
+            times[column] = scale * value
+    breakdown = {
+        column: float(value) if value is not None else np.nan
+        for column, value in times.items()
+    }
+    breakdown["overhead_time"] = float(
+        np.maximum(
+            runtime - breakdown["setup_time"] - breakdown["solve_time"], 0.0
+        )
+    )
+    return breakdown
+
+
+def prepare_problem(problem: Problem, solver: str) -> Problem:
+    """Convert a problem to the input format of a solver.
+
+    Args:
+        problem: Quadratic program to convert.
+        solver: Name of the backend QP solver to call.
+
+    Returns:
+        Problem with matrices that the solver takes without conversion.
+        Conversions are cached by the problem, so that they are computed once
+        for all solvers and settings.
+    """
+    if (
+        solver in qpsolvers.sparse_solvers
+        and solver not in qpsolvers.dense_solvers
+    ):
+        problem = problem.to_sparse(native_layout=True)
+    if solver in SOLVERS_REQUIRING_WRITABLE_INPUTS:
+        problem = problem.to_writable()
+    return problem
+
+
 def time_solve_problem(
     problem: Problem, solver: str, **kwargs
-) -> Tuple[qpsolvers.Solution, float]:
+) -> Tuple[qpsolvers.Solution, float, Dict[str, float]]:
     """Solve quadratic program.
 
     Args:
@@ -139,14 +368,16 @@ def time_solve_problem(
 
     Returns:
         Solution to the quadratic program, along with the time the solver took
-        to compute it.
+        to compute it and statistics on the call: the resources it used, as
+        returned by :func:`get_resource_usage_delta`, and its runtime
+        breakdown from :func:`get_runtime_breakdown`.
+
+    Note:
+        Matrix conversions for solvers that require sparse inputs are done by
+        :func:`prepare_problem` before timing.
     """
-    # Don't time matrix conversions for solvers that require sparse inputs
-    if (
-        solver in qpsolvers.sparse_solvers
-        and solver not in qpsolvers.dense_solvers
-    ):
-        problem = problem.to_sparse()
+    problem = prepare_problem(problem, solver)
+    usage_before = get_resource_usage()
     start_time = perf_counter()
     try:
         solution = qpsolvers.solve_problem(problem, solver=solver, **kwargs)
@@ -162,7 +393,300 @@ def time_solve_problem(
         )
         solution = qpsolvers.Solution(problem)
     runtime = perf_counter() - start_time
-    return solution, runtime
+    usage = get_resource_usage_delta(usage_before, get_resource_usage())
+    usage.update(get_runtime_breakdown(solution, solver, runtime))
+    return solution, runtime, usage
+
+
+def get_median_rel_ci(runtimes: List[float]) -> float:
+    """Get the relative width of a confidence interval on the median runtime.
+
+    Args:
+        runtimes: Runtimes measured so far.
+
+    Returns:
+        Width of the distribution-free 95% confidence interval on the median,
+        obtained from order statistics, divided by the median. The width is
+        infinite when there are too few samples to bound the interval.
+    """
+    nb_samples = len(runtimes)
+    sorted_runtimes = np.sort(runtimes)
+    half_width = 0.98 * np.sqrt(nb_samples)  # 1.96 * sqrt(n) / 2
+    lower = int(np.floor(nb_samples / 2 - half_width))
+    upper = int(np.ceil(nb_samples / 2 + half_width))
+    median = np.median(sorted_runtimes)
+    if lower < 0 or upper >= nb_samples or median <= 0.0:
+        return np.inf
+    return (sorted_runtimes[upper] - sorted_runtimes[lower]) / median
+
+
+def time_solve_problem_repeatedly(
+    problem: Problem,
+    solver: str,
+    nb_warmups: int,
+    nb_timings: int,
+    time_budget: float,
+    target_rel_ci: Optional[float] = None,
+    before_call: Optional[Callable[[], None]] = None,
+    **kwargs,
+) -> Tuple[qpsolvers.Solution, float, Dict[str, float]]:
+    """Solve quadratic program repeatedly to get robust runtime statistics.
+
+    Args:
+        problem: Quadratic program to solve.
+        solver: Name of the backend QP solver to call.
+        nb_warmups: Number of untimed calls before timed ones, for instance to
+            exclude first-call import and JIT costs.
+        nb_timings: Maximum number of timed calls.
+        time_budget: Stop repeating calls once their cumulative runtime, in
+            seconds, exceeds this budget.
+        target_rel_ci: If set, stop repeating calls once the relative width of
+            the confidence interval on the median runtime is below this value.
+        before_call: If set, function called before each call to the solver.
+        kwargs: Keyword arguments forwarded to underlying solver.
+
+    Returns:
+        Solution from the last timed call, median runtime, and a dictionary of
+        runtime statistics with keys "runtime_min", "runtime_median" and
+        "runtime_iqr". The dictionary also reports median resource usage and
+        runtime breakdown over timed calls, except for the peak memory delta
+        which covers all calls.
+
+    Note:
+        Calls are not repeated once the solver fails to find a solution: at
+        least one call is timed, but failures are not worth timing precisely.
+    """
+    elapsed = 0.0
+    peak_rss_delta = 0.0
+    for _ in range(nb_warmups):
+        if before_call is not None:
+            before_call()
+        solution, runtime, usage = time_solve_problem(
+            problem, solver, **kwargs
+        )
+        peak_rss_delta += usage.get("peak_rss_delta", 0.0)
+        elapsed += runtime
+        if not solution.found or elapsed >= time_budget:
+            break
+    runtimes: List[float] = []
+    usages: List[Dict[str, float]] = []
+    while len(runtimes) < max(nb_timings, 1):
+        if before_call is not None:
+            before_call()
+        solution, runtime, usage = time_solve_problem(
+            problem, solver, **kwargs
+        )
+        peak_rss_delta += usage.get("peak_rss_delta", 0.0)
+        runtimes.append(runtime)
+        usages.append(usage)
+        elapsed += runtime
+        if not solution.found or elapsed >= time_budget:
+            break
+        if (
+            target_rel_ci is not None
+            and get_median_rel_ci(runtimes) <= target_rel_ci
+        ):
+            break
+    q1, median, q3 = np.percentile(runtimes, [25.0, 50.0, 75.0])
+    stats = {
+        "runtime_min": float(np.min(runtimes)),
+        "runtime_median": float(median),
+        "runtime_iqr": float(q3 - q1),
+    }
+    for key in usages[0]:
+        stats[key] = float(np.median([usage[key] for usage in usages]))
+    if "peak_rss_delta" in stats:
+        stats["peak_rss_delta"] = peak_rss_delta
+    return solution, float(median), stats
+
+
+def detach_solution(solution: qpsolvers.Solution) -> qpsolvers.Solution:
+    """Detach a solution from its problem and solver-specific extras.
+
+    Args:
+        solution: Solution to detach.
+
+    Returns:
+        Same solution, lightweight and picklable so that it can be sent back
+        from a child process. The receiving end already has the problem.
+    """
+    solution.problem = None  # type: ignore[assignment]
+    solution.extras = {}
+    return solution
+
+
+def solve_in_child_process(
+    connection: Any,
+    problem: Problem,
+    solver: str,
+    kwargs: Dict[str, Any],
+    nb_warmups: int,
+    nb_timings: int,
+    time_budget: float,
+    target_rel_ci: Optional[float],
+) -> None:
+    """Solve quadratic program and send the outcome to the parent process.
+
+    Args:
+        connection: Sending end of a pipe to the parent process.
+        problem: Quadratic program to solve.
+        solver: Name of the backend QP solver to call.
+        kwargs: Keyword arguments forwarded to underlying solver.
+        nb_warmups: Number of untimed calls before timed ones.
+        nb_timings: Maximum number of timed calls.
+        time_budget: Budget on the cumulative runtime of all calls.
+        target_rel_ci: Target relative confidence interval on the median.
+
+    Note:
+        The child sends "start" before each solver call, so that the parent
+        can enforce its time limit on every call separately.
+    """
+    solution, runtime, stats = time_solve_problem_repeatedly(
+        problem,
+        solver,
+        nb_warmups,
+        nb_timings,
+        time_budget,
+        target_rel_ci,
+        before_call=lambda: connection.send("start"),
+        **kwargs,
+    )
+    connection.send((detach_solution(solution), runtime, stats))
+    connection.close()
+
+
+def time_solve_problem_isolated(
+    problem: Problem,
+    solver: str,
+    timeout: float,
+    nb_warmups: int = 0,
+    nb_timings: int = 1,
+    target_rel_ci: Optional[float] = None,
+    **kwargs,
+) -> Tuple[qpsolvers.Solution, float, Dict[str, float]]:
+    """Solve quadratic program in a child process with a hard time limit.
+
+    Args:
+        problem: Quadratic program to solve.
+        solver: Name of the backend QP solver to call.
+        timeout: Time limit in seconds after which the child process is
+            killed. It applies to each solver call, and also serves as budget
+            on the cumulative runtime of repeated calls.
+        nb_warmups: Number of untimed calls before timed ones.
+        nb_timings: Maximum number of timed calls.
+        target_rel_ci: Target relative confidence interval on the median.
+        kwargs: Keyword arguments forwarded to underlying solver.
+
+    Returns:
+        Solution to the quadratic program, along with the time the solver took
+        to compute it and runtime statistics. When the child process is killed
+        at the time limit, the solution is empty and the runtime is the time
+        limit. When the child process crashes, for instance from a
+        segmentation fault in native solver code, the solution is empty as
+        well.
+
+    Note:
+        The time limit only counts solver calls, so that process startup is
+        not held against the solver.
+    """
+    # Convert in the parent process so that the cached conversion is shared
+    # by child processes of all solvers and settings
+    problem = prepare_problem(problem, solver)
+    context = multiprocessing.get_context()
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=solve_in_child_process,
+        args=(
+            sender,
+            problem,
+            solver,
+            kwargs,
+            nb_warmups,
+            nb_timings,
+            timeout,
+            target_rel_ci,
+        ),
+        daemon=True,
+    )
+    process.start()
+    sender.close()  # so that the receiver sees EOF if the child dies
+    start_time = perf_counter()
+    try:
+        message = receiver.recv()
+        while message == "start":
+            if not receiver.poll(timeout):
+                process.kill()
+                logging.warning(
+                    "Killed solver '%s' on problem '%s' at time limit "
+                    "(%.1f s)",
+                    solver,
+                    problem.name,
+                    timeout,
+                )
+                return qpsolvers.Solution(problem), timeout, {}
+            message = receiver.recv()
+        solution, runtime, stats = message
+        solution.problem = problem
+        return solution, runtime, stats
+    except EOFError:
+        process.join()
+        logging.warning(
+            "Solver '%s' crashed on problem '%s' with exit code %s",
+            solver,
+            problem.name,
+            process.exitcode,
+        )
+        return qpsolvers.Solution(problem), perf_counter() - start_time, {}
+    finally:
+        process.join()
+        receiver.close()
+
+
+def time_solve_instance(
+    problem: Problem,
+    solver: str,
+    kwargs: Dict[str, Any],
+    time_limit: float,
+    isolate: bool = False,
+    nb_warmups: int = 0,
+    nb_timings: int = 1,
+    target_rel_ci: Optional[float] = None,
+) -> Tuple[qpsolvers.Solution, float, Dict[str, float]]:
+    """Solve a benchmark instance with given timing options.
+
+    Args:
+        problem: Quadratic program to solve.
+        solver: Name of the backend QP solver to call.
+        kwargs: Keyword arguments forwarded to underlying solver.
+        time_limit: Time limit of the instance settings, in seconds.
+        isolate: If set, solve in a child process killed at the time limit.
+        nb_warmups: Number of untimed calls before timed ones.
+        nb_timings: Maximum number of timed calls.
+        target_rel_ci: Target relative confidence interval on the median.
+
+    Returns:
+        Solution to the quadratic program, along with the time the solver took
+        to compute it and runtime statistics.
+    """
+    if isolate:
+        return time_solve_problem_isolated(
+            problem,
+            solver,
+            time_limit,
+            nb_warmups,
+            nb_timings,
+            target_rel_ci,
+            **kwargs,
+        )
+    return time_solve_problem_repeatedly(
+        problem,
+        solver,
+        nb_warmups,
+        nb_timings,
+        time_limit,
+        target_rel_ci,
+        **kwargs,
+    )
 
 
 def is_posdef(M: np.ndarray) -> bool:
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Unit tests for the command-line utility."""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from qpbenchmark import Problem, ProblemList, Results
+from qpbenchmark.benchmark import main
+
+# Modules that listing problems should not import, as they are slow to load.
+# pandas is not listed as pyarrow imports it to convert arrays to NumPy.
+HEAVY_MODULES = ("matplotlib", "qpsolvers", "tqdm")
+
+TEST_SET_SOURCE = """
+from qpbenchmark import ParquetTestSet
+
+
+class ImportBudgetTestSet(ParquetTestSet):
+    description = "Import budget test set"
+    sparse_only = False
+    title = "Import budget test set"
+
+    def __init__(self):
+        super().__init__(__file__.replace(".py", ".parquet"))
+"""
+
+
+class TestBenchmark(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.test_set_path = os.path.join(
+            self.tmp_dir, "import_budget_test_set.py"
+        )
+        with open(self.test_set_path, "w", encoding="utf-8") as fh:
+            fh.write(TEST_SET_SOURCE)
+        problem_list = ProblemList()
+        problem_list.append(
+            Problem(
+                P=np.eye(2),
+                q=np.ones(2),
+                G=None,
+                h=None,
+                A=None,
+                b=None,
+                lb=None,
+                ub=None,
+                name="foo",
+            )
+        )
+        problem_list.to_parquet(self.test_set_path.replace(".py", ".parquet"))
+
+    def test_list_problems_import_budget(self):
+        script = (
+            "import sys\n"
+            "from qpbenchmark.benchmark import main\n"
+            f"sys.argv = ['qpbenchmark', {self.test_set_path!r}, "
+            "'list_problems']\n"
+            "main()\n"
+            "heavy = [m for m in %r if m in sys.modules]\n"
+            "print('heavy modules:', heavy)\n" % (HEAVY_MODULES,)
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            text=True,
+        ).stdout
+        self.assertIn("foo", output.splitlines())
+        self.assertIn("heavy modules: []", output)
+
+    def test_filtered_run_report(self):
+        results_path = os.path.join(self.tmp_dir, "results.csv")
+        command = ["qpbenchmark", self.test_set_path]
+        command += ["--results-path", results_path, "run", "--author", "me"]
+        with mock.patch.object(sys, "argv", command + ["--solver", "daqp"]):
+            main()
+        filtered_run = ["--settings", "default", "--solver", "daqp"]
+        with mock.patch.object(sys, "argv", command + filtered_run):
+            main()  # the report covers results with all settings
+
+        report_path = os.path.join(self.tmp_dir, "import_budget_test_set.md")
+        with open(report_path, "r", encoding="utf-8") as fh:
+            self.assertIn("high_accuracy", fh.read())
+        df = Results.read_results(results_path)
+        self.assertEqual(len(df), len(set(df["settings"])))
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Unit tests for the expected cost of benchmark instances."""
+
+import unittest
+
+import pandas
+
+from qpbenchmark.cost_model import CostModel
+from qpbenchmark.problem_info import ProblemInfo
+
+
+class TestCostModel(unittest.TestCase):
+    def setUp(self):
+        self.manifest = [
+            ProblemInfo(name="small", n=10, m_eq=0, m_ineq=0, nnz=0),
+            ProblemInfo(name="medium", n=100, m_eq=0, m_ineq=0, nnz=0),
+            ProblemInfo(name="large", n=1000, m_eq=0, m_ineq=0, nnz=0),
+        ]
+        self.df = pandas.DataFrame(
+            {
+                "problem": ["small", "medium"],
+                "solver": ["foo", "foo"],
+                "settings": ["default", "default"],
+                "runtime": [1e-4, 1e-2],
+            }
+        )
+
+    def test_known_runtime(self):
+        model = CostModel(self.manifest, self.df)
+        self.assertAlmostEqual(model.predict("medium", "foo", "default"), 1e-2)
+
+    def test_power_law(self):
+        model = CostModel(self.manifest, self.df)
+        self.assertAlmostEqual(model.predict("large", "foo", "default"), 1.0)
+        self.assertAlmostEqual(
+            model.predict("large", "foo", "default", time_limit=0.5), 0.5
+        )
+
+    def test_fallbacks(self):
+        model = CostModel(self.manifest, self.df)
+        self.assertAlmostEqual(model.predict("large", "foo", "high"), 1.0)
+        self.assertAlmostEqual(model.predict("large", "bar", "default"), 1.0)
+        empty = CostModel(self.manifest, self.df.iloc[:0])
+        self.assertLess(
+            empty.predict("small", "foo", "default"),
+            empty.predict("large", "foo", "default"),
+        )
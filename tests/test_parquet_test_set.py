@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Unit tests for test sets read from Parquet files."""
+
+import tempfile
+import unittest
+
+import numpy as np
+import pyarrow.parquet
+import scipy.sparse as spa
+
+from qpbenchmark import (
+    ParquetTestSet,
+    Problem,
+    ProblemList,
+    ProblemListWriter,
+)
+
+
+class CustomParquetTestSet(ParquetTestSet):
+    @property
+    def description(self) -> str:
+        return "Unit test Parquet test set"
+
+    @property
+    def title(self) -> str:
+        return "Unit test Parquet test set"
+
+    @property
+    def sparse_only(self) -> bool:
+        return False
+
+
+class TestParquetTestSet(unittest.TestCase):
+    def setUp(self):
+        problem_list = ProblemList()
+        problem_list.append(
+            Problem(
+                P=np.eye(3),
+                q=np.ones(3),
+                G=np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]),
+                h=np.ones(2),
+                A=None,
+                b=None,
+                lb=None,
+                ub=None,
+                name="foo",
+            )
+        )
+        problem_list.append(
+            Problem(
+                P=np.eye(2),
+                q=np.zeros(2),
+                G=None,
+                h=None,
+                A=np.array([[1.0, 1.0]]),
+                b=np.ones(1),
+                lb=None,
+                ub=None,
+                name="bar",
+            )
+        )
+        self.path = tempfile.mktemp(".parquet")
+        problem_list.to_parquet(self.path)
+
+    def test_iter(self):
+        test_set = CustomParquetTestSet(self.path)
+        problems = list(test_set)
+        names = [problem.name for problem in problems]
+        self.assertEqual(names, ["foo", "bar"])
+        self.assertEqual(problems[0].G.shape, (2, 3))
+        self.assertIsNone(problems[1].G)
+
+    def test_sparse(self):
+        problem_list = ProblemList()
+        P = spa.csc_matrix(np.diag([1.0, 0.0, 2.0]))
+        A = spa.csc_matrix(np.array([[1.0, 0.0, 1.0]]))
+        problem_list.append(
+            Problem(
+                P=P,
+                q=np.ones(3),
+                G=None,
+                h=None,
+                A=A,
+                b=np.ones(1),
+                lb=None,
+                ub=None,
+                name="baz",
+            )
+        )
+        path = tempfile.mktemp(".parquet")
+        problem_list.to_parquet(path)
+        test_set = CustomParquetTestSet(path)
+        problem = next(iter(test_set))
+        self.assertTrue(spa.issparse(problem.P))
+        self.assertTrue(spa.issparse(problem.A))
+        self.assertIsNone(problem.G)
+        self.assertEqual(problem.P.shape, (3, 3))
+        self.assertEqual((problem.P != P).nnz, 0)
+        self.assertEqual((problem.A != A).nnz, 0)
+        self.assertEqual(test_set.manifest()[0].nnz, 4)
+
+    def test_writer(self):
+        path = tempfile.mktemp(".parquet")
+        with ProblemListWriter(
+            path, row_group_size=2, compression="zstd"
+        ) as writer:
+            for i in range(5):
+                writer.append(
+                    Problem(
+                        P=np.eye(2),
+                        q=np.full(2, float(i)),
+                        G=None,
+                        h=None,
+                        A=None,
+                        b=None,
+                        lb=-np.ones(2),
+                        ub=np.ones(2),
+                        name=f"problem_{i}",
+                    )
+                )
+        parquet_file = pyarrow.parquet.ParquetFile(path)
+        self.assertEqual(parquet_file.num_row_groups, 3)
+        problems = list(CustomParquetTestSet(path))
+        self.assertEqual(len(problems), 5)
+        self.assertEqual(problems[4].name, "problem_4")
+        self.assertAlmostEqual(problems[3].q[0], 3.0)
+
+    def test_writable(self):
+        problem = next(iter(CustomParquetTestSet(self.path)))
+        self.assertFalse(problem.P.flags.writeable)  # view on Arrow buffer
+        writable = problem.to_writable()
+        self.assertTrue(writable.P.flags.writeable)
+        self.assertTrue(writable.q.flags.writeable)
+        self.assertIs(writable.to_writable(), writable)
+
+    def test_manifest(self):
+        test_set = CustomParquetTestSet(self.path)
+        manifest = test_set.manifest()
+        self.assertEqual([info.name for info in manifest], ["foo", "bar"])
+        self.assertEqual(manifest[0].n, 3)
+        self.assertEqual(manifest[0].m_ineq, 2)
+        self.assertEqual(manifest[0].m_eq, 0)
+        self.assertEqual(manifest[0].nnz, 5)
+        self.assertEqual(manifest[1].m_eq, 1)
+        self.assertEqual(manifest[1].nnz, 4)
+        self.assertEqual(test_set.count_problems(), 2)
+
+        # The manifest is then read from its cache file
+        self.assertTrue(test_set.manifest_path.exists())
+        cached = CustomParquetTestSet(self.path).manifest()
+        self.assertEqual(cached, manifest)
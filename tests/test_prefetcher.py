@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Unit tests for the problem prefetcher."""
+
+import unittest
+
+from qpbenchmark.prefetcher import Prefetcher
+
+from .custom_problem import custom_problem
+
+
+class TestPrefetcher(unittest.TestCase):
+    def test_order(self):
+        names = [f"problem_{i}" for i in range(5)]
+        problems = (custom_problem(name=name) for name in names)
+        with Prefetcher(problems, nb_prefetch=2) as prefetcher:
+            with prefetcher.paused():
+                pass
+            self.assertEqual([p.name for p in prefetcher], names)
+
+    def test_exception(self):
+        def problems():
+            yield custom_problem(name="foo")
+            raise RuntimeError("cannot load problem")
+
+        with Prefetcher(problems(), nb_prefetch=1) as prefetcher:
+            iterator = iter(prefetcher)
+            self.assertEqual(next(iterator).name, "foo")
+            with self.assertRaises(RuntimeError):
+                next(iterator)
+
+    def test_invalid_nb_prefetch(self):
+        with self.assertRaises(ValueError):
+            Prefetcher([], nb_prefetch=0)
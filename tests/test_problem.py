@@ -11,8 +11,9 @@ import tempfile
 import unittest
 
 import numpy as np
+import scipy.sparse as spa
 
-from qpbenchmark.problem import Problem
+from qpbenchmark.problem import Problem, ensure_sparse
 
 
 class TestUtils(unittest.TestCase):
@@ -32,3 +33,109 @@ class TestUtils(unittest.TestCase):
         problem.save(fpath)
         loaded = Problem.load(fpath)
         self.assertEqual(loaded.name, "FOOBAR")
+
+    def test_conversion_cache(self):
+        problem = Problem(
+            P=np.eye(3),
+            q=np.zeros(3),
+            G=np.ones((1, 3)),
+            h=np.ones(1),
+            A=None,
+            b=None,
+            lb=None,
+            ub=None,
+            name="TEST",
+        )
+        sparse = problem.to_sparse()
+        self.assertIs(problem.to_sparse(), sparse)
+        self.assertIs(sparse.to_sparse(), sparse)
+        self.assertIs(problem.to_dense(), problem)
+        problem.clear_cache()
+        self.assertIsNot(problem.to_sparse(), sparse)
+
+    def test_native_layout(self):
+        problem = Problem(
+            P=np.eye(3),
+            q=np.zeros(3),
+            G=None,
+            h=None,
+            A=None,
+            b=None,
+            lb=None,
+            ub=None,
+            name="TEST",
+        )
+        sparse = problem.to_sparse(native_layout=True)
+        self.assertEqual(sparse.P.indices.dtype, np.int32)
+        self.assertEqual(sparse.P.indptr.dtype, np.int32)
+        dense = sparse.to_dense(native_layout=True)
+        self.assertTrue(dense.P.flags.f_contiguous)
+
+    def test_native_layout_unsorted_indices(self):
+        data = np.array([1.0, 2.0, 3.0])
+        data.flags.writeable = False  # e.g. a view on an Arrow buffer
+        indices = np.array([2, 0, 1], dtype=np.int64)
+        M = spa.csc_matrix(
+            (data, indices, np.array([0, 3], dtype=np.int64)), shape=(3, 1)
+        )
+        csc = ensure_sparse(M, native_layout=True)
+        self.assertTrue(csc.has_canonical_format)
+        self.assertEqual(list(csc.data), [2.0, 3.0, 1.0])
+        self.assertEqual(list(M.data), [1.0, 2.0, 3.0])
+        self.assertEqual(list(M.indices), [2, 0, 1])
+
+    def test_content_hash(self):
+        problem = Problem(
+            P=np.eye(3),
+            q=np.zeros(3),
+            G=None,
+            h=None,
+            A=None,
+            b=None,
+            lb=None,
+            ub=None,
+            name="TEST",
+        )
+        sparse = problem.to_sparse()
+        self.assertEqual(
+            sparse.get_content_hash(),
+            sparse.to_sparse(native_layout=True).get_content_hash(),
+        )
+        self.assertNotEqual(
+            problem.get_content_hash(), sparse.get_content_hash()
+        )
+        changed = Problem(
+            P=np.eye(3),
+            q=np.ones(3),
+            G=None,
+            h=None,
+            A=None,
+            b=None,
+            lb=None,
+            ub=None,
+            name="TEST",
+        )
+        self.assertNotEqual(
+            problem.get_content_hash(), changed.get_content_hash()
+        )
+
+    def test_writable_cache(self):
+        q = np.zeros(3)
+        q.flags.writeable = False  # e.g. a view on an Arrow buffer
+        problem = Problem(
+            P=np.eye(3),
+            q=q,
+            G=None,
+            h=None,
+            A=None,
+            b=None,
+            lb=None,
+            ub=None,
+            name="TEST",
+        )
+        writable = problem.to_writable()
+        self.assertIsNot(writable, problem)
+        self.assertTrue(writable.q.flags.writeable)
+        self.assertIs(problem.to_writable(), writable)
+        problem.clear_cache()
+        self.assertIsNot(problem.to_writable(), writable)
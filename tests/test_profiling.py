@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Unit tests for profiling solver calls."""
+
+import os
+import tempfile
+import time
+import unittest
+
+from qpbenchmark.profiling import (
+    SamplingProfiler,
+    is_wrapper_function,
+    profile_instance,
+)
+
+from .custom_problem import custom_problem
+
+
+def busy_wait(duration: float) -> None:
+    start_time = time.perf_counter()
+    while time.perf_counter() - start_time < duration:
+        pass
+
+
+class TestProfiling(unittest.TestCase):
+    def test_sampling_profiler(self):
+        with SamplingProfiler(interval=1e-3) as profiler:
+            busy_wait(0.1)
+        self.assertTrue(
+            any(stack.endswith(":busy_wait") for stack in profiler.stacks)
+        )
+        path = tempfile.mktemp(".collapsed")
+        profiler.write_collapsed(path)
+        with open(path, "r", encoding="utf-8") as fh:
+            stack, count = fh.readline().rsplit(" ", 1)
+        self.assertIn(";", stack)
+        self.assertGreater(int(count), 0)
+
+    def test_is_wrapper_function(self):
+        self.assertTrue(is_wrapper_function(("~", 0, "<built-in method len>")))
+        self.assertTrue(
+            is_wrapper_function(("~", 0, "<built-in method numpy.zeros>"))
+        )
+        self.assertTrue(is_wrapper_function((os.__file__, 1, "getenv")))
+        self.assertFalse(
+            is_wrapper_function(("/site-packages/osqp/interface.py", 1, "f"))
+        )
+
+    def test_profile_instance(self):
+        output_prefix = os.path.join(tempfile.mkdtemp(), "custom")
+        split = profile_instance(
+            custom_problem(name="custom"),
+            "daqp",  # listed in tox.ini
+            {},
+            output_prefix,
+            nb_calls=10,
+        )
+        self.assertTrue(os.path.exists(f"{output_prefix}.pstats"))
+        self.assertTrue(os.path.exists(f"{output_prefix}.collapsed"))
+        self.assertAlmostEqual(
+            split["wrapper"] + split["native"], split["total"]
+        )
+        self.assertGreater(split["native"], 0.0)
+        with self.assertRaises(ValueError):
+            profile_instance(
+                custom_problem(name="custom"), "daqp", {}, output_prefix, 0
+            )
@@ -6,6 +6,8 @@
 
 """Unit tests for report generation."""
 
+import json
+import tempfile
 import unittest
 
 from qpbenchmark import Report, Results
@@ -20,3 +22,13 @@ class TestReport(unittest.TestCase):
 
     def test_author(self):
         self.assertEqual(self.report.author, "foobar")
+
+    def test_run_metadata(self):
+        csv_path = tempfile.mktemp(".csv")
+        results = Results(file_path=csv_path, test_set=CustomTestSet())
+        with open(results.metadata_path, "w", encoding="utf-8") as fh:
+            json.dump({"solver_versions": {"foosolver": "1.2.3"}}, fh)
+        report = Report(author="foobar", results=results)
+        self.assertEqual(
+            report.run_metadata["solver_versions"]["foosolver"], "1.2.3"
+        )
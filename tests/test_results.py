@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Unit tests for test set results."""
+
+import tempfile
+import unittest
+
+import numpy as np
+import pandas
+import qpsolvers
+
+from qpbenchmark import Results
+from qpbenchmark.results import concat_results
+
+from .custom_problem import custom_problem
+from .custom_test_set import CustomTestSet
+
+
+class TestResults(unittest.TestCase):
+    def setUp(self):
+        self.problem = custom_problem(name="custom")
+        self.results = Results(file_path=None, test_set=CustomTestSet())
+
+    def test_update(self):
+        solution = qpsolvers.Solution(self.problem)
+        self.assertFalse(self.results.has(self.problem, "foo", "default"))
+        self.results.update(self.problem, "foo", "default", solution, 1.0)
+        self.assertTrue(self.results.has(self.problem, "foo", "default"))
+        self.assertFalse(self.results.has(self.problem, "bar", "default"))
+        self.assertEqual(self.results.nb_rows, 1)
+        self.assertEqual(len(self.results.df), 1)
+
+    def test_update_replaces_row(self):
+        solution = qpsolvers.Solution(self.problem)
+        self.results.update(self.problem, "foo", "default", solution, 1.0)
+        _ = self.results.df  # merge new rows into the data frame
+        self.results.update(self.problem, "foo", "default", solution, 20.0)
+        self.assertEqual(self.results.nb_rows, 1)
+        self.assertTrue(
+            self.results.is_timeout(self.problem, "foo", "default", 10.0)
+        )
+        df = self.results.df
+        self.assertEqual(len(df), 1)
+        self.assertAlmostEqual(df["runtime"].iat[0], 20.0)
+
+    def test_is_timeout(self):
+        solution = qpsolvers.Solution(self.problem)
+        self.results.update(self.problem, "foo", "default", solution, 1.0)
+        self.assertFalse(
+            self.results.is_timeout(self.problem, "foo", "default", 10.0)
+        )
+        self.assertTrue(
+            self.results.is_timeout(self.problem, "foo", "default", 1.0)
+        )
+
+    def test_rate_dfs(self):
+        not_found = qpsolvers.Solution(self.problem)
+        found = qpsolvers.Solution(self.problem)
+        found.found = True  # but without a primal solution
+        self.results.update(self.problem, "foo", "default", not_found, 1.0)
+        self.results.update(self.problem, "bar", "default", found, 1.0)
+        self.results.update(self.problem, "bar", "other", not_found, 1.0)
+        tolerances = {"default": 1.0, "other": 2.0}
+        success_rate_df = self.results.build_success_rate_df(
+            tolerances, tolerances, tolerances
+        )
+        correct_rate_df = self.results.build_correct_rate_df(
+            tolerances, tolerances, tolerances
+        )
+        self.assertEqual(list(success_rate_df.index), ["bar", "foo"])
+        self.assertEqual(list(success_rate_df.columns), ["default", "other"])
+        self.assertAlmostEqual(success_rate_df.at["foo", "default"], 0.0)
+        self.assertAlmostEqual(correct_rate_df.at["foo", "default"], 100.0)
+        self.assertAlmostEqual(correct_rate_df.at["bar", "default"], 0.0)
+        self.assertAlmostEqual(correct_rate_df.at["bar", "other"], 100.0)
+        self.assertTrue(np.isnan(correct_rate_df.at["foo", "other"]))
+
+    def test_shgeom_df(self):
+        not_found = qpsolvers.Solution(self.problem)
+        found = qpsolvers.Solution(self.problem)
+        found.found = True
+        self.results.update(self.problem, "foo", "default", found, 1.0)
+        self.results.update(self.problem, "bar", "default", not_found, 1.0)
+        shgeom_df = self.results.build_shgeom_df(
+            "runtime", shift=10.0, not_found_values={"default": 5.0}
+        )
+        self.assertAlmostEqual(shgeom_df.at["foo", "default"], 1.0)
+        self.assertAlmostEqual(shgeom_df.at["bar", "default"], 5.0)
+
+    def test_shgeom_df_nan(self):
+        found = qpsolvers.Solution(self.problem)
+        found.found = True
+        self.results.update(self.problem, "foo", "default", found, 1.0)
+        other = custom_problem(name="custom_again")
+        self.results.update(self.problem, "bar", "default", found, 1.0)
+        self.results.update(other, "bar", "default", found, np.nan)
+        shgeom_df = self.results.build_shgeom_df(
+            "runtime", shift=10.0, not_found_values={"default": 5.0}
+        )
+        self.assertTrue(np.isnan(shgeom_df.at["bar", "default"]))
+
+    def test_stale_inputs(self):
+        csv_path = tempfile.mktemp(".csv")
+        results = Results(file_path=csv_path, test_set=CustomTestSet())
+        solution = qpsolvers.Solution(self.problem)
+        inputs = {
+            "problem_hash": self.problem.get_content_hash(),
+            "solver_version": "0.10",
+            "settings_hash": "abc",
+        }
+        results.update(
+            self.problem, "foo", "default", solution, 1.0, inputs=inputs
+        )
+        results.write()
+        reloaded = Results(file_path=csv_path, test_set=CustomTestSet())
+        self.assertTrue(reloaded.has(self.problem, "foo", "default", inputs))
+        upgraded = {**inputs, "solver_version": "0.11"}
+        self.assertFalse(
+            reloaded.has(self.problem, "foo", "default", upgraded)
+        )
+        unknown = {**inputs, "solver_version": None}
+        self.assertTrue(reloaded.has(self.problem, "foo", "default", unknown))
+
+    def test_merge(self):
+        solution = qpsolvers.Solution(self.problem)
+        paths = [tempfile.mktemp(".csv") for _ in range(2)]
+        for path, runtime in zip(paths, (1.0, 2.0)):
+            shard = Results(file_path=path, test_set=CustomTestSet())
+            shard.update(self.problem, "foo", "default", solution, runtime)
+            shard.update(self.problem, f"bar{runtime}", "default", solution, 0)
+            shard.write()
+        self.results.merge(paths)
+        self.assertEqual(self.results.nb_rows, 3)
+        df = self.results.df.set_index("solver")
+        self.assertEqual(df.at["foo", "runtime"], 2.0)  # latest result
+
+    def test_categorical_columns(self):
+        solution = qpsolvers.Solution(self.problem)
+        path = tempfile.mktemp(".parquet")
+        results = Results(file_path=path, test_set=CustomTestSet())
+        results.update(self.problem, "foo", "default", solution, 1.0)
+        results.update(self.problem, "bar", "default", solution, 2.0)
+        results.write()
+        for df in (results.df, Results.read_results(path)):
+            for column in ("problem", "solver", "settings"):
+                self.assertIsInstance(
+                    df[column].dtype, pandas.CategoricalDtype
+                )
+            self.assertEqual(list(df["solver"].cat.categories), ["bar", "foo"])
+
+    def test_legacy_files(self):
+        legacy_df = pandas.DataFrame(  # columns before runtime statistics
+            {
+                "problem": ["custom"],
+                "solver": ["foo"],
+                "settings": ["default"],
+                "runtime": [1.0],
+                "found": [True],
+                "primal_residual": [0.0],
+                "dual_residual": [0.0],
+                "duality_gap": [0.0],
+            }
+        )
+        solution = qpsolvers.Solution(self.problem)
+        for suffix in (".csv", ".parquet"):
+            path = tempfile.mktemp(suffix)
+            if suffix == ".csv":
+                legacy_df.to_csv(path, index=False)
+            else:  # suffix == ".parquet"
+                legacy_df.to_parquet(path, index=False)
+            results = Results(file_path=path, test_set=CustomTestSet())
+            self.assertEqual(list(results.df.columns), list(Results.COLUMNS))
+            self.assertTrue(np.isnan(results.df["cpu_time"].iat[0]))
+            results.update(self.problem, "bar", "default", solution, 2.0)
+            results.write()
+            reloaded = Results(file_path=path, test_set=CustomTestSet())
+            reloaded.update(self.problem, "baz", "default", solution, 3.0)
+            reloaded.write()
+            df = Results.read_results(path)
+            self.assertEqual(list(df["solver"]), ["bar", "baz", "foo"])
+            self.assertEqual(
+                list(df["solver"].cat.categories), ["bar", "baz", "foo"]
+            )
+
+    def test_concat_results(self):
+        solution = qpsolvers.Solution(self.problem)
+        self.results.update(
+            self.problem, "foo", "default", solution, 1.0, {"cpu_time": 0.5}
+        )
+        without_stats = pandas.DataFrame(
+            {
+                "problem": ["custom"],
+                "solver": ["bar"],
+                "settings": ["default"],
+                "runtime": [2.0],
+                "found": [False],
+                "solver_version": [None],
+            }
+        )
+        df = concat_results([self.results.df, without_stats])
+        self.assertEqual(list(df.columns), list(Results.COLUMNS))
+        self.assertEqual(list(df["cpu_time"].isna()), [False, True])
+        self.assertEqual(list(df["solver"].cat.categories), ["bar", "foo"])
+        self.assertTrue(df["solver_version"].isna().all())
+        self.assertEqual(df["found"].dtype, bool)
+
+    def test_parquet_pushdown(self):
+        solution = qpsolvers.Solution(self.problem)
+        path = tempfile.mktemp(".parquet")
+        results = Results(file_path=path, test_set=CustomTestSet())
+        results.update(self.problem, "foo", "default", solution, 1.0)
+        results.update(self.problem, "bar", "default", solution, 1.0)
+        other_problem = custom_problem(name="other")
+        results.update(other_problem, "foo", "default", solution, 1.0)
+        results.write()
+
+        filtered = Results(path, test_set=CustomTestSet(), solvers=["foo"])
+        self.assertEqual(filtered.nb_rows, 1)
+        filtered.update(self.problem, "foo", "default", solution, 2.0)
+        filtered.write()
+
+        df = Results.read_results(path).set_index(["problem", "solver"])
+        self.assertEqual(len(df), 3)
+        self.assertEqual(df.at[("custom", "foo"), "runtime"], 2.0)
+        self.assertEqual(df.at[("other", "foo"), "runtime"], 1.0)
+
+    def test_parquet_pushdown_legacy_file(self):
+        path = tempfile.mktemp(".parquet")
+        pandas.DataFrame(  # columns before runtime statistics
+            {
+                "problem": ["custom", "custom"],
+                "solver": ["foo", "bar"],
+                "settings": ["default", "default"],
+                "runtime": [1.0, 1.0],
+                "found": [True, True],
+                "primal_residual": [0.0, 0.0],
+                "dual_residual": [0.0, 0.0],
+                "duality_gap": [0.0, 0.0],
+            }
+        ).to_parquet(path, index=False)
+        filtered = Results(path, test_set=CustomTestSet(), solvers=["foo"])
+        solution = qpsolvers.Solution(self.problem)
+        filtered.update(self.problem, "foo", "default", solution, 2.0)
+        filtered.write()
+
+        df = Results.read_results(path).set_index("solver")
+        self.assertEqual(df.at["foo", "runtime"], 2.0)
+        self.assertEqual(df.at["bar", "runtime"], 1.0)
+        self.assertTrue(np.isnan(df.at["bar", "cpu_time"]))
+
+    def test_sqlite(self):
+        sqlite_path = tempfile.mktemp(".sqlite")
+        results = Results(file_path=sqlite_path, test_set=CustomTestSet())
+        other = Results(file_path=sqlite_path, test_set=CustomTestSet())
+        self.assertIsNone(results.journal_path)
+        solution = qpsolvers.Solution(self.problem)
+        results.update(self.problem, "foo", "default", solution, 1.0)
+
+        # Updates are visible to other processes without a call to write()
+        self.assertTrue(other.has(self.problem, "foo", "default"))
+        self.assertFalse(other.is_timeout(self.problem, "foo", "default", 2.0))
+        reloaded = Results(file_path=sqlite_path, test_set=CustomTestSet())
+        self.assertEqual(reloaded.nb_rows, 1)
+        self.assertFalse(reloaded.df["found"].iat[0])
+
+        # Results can be exported to the other file formats
+        csv_path = tempfile.mktemp(".csv")
+        reloaded.write(csv_path)
+        exported = Results(file_path=csv_path, test_set=CustomTestSet())
+        self.assertTrue(exported.has(self.problem, "foo", "default"))
+
+    def test_journal_replay(self):
+        csv_path = tempfile.mktemp(".csv")
+        results = Results(file_path=csv_path, test_set=CustomTestSet())
+        solution = qpsolvers.Solution(self.problem)
+        results.update(self.problem, "foo", "default", solution, 1.0)
+        self.assertTrue(results.journal_path.exists())
+
+        # Results are recovered from the journal without a call to write()
+        replayed = Results(file_path=csv_path, test_set=CustomTestSet())
+        self.assertTrue(replayed.has(self.problem, "foo", "default"))
+
+        # Writing compacts the journal into the results file
+        replayed.write()
+        self.assertFalse(replayed.journal_path.exists())
+        reloaded = Results(file_path=csv_path, test_set=CustomTestSet())
+        self.assertTrue(reloaded.has(self.problem, "foo", "default"))
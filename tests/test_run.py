@@ -8,12 +8,15 @@
 
 import tempfile
 import unittest
+from unittest import mock
 
-from qpsolvers import SolverNotFound, available_solvers
+from qpsolvers import Solution, SolverNotFound, available_solvers
 
 import qpbenchmark
-from qpbenchmark import Results
+from qpbenchmark import Results, run_metadata, utils
+from qpbenchmark.run_metadata import read_run_metadata
 
+from .custom_problem import custom_problem
 from .custom_test_set import CustomTestSet
 
 
@@ -48,6 +51,187 @@ class TestRun(unittest.TestCase):
         )
         self.assertEqual(len(self.results.df), 1)
 
+    def test_runtime_breakdown(self):
+        qpbenchmark.run(
+            self.test_set,
+            self.results,
+            only_problem="custom",
+            only_settings="default",
+            only_solver="daqp",
+            rerun=False,
+            rerun_timeouts=False,
+        )
+        row = self.results.df.iloc[0]
+        self.assertGreaterEqual(row["solve_time"], 0.0)
+        self.assertLessEqual(
+            row["setup_time"] + row["solve_time"] + row["overhead_time"],
+            row["runtime"] + 1e-9,
+        )
+
+    def test_jobs(self):
+        qpbenchmark.run(
+            self.test_set,
+            self.results,
+            only_settings="default",
+            only_solver="daqp",
+            rerun=False,
+            rerun_timeouts=False,
+            jobs=2,
+        )
+        self.assertEqual(len(self.results.df), 2)
+        self.assertTrue(self.results.df["found"].all())
+
+    def test_jobs_long_first(self):
+        for name, runtime in (("custom", 1.0), ("custom_again", 1e-4)):
+            problem = custom_problem(name=name)
+            solution = Solution(problem)
+            self.results.update(problem, "daqp", "default", solution, runtime)
+        self.test_set.manifest()  # cached before counting loaded problems
+        loaded = []
+        test_set_iter = CustomTestSet.__iter__
+
+        def iter_and_count(test_set):
+            for problem in test_set_iter(test_set):
+                loaded.append(problem.name)
+                yield problem
+
+        with mock.patch.object(CustomTestSet, "__iter__", iter_and_count):
+            qpbenchmark.run(
+                self.test_set,
+                self.results,
+                only_settings="default",
+                only_solver="daqp",
+                rerun=True,
+                jobs=2,
+            )
+
+        # The first pass stops after the only problem with a long instance
+        self.assertEqual(loaded, ["custom", "custom", "custom_again"])
+
+    def test_isolate(self):
+        qpbenchmark.run(
+            self.test_set,
+            self.results,
+            only_problem="custom",
+            only_settings="default",
+            only_solver="daqp",
+            rerun=False,
+            rerun_timeouts=False,
+            isolate=True,
+        )
+        self.assertEqual(len(self.results.df), 1)
+        self.assertTrue(self.results.df["found"].all())
+
+    def test_repeated_timings(self):
+        qpbenchmark.run(
+            self.test_set,
+            self.results,
+            only_problem="custom",
+            only_settings="default",
+            only_solver="daqp",
+            rerun=False,
+            rerun_timeouts=False,
+            nb_warmups=1,
+            nb_timings=5,
+        )
+        row = self.results.df.iloc[0]
+        self.assertLessEqual(row["runtime_min"], row["runtime_median"])
+        self.assertAlmostEqual(row["runtime"], row["runtime_median"])
+        self.assertGreaterEqual(row["runtime_iqr"], 0.0)
+
+    def test_resource_usage(self):
+        qpbenchmark.run(
+            self.test_set,
+            self.results,
+            only_problem="custom",
+            only_settings="default",
+            only_solver="daqp",
+        )
+        row = self.results.df.iloc[0]
+        self.assertGreaterEqual(row["cpu_time"], 0.0)
+        self.assertAlmostEqual(
+            row["cpu_time"], row["cpu_user_time"] + row["cpu_system_time"]
+        )
+
+    def test_run_metadata(self):
+        probe = mock.Mock(wraps=utils.get_solver_versions)
+        with mock.patch.object(run_metadata, "get_solver_versions", probe):
+            with mock.patch.object(utils, "get_solver_versions", probe):
+                qpbenchmark.run(
+                    self.test_set,
+                    self.results,
+                    only_problem="custom",
+                    only_settings="default",
+                    only_solver="daqp",
+                )
+        self.assertEqual(probe.call_count, 1)  # versions probed once
+        metadata = read_run_metadata(self.results.metadata_path)
+        self.assertIn("daqp", metadata["solver_versions"])
+        self.assertIn("brand_raw", metadata["host"]["cpu_info"])
+        self.assertEqual(
+            self.results.df["solver_version"].iloc[0],
+            metadata["solver_versions"]["daqp"],
+        )
+
+    def test_rerun_stale_settings(self):
+        kwargs = {
+            "only_problem": "custom",
+            "only_settings": "default",
+            "only_solver": "daqp",
+        }
+        qpbenchmark.run(self.test_set, self.results, **kwargs)
+        runtime = self.results.df["runtime"].iat[0]
+        qpbenchmark.run(self.test_set, self.results, **kwargs)
+        self.assertEqual(self.results.df["runtime"].iat[0], runtime)
+        settings_hash = self.results.df["settings_hash"].iat[0]
+        self.test_set.solver_settings["default"].set_param(
+            "daqp", "iter_limit", 1000
+        )
+        qpbenchmark.run(self.test_set, self.results, **kwargs)
+        self.assertEqual(len(self.results.df), 1)
+        self.assertNotEqual(
+            self.results.df["settings_hash"].iat[0], settings_hash
+        )
+
+    def test_shards(self):
+        for i in range(2):
+            qpbenchmark.run(
+                self.test_set,
+                self.results,
+                only_settings="default",
+                only_solver="daqp",
+                shard=(i, 2),
+            )
+            self.assertEqual(len(self.results.df), i + 1)
+
+    def test_work_queue(self):
+        work_queue = tempfile.mkdtemp()
+        kwargs = {"only_settings": "default", "only_solver": "daqp"}
+        qpbenchmark.run(
+            self.test_set, self.results, work_queue=work_queue, **kwargs
+        )
+        other_results = Results(file_path=None, test_set=self.test_set)
+        qpbenchmark.run(
+            self.test_set, other_results, work_queue=work_queue, **kwargs
+        )
+        self.assertEqual(len(self.results.df), 2)
+        self.assertEqual(len(other_results.df), 0)
+
+    def test_prefetch(self):
+        qpbenchmark.run(
+            self.test_set,
+            self.results,
+            only_settings="default",
+            only_solver="daqp",
+            prefetch=2,
+            strict_timing=True,
+        )
+        self.assertEqual(len(self.results.df), self.test_set.count_problems())
+
+    def test_invalid_jobs(self):
+        with self.assertRaises(ValueError):
+            qpbenchmark.run(self.test_set, self.results, jobs=0)
+
     def test_settings_not_found(self):
         with self.assertRaises(ValueError):
             qpbenchmark.run(
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Unit tests for sharded benchmark runs."""
+
+import tempfile
+import unittest
+
+from qpbenchmark.problem_info import ProblemInfo
+from qpbenchmark.sharding import WorkQueue, get_shard_problems, parse_shard
+
+
+class TestSharding(unittest.TestCase):
+    def test_parse_shard(self):
+        self.assertEqual(parse_shard("1/4"), (1, 4))
+        for value in ("4/4", "-1/4", "1", "a/b"):
+            with self.assertRaises(ValueError):
+                parse_shard(value)
+
+    def test_shard_partition(self):
+        manifest = [
+            ProblemInfo(name=f"problem_{i}", n=i + 1, m_eq=0, m_ineq=0, nnz=0)
+            for i in range(10)
+        ]
+        shards = [get_shard_problems(manifest, i, 3) for i in range(3)]
+        self.assertEqual(set.union(*shards), {info.name for info in manifest})
+        self.assertEqual(sum(len(shard) for shard in shards), len(manifest))
+
+    def test_work_queue(self):
+        path = tempfile.mkdtemp()
+        queue, other_queue = WorkQueue(path), WorkQueue(path)
+        self.assertTrue(queue.claim("foo"))
+        self.assertTrue(queue.claim("foo"))  # already ours
+        self.assertFalse(other_queue.claim("foo"))
+        self.assertTrue(other_queue.claim("bar"))
+        queue.complete()
+        self.assertFalse(WorkQueue(path).claim("foo"))
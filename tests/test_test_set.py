@@ -16,6 +16,16 @@ class TestTestSet(unittest.TestCase):
     def setUp(self):
         self.test_set = CustomTestSet()
 
+    def test_manifest(self):
+        manifest = self.test_set.manifest()
+        self.assertEqual(
+            [info.name for info in manifest], ["custom", "custom_again"]
+        )
+        self.assertEqual(manifest[0].n, 3)
+        self.assertEqual(manifest[0].nnz, 3)
+        self.assertEqual(self.test_set.count_problems(), 2)
+        self.assertIs(self.test_set.manifest(), manifest)  # cached
+
     def test_skip_solver_issue(self):
         foo = custom_problem(name="foo")
         self.test_set.known_solver_issues.add(("foo", "bar"))
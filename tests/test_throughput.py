@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Unit tests for throughput measurements on QP sequences."""
+
+import unittest
+
+import numpy as np
+from qpsolvers import SolverNotFound
+
+import qpbenchmark
+from qpbenchmark.throughput import measure_throughput, solve_sequence
+
+
+def sequence_problem(name: str, step: int) -> qpbenchmark.Problem:
+    return qpbenchmark.Problem(
+        P=np.eye(3),
+        q=np.full(3, 1.0 + 0.1 * step),
+        G=np.eye(3),
+        h=np.ones(3),
+        A=None,
+        b=None,
+        lb=None,
+        ub=None,
+        name=f"{name}_{step}",
+    )
+
+
+class CustomSequenceTestSet(qpbenchmark.SequenceTestSet):
+    description = "Unit test sequence test set"
+    sparse_only = False
+    title = "Unit test sequence test set"
+
+    def sequences(self):
+        for name in ("first", "second"):
+            yield name, (sequence_problem(name, step) for step in range(5))
+
+
+class TestThroughput(unittest.TestCase):
+    def setUp(self):
+        self.test_set = CustomSequenceTestSet()
+
+    def test_iter(self):
+        names = [problem.name for problem in self.test_set]
+        self.assertEqual(len(names), 10)
+        self.assertEqual(names[5], "second_0")
+
+    def test_solve_sequence(self):
+        problems = [sequence_problem("first", step) for step in range(3)]
+        for warm_start in (False, True):
+            latencies, nb_found = solve_sequence(
+                problems, "daqp", {}, warm_start=warm_start
+            )
+            self.assertEqual(len(latencies), 3)
+            self.assertEqual(nb_found, 3)
+
+    def test_measure_throughput(self):
+        df = measure_throughput(self.test_set, "default", solvers=["daqp"])
+        self.assertEqual(list(df["solver"]), ["daqp"])
+        row = df.iloc[0]
+        self.assertEqual(row["solves"], 10)
+        self.assertAlmostEqual(row["success_rate"], 100.0)
+        self.assertGreater(row["solves_per_second"], 0.0)
+        self.assertLessEqual(row["latency_median"], row["latency_p99"])
+        with self.assertRaises(ValueError):
+            measure_throughput(self.test_set, "unknown", solvers=["daqp"])
+        with self.assertRaises(SolverNotFound):
+            measure_throughput(self.test_set, "default", solvers=["unknown"])
@@ -23,5 +23,6 @@ class TestTolerance(unittest.TestCase):
         self.assertAlmostEqual(tolerance.from_metric("dual_residual"), 2.0)
         self.assertAlmostEqual(tolerance.from_metric("duality_gap"), 3.0)
         self.assertAlmostEqual(tolerance.from_metric("runtime"), 4.0)
+        self.assertAlmostEqual(tolerance.from_metric("runtime_median"), 4.0)
         with self.assertRaises(BenchmarkError):
             tolerance.from_metric("foo")
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Inria
+
+"""Unit tests for utility functions."""
+
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+import qpsolvers
+
+from qpbenchmark.utils import get_runtime_breakdown
+
+from .custom_problem import custom_problem
+
+
+class TestUtils(unittest.TestCase):
+    def setUp(self):
+        self.solution = qpsolvers.Solution(custom_problem(name="custom"))
+
+    def test_reported_times(self):
+        self.solution.extras = {
+            "info": SimpleNamespace(setup_time=1e-3, solve_time=2e-3)
+        }
+        breakdown = get_runtime_breakdown(self.solution, "osqp", 1e-2)
+        self.assertAlmostEqual(breakdown["setup_time"], 1e-3)
+        self.assertAlmostEqual(breakdown["solve_time"], 2e-3)
+        self.assertAlmostEqual(breakdown["overhead_time"], 7e-3)
+
+    def test_reported_times_units(self):
+        self.solution.extras = {"setup_time": 1.0, "solve_time": 2.0}  # ms
+        breakdown = get_runtime_breakdown(self.solution, "scs", 1e-2)
+        self.assertAlmostEqual(breakdown["solve_time"], 2e-3)
+
+    def test_unknown_times(self):
+        self.solution.build_time = None
+        self.solution.solve_time = None
+        breakdown = get_runtime_breakdown(self.solution, "foo", 1e-2)
+        self.assertTrue(np.isnan(breakdown["solve_time"]))
+        self.assertTrue(np.isnan(breakdown["overhead_time"]))